@@ -0,0 +1,336 @@
+"""
+ASGI server for EdgeVerve AI Brief Generator
+Serves the same routes as api_server.py, but handlers await the orchestrator directly
+on the worker's event loop instead of spinning up a new loop per request.
+
+Run with:
+    python asgi_server.py
+or:
+    uvicorn asgi_server:app --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from agentic_brief_enhanced import HackathonDemo, build_inputs
+from brief_formatter import BriefFormatter, build_brief_response
+from brief_store import RESEARCH_CACHE_CONTROL, BriefStore
+from codec import encode
+from config import (GEMINI_API_KEY, SERPER_API_KEY, HOST, PORT, ASGI_WORKERS, WARMUP_ON_START,
+                    PREVIEW_MAX_AGE, COMPRESSION_MIN_SIZE, BRIEF_STORE_PATH, SIMILARITY_REUSE)
+from deadline import DEADLINE_HEADER, Deadline
+from http_cache import StaticPayload, conditional_response
+from metrics import CONTENT_TYPE, registry
+from models import BriefPage, BriefSearchResults, SimilarBriefs
+from preview_data import build_preview_payload
+from profiles import get_profile
+from similar_briefs import SimilarBriefIndex
+from warmup import readiness, start_background_warmup
+
+# Static responses - serialized and compressed once at import
+PREVIEW_RESPONSE = StaticPayload(build_preview_payload(), max_age=PREVIEW_MAX_AGE)
+
+# Generated briefs, stored serialized with their ETag so re-fetches can be answered with 304
+brief_store = BriefStore(BRIEF_STORE_PATH)
+
+# Stored briefs by stakeholder inputs, for reusing near-duplicates instead of generating again
+similar_briefs = SimilarBriefIndex(brief_store)
+
+
+def send_static(request, payload: StaticPayload) -> Response:
+    """Serves a pre-serialized payload, answering 304 when the client's ETag is current"""
+    status, body, headers = payload.respond(
+        request.headers.get('if-none-match'),
+        request.headers.get('accept-encoding')
+    )
+    return Response(body, status_code=status, headers=headers, media_type='application/json')
+
+
+def send_brief(request, body: bytes, etag: str, brief_id: str) -> Response:
+    """Serves a stored brief body with its ETag, compressed or as a 304"""
+    status, body, headers = conditional_response(
+        body,
+        etag,
+        request.headers.get('if-none-match'),
+        request.headers.get('accept-encoding'),
+        COMPRESSION_MIN_SIZE
+    )
+    headers['Cache-Control'] = 'private, no-cache'
+    headers['Location'] = f'/briefs/{brief_id}'
+    return Response(body, status_code=status, headers=headers, media_type='application/json')
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Sets up per-worker state; the demo (and the Gemini SDK) is built on first use"""
+    app.state.demo = None
+    app.state.demo_lock = asyncio.Lock()
+    app.state.formatter = BriefFormatter()
+    
+    if WARMUP_ON_START:
+        # Warm up in a thread while the worker already answers /health and /ready
+        loop = asyncio.get_running_loop()
+        
+        def run_async(coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+        
+        start_background_warmup(lambda: run_async(get_demo(app)), run_async)
+    yield
+
+
+async def get_demo(app) -> HackathonDemo:
+    """Shared demo instance, built once per worker off the event loop"""
+    if app.state.demo is None:
+        async with app.state.demo_lock:
+            if app.state.demo is None:
+                app.state.demo = await asyncio.to_thread(HackathonDemo, GEMINI_API_KEY, SERPER_API_KEY)
+    return app.state.demo
+
+
+async def generate_brief(request):
+    """Endpoint to generate creative brief"""
+
+    # The whole pipeline must answer within this (client's X-Request-Timeout or config)
+    deadline = Deadline.from_header(request.headers.get(DEADLINE_HEADER))
+
+    # Get request data (optional parameters)
+    try:
+        request_data = await request.json()
+    except ValueError:
+        request_data = None
+    options = request_data if isinstance(request_data, dict) else {}
+    try:
+        profile = get_profile(options.get("profile"))
+        inputs = build_inputs(options.get("inputs"))
+    except ValueError as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }, status_code=400)
+
+    try:
+        # A stored brief from near-identical inputs answers instantly (index catch-up reads SQLite)
+        if options.get("reuse", SIMILARITY_REUSE):
+            cached = await asyncio.to_thread(similar_briefs.cached, inputs, profile.name)
+            if cached is not None:
+                match, body, etag = cached
+                print(f"♻️ Reusing brief {match.brief_id} (similarity {match.similarity})")
+                response = send_brief(request, body, etag, match.brief_id)
+                response.headers['X-Brief-Similarity'] = str(match.similarity)
+                return response
+
+        print(f"🚀 Generating EdgeVerve AI Platform Brief via ASGI API ({profile.name} profile)...")
+
+        # Awaited on the worker's shared loop - no per-request loop setup/teardown
+        demo = await get_demo(request.app)
+        result = await demo.run_demo(deadline, profile, inputs)
+
+        response = build_brief_response(result, request.app.state.formatter)
+        # SQLite write (and fsync) off the event loop
+        brief_id, body, etag = await asyncio.to_thread(brief_store.put, response, result)
+
+        return send_brief(request, body, etag, brief_id)
+
+    except Exception as e:
+        print(f"Error generating brief: {str(e)}")
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }, status_code=500)
+
+
+async def list_briefs(request):
+    """Lists stored briefs, newest first (?limit=, ?cursor=, ?company=, ?industry=)"""
+    try:
+        briefs, next_cursor = await asyncio.to_thread(
+            brief_store.list,
+            limit=int(request.query_params.get('limit', 20)),
+            cursor=request.query_params.get('cursor'),
+            company=request.query_params.get('company'),
+            industry=request.query_params.get('industry')
+        )
+    except ValueError as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }, status_code=400)
+
+    page = BriefPage(success=True, briefs=tuple(briefs), next_cursor=next_cursor)
+    return Response(encode(page), media_type='application/json')
+
+
+async def search_briefs(request):
+    """Full-text search over stored briefs, best match first (?q=, ?limit=, ?company=, ?industry=)"""
+    query = request.query_params.get('q', '')
+    try:
+        hits = await asyncio.to_thread(
+            brief_store.search,
+            query,
+            limit=int(request.query_params.get('limit', 20)),
+            company=request.query_params.get('company'),
+            industry=request.query_params.get('industry')
+        )
+    except ValueError as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }, status_code=400)
+
+    results = BriefSearchResults(success=True, query=query, hits=tuple(hits))
+    return Response(encode(results), media_type='application/json')
+
+
+async def find_similar_briefs(request):
+    """Stored briefs generated from inputs similar to the posted ones ({"inputs", "profile", "limit", "threshold"})"""
+    try:
+        request_data = await request.json()
+    except ValueError:
+        request_data = None
+    options = request_data if isinstance(request_data, dict) else {}
+    try:
+        inputs = build_inputs(options.get("inputs"))
+        profile = get_profile(options["profile"]).name if options.get("profile") else None
+        threshold = float(options.get("threshold", similar_briefs.threshold))
+        hits = await asyncio.to_thread(similar_briefs.find, inputs, profile,
+                                       limit=int(options.get("limit", 5)), threshold=threshold)
+    except (TypeError, ValueError) as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }, status_code=400)
+
+    return Response(encode(SimilarBriefs(success=True, threshold=threshold, hits=tuple(hits))),
+                    media_type='application/json')
+
+
+async def get_brief(request):
+    """Returns a previously generated brief (304 when the client's ETag is current)"""
+    brief_id = request.path_params['brief_id']
+    entry = await asyncio.to_thread(brief_store.get, brief_id)
+    if entry is None:
+        return JSONResponse({
+            "success": False,
+            "error": f"Brief {brief_id} not found",
+            "timestamp": datetime.now().isoformat()
+        }, status_code=404)
+
+    body, etag = entry
+    return send_brief(request, body, etag, brief_id)
+
+
+async def delete_brief(request):
+    """Deletes a stored brief"""
+    brief_id = request.path_params['brief_id']
+    deleted = await asyncio.to_thread(brief_store.delete, brief_id)
+    similar_briefs.discard(brief_id)
+    if not deleted:
+        return JSONResponse({
+            "success": False,
+            "error": f"Brief {brief_id} not found",
+            "timestamp": datetime.now().isoformat()
+        }, status_code=404)
+
+    return JSONResponse({"success": True, "brief_id": brief_id}, status_code=200)
+
+
+async def get_research(request):
+    """Returns a research bundle by content hash (immutable - clients can cache it for good)"""
+    research_hash = request.path_params['research_hash']
+    body = await asyncio.to_thread(brief_store.get_research, research_hash)
+    if body is None:
+        return JSONResponse({
+            "success": False,
+            "error": f"Research bundle {research_hash} not found",
+            "timestamp": datetime.now().isoformat()
+        }, status_code=404)
+
+    status, body, headers = conditional_response(
+        body,
+        f'"{research_hash}"',
+        request.headers.get('if-none-match'),
+        request.headers.get('accept-encoding'),
+        COMPRESSION_MIN_SIZE
+    )
+    headers['Cache-Control'] = RESEARCH_CACHE_CONTROL
+    return Response(body, status_code=status, headers=headers, media_type='application/json')
+
+
+async def health_check(request):
+    """Health check endpoint"""
+    return JSONResponse({
+        "status": "healthy",
+        "service": "EdgeVerve AI Brief Generator",
+        "timestamp": datetime.now().isoformat()
+    }, status_code=200)
+
+
+async def ready_check(request):
+    """Readiness endpoint - 503 until the worker has finished warming up"""
+    status, payload = readiness.status()
+    return JSONResponse(payload, status_code=status)
+
+
+async def metrics(request):
+    """Prometheus metrics for this worker (upstream latency, hedge rate, wins and latency saved)"""
+    return Response(registry.render(), headers={'Content-Type': CONTENT_TYPE})
+
+
+async def brief_preview(request):
+    """Preview endpoint that returns sample formatted sections in the required order"""
+    return send_static(request, PREVIEW_RESPONSE)
+
+
+app = Starlette(
+    routes=[
+        Route('/generate-brief', generate_brief, methods=['POST']),
+        Route('/briefs', list_briefs, methods=['GET']),
+        # Before /briefs/{brief_id}, which would otherwise match "search" and "similar"
+        Route('/briefs/search', search_briefs, methods=['GET']),
+        Route('/briefs/similar', find_similar_briefs, methods=['POST']),
+        Route('/briefs/{brief_id}', get_brief, methods=['GET']),
+        Route('/briefs/{brief_id}', delete_brief, methods=['DELETE']),
+        Route('/research/{research_hash}', get_research, methods=['GET']),
+        Route('/health', health_check, methods=['GET']),
+        Route('/ready', ready_check, methods=['GET']),
+        Route('/metrics', metrics, methods=['GET']),
+        Route('/brief-preview', brief_preview, methods=['GET']),
+    ],
+    middleware=[
+        # Enable CORS for all routes
+        Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])
+    ],
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("🚀 Starting EdgeVerve AI Brief Generator ASGI Server...")
+    print(f"⚙️  Workers: {ASGI_WORKERS}")
+    print("📍 Available endpoints:")
+    print("   POST /generate-brief - Generate full creative brief")
+    print("   GET  /briefs         - List stored briefs")
+    print("   GET  /briefs/search  - Full-text search over stored briefs")
+    print("   POST /briefs/similar - Stored briefs from similar inputs")
+    print("   GET  /briefs/<id>    - Re-fetch a generated brief")
+    print("   DELETE /briefs/<id>  - Delete a stored brief")
+    print("   GET  /research/<hash> - Research bundle a brief was generated from")
+    print("   GET  /brief-preview  - Get sample formatted sections")
+    print("   GET  /health        - Health check")
+    print("   GET  /ready         - Readiness (warm-up finished)")
+    print("   GET  /metrics       - Prometheus metrics")
+    print("=" * 50)
+
+    uvicorn.run("asgi_server:app", host=HOST, port=PORT, workers=ASGI_WORKERS)
@@ -0,0 +1,86 @@
+"""
+Persistent background event loop for the Flask (WSGI) server
+One long-lived loop runs in a daemon thread per worker process, so async clients,
+connection pools and cached coroutine resources survive between requests.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Optional
+
+
+class BackgroundEventLoop:
+    """Runs an asyncio event loop in a dedicated thread and accepts coroutines from any thread"""
+
+    def __init__(self, name: str = "brief-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the running loop, starting it on first use"""
+        self._ensure_started()
+        return self._loop
+
+    def _ensure_started(self):
+        """Starts the loop thread once per process (re-starts after a fork)"""
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+
+            # A forked worker inherits the parent's loop object but not its thread
+            self._loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                args=(self._loop, ready),
+                name=self.name,
+                daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+            self._pid = os.getpid()
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        """Thread target: owns the loop for the life of the process"""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedules a coroutine on the background loop (thread-safe)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Submits a coroutine and blocks the calling thread until it finishes"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5.0):
+        """Stops the loop and joins its thread"""
+        with self._lock:
+            if self._loop is None or self._thread is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=timeout)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            self._pid = None
+
+
+# Process-wide loop shared by all WSGI handlers
+background_loop = BackgroundEventLoop()
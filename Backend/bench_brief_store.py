@@ -0,0 +1,98 @@
+"""
+Benchmark: brief store reads and full-text search at scale
+
+Fills a temporary SQLite store with synthetic briefs (the real 17-section response with
+varied topics, companies and industries), then times indexed fetches, paginated listing
+and FTS5 searches.
+
+Run with:
+    python bench_brief_store.py [number of briefs, default 20000]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import replace
+
+from bench_models import build_research, build_response
+from brief_store import BriefStore
+from models import ResearchBundle
+
+TOPICS = ["federated learning", "AI governance", "MLOps", "generative AI", "responsible AI", "data readiness",
+          "cloud-agnostic deployment", "model flexibility", "process automation", "document intelligence"]
+AUDIENCES = ["CIOs", "CTOs", "heads of data", "CFOs", "COOs"]
+COMPANIES = [f"Company {i}" for i in range(200)]
+INDUSTRIES = ["enterprise_ai", "healthcare", "financial_services", "manufacturing", "retail"]
+
+QUERIES = ["federated learning CIOs", "\"AI governance\"", "MLOps healthcare", "responsible", "quantum"]
+
+
+def synthetic_brief(base_response, research: dict, rng: random.Random):
+    topic, audience = rng.choice(TOPICS), rng.choice(AUDIENCES)
+    sections = tuple(
+        replace(section, content=f"{section.content}<br><strong>Focus:</strong> {topic} for {audience}")
+        for section in base_response.sections
+    )
+    inputs = {
+        "company_name": rng.choice(COMPANIES),
+        "industry": rng.choice(INDUSTRIES),
+        "target_audience": audience,
+        "key_message": f"Scale {topic} across the enterprise",
+    }
+    result = {
+        "brief_content": "",
+        "research_data": research,
+        "research_bundle": ResearchBundle.from_dict(research),
+        "generation_metadata": {"stakeholder_inputs": inputs, "research_time_seconds": 0.4,
+                                "generation_seconds": 12.0, "token_usage": {}},
+    }
+    return replace(base_response, sections=sections), result
+
+
+def timed(func, repeat: int = 50) -> tuple:
+    """(median ms, p99 ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[min(int(len(samples) * 0.99), len(samples) - 1)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    research = asyncio.run(build_research())
+    base_response = build_response(research)
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BriefStore(os.path.join(tmp, "briefs.db"))
+
+        start = time.perf_counter()
+        ids = [store.put(*synthetic_brief(base_response, research, rng))[0] for _ in range(count)]
+        elapsed = time.perf_counter() - start
+        print(f"💾 Stored {count} briefs in {elapsed:.1f} s ({elapsed / count * 1000:.2f} ms each)")
+        print(f"📦 Database size: {os.path.getsize(os.path.join(tmp, 'briefs.db')) / 2**20:.1f} MiB")
+
+        rows = [
+            ("fetch by id             ", lambda: store.get(rng.choice(ids))),
+            ("list newest page        ", lambda: store.list(limit=20)),
+            ("list by company         ", lambda: store.list(limit=20, company=rng.choice(COMPANIES))),
+        ]
+        rows += [(f"search {query!r:<18}", lambda q=query: store.search(q, limit=20)) for query in QUERIES]
+        rows.append(("search + industry filter", lambda: store.search("federated learning", industry="healthcare")))
+
+        for label, func in rows:
+            median, p99 = timed(func)
+            print(f"📊 {label} median {median:7.2f} ms   p99 {p99:7.2f} ms")
+
+        hit = store.search("federated learning CIOs", limit=1)[0]
+        print(f"\n🔎 Top hit: {hit.company} ({hit.industry}) score {hit.score}\n   {hit.snippet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: competitor pricing and positioning analytics as the competitor list grows
+
+Generates competitors with realistic price strings (ranges, open-ended amounts, monthly and
+annual prices, model-only descriptions) and focus/description text, then times the pricing and
+positioning analyses for 5 to 5000 competitors.
+
+Run with:
+    python bench_competitor_analytics.py
+"""
+
+import random
+
+from bench_brief_store import timed
+from competitor_analytics import analyze_pricing, analyze_positioning
+
+PRICES = ["$100K+ annually", "$2M+ annually", "Pay-per-use", "Custom enterprise", "Subscription",
+          "Per-user subscription", "Per-robot licensing", "Percentage of GMV", "Bundled with EHR",
+          "Free to $149/month", "Volume-based", "Usage-based"]
+WORDS = ("automation analytics governance cloud data platform document workflow fraud risk supply chain "
+         "personalization search predictive maintenance clinical engagement underwriting integration").split()
+
+
+def competitor(rng: random.Random, i: int) -> dict:
+    if rng.random() < 0.5:
+        low = rng.choice([29, 49, 99, 499]) if rng.random() < 0.5 else rng.choice([20, 50, 100, 250, 500])
+        price = f"${low}-{low * 2}/month" if low < 1000 and rng.random() < 0.5 else f"${low}K+ annually"
+    else:
+        price = rng.choice(PRICES)
+    return {
+        "name": f"Competitor {i}",
+        "pricing": price,
+        "focus": " ".join(rng.sample(WORDS, 3)),
+        "description": " ".join(rng.sample(WORDS, 8)),
+    }
+
+
+def main():
+    rng = random.Random(7)
+    for count in (5, 50, 500, 5000):
+        competitors = [competitor(rng, i) for i in range(count)]
+        pricing_median, pricing_p99 = timed(lambda: analyze_pricing(competitors), repeat=100)
+        positioning_median, positioning_p99 = timed(lambda: analyze_positioning(competitors), repeat=100)
+        print(f"📊 {count:5d} competitors   pricing median {pricing_median:6.2f} ms p99 {pricing_p99:6.2f} ms   "
+              f"positioning median {positioning_median:6.2f} ms p99 {positioning_p99:6.2f} ms")
+
+    result = analyze_pricing(competitors)
+    print(f"\n💰 {result['price_range']} - {result['recommendation']}")
+    print(f"🏷️ Tiers: {[tier['range'] for tier in result['price_tiers']]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: competitor knowledge base lookups at scale
+
+Writes a synthetic data file with thousands of industries (each with aliases and several
+company types), loads it into a temporary knowledge base and times exact, synonym and fuzzy
+lookups.
+
+Run with:
+    python bench_competitor_kb.py [number of industries, default 5000]
+"""
+
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+from bench_brief_store import timed
+from competitor_kb import CompetitorKnowledgeBase
+
+COMPANY_TYPES = ["ai_platform", "software", "services", "hardware"]
+
+
+def synthetic_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+
+
+def build_seed(count: int, rng: random.Random) -> dict:
+    industries = {}
+    for _ in range(count):
+        name = f"{synthetic_word(rng)}_{synthetic_word(rng)}"
+        industries[name] = {
+            "aliases": [f"{synthetic_word(rng)} {synthetic_word(rng)}" for _ in range(3)],
+            "company_types": {
+                company_type: [{"name": f"{synthetic_word(rng).title()} Inc", "pricing": "Custom",
+                                "focus": synthetic_word(rng)} for _ in range(5)]
+                for company_type in rng.sample(COMPANY_TYPES, 3)
+            },
+        }
+    return {"default": [{"name": "Generic Co", "pricing": "Custom", "focus": "Everything"}], "industries": industries}
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + word[i + 1:]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(7)
+    seed = build_seed(count, rng)
+    names = list(seed["industries"])
+    aliases = [alias for entry in seed["industries"].values() for alias in entry["aliases"]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed_path = os.path.join(tmp, "competitors.json")
+        with open(seed_path, "w") as f:
+            json.dump(seed, f)
+
+        kb = CompetitorKnowledgeBase(os.path.join(tmp, "competitors.db"), seed_path)
+        start = time.perf_counter()
+        kb.resolve_industry(names[0])
+        print(f"📚 Loaded {count} industries ({len(aliases)} aliases) in {time.perf_counter() - start:.2f} s, "
+              f"{os.path.getsize(os.path.join(tmp, 'competitors.db')) / 2**20:.1f} MiB on disk")
+
+        rows = [
+            ("exact industry + type ", lambda: kb.competitors(rng.choice(names), "ai_platform")),
+            ("synonym               ", lambda: kb.competitors(rng.choice(aliases), "software")),
+            ("fuzzy (first time)    ", lambda: kb.competitors(typo(rng.choice(names), rng), "services")),
+            ("fuzzy (repeated)      ", lambda: kb.competitors(typo(names[0], random.Random(1)), "services")),
+            ("unknown -> default    ", lambda: kb.competitors("zz", "ai_platform")),
+        ]
+        for label, func in rows:
+            median, p99 = timed(func, repeat=500)
+            print(f"📊 {label} median {median:7.3f} ms   p99 {p99:7.3f} ms")
+
+        sample = rng.sample(names, 200)
+        resolved = sum(kb.resolve_industry(typo(name, rng)) == name for name in sample)
+        print(f"\n🔎 Single-typo industry names resolved correctly: {resolved}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
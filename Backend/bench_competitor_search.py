@@ -0,0 +1,60 @@
+"""
+Benchmark: competitor search fan-out against a simulated Serper
+
+Each simulated query answers after 150-450 ms with ten organic results drawn from a shared pool
+of competitor sites (plus directory and listicle pages), so different phrasings overlap the way
+real searches do. Times sequential search (counting distinct result links), the concurrent fan-out
+without early exit and the fan-out with early exit, for 4 to 24 queries.
+
+Run with:
+    python bench_competitor_search.py
+"""
+
+import asyncio
+import random
+import time
+
+from competitor_search import expand_queries, fan_out
+
+POOL = [{"title": f"Vendor{i} - Enterprise AI Platform", "link": f"https://www.vendor{i}.com/product",
+         "snippet": f"Vendor{i} builds AI for the enterprise"} for i in range(40)]
+POOL += [{"title": "Top 10 AI Platforms in 2026", "link": "https://www.techblog.com/top-ai"},
+         {"title": "Best AI platforms - reviews", "link": "https://www.g2.com/categories/ai"}]
+
+
+def simulated_fetch(rng: random.Random):
+    async def fetch(payload):
+        await asyncio.sleep(rng.uniform(0.15, 0.45))
+        # Overlapping results: popular vendors rank for most phrasings
+        return {"organic": rng.sample(POOL[:15], 6) + rng.sample(POOL[15:], 4)}
+    return fetch
+
+
+async def sequential(payloads, fetch):
+    found = {}
+    for payload in payloads:
+        for result in (await fetch(payload))["organic"]:
+            found.setdefault(result["link"], result)
+    return list(found.values())
+
+
+async def main():
+    templates = ["top {company_type} companies {industry} {year}", "leading {industry} {company_type} vendors",
+                 "{industry} {company_type} alternatives", "best {company_type} software for {industry}"]
+    for pages, regions in ((1, ["us"]), (2, ["us", "gb"]), (3, ["us", "gb"])):
+        payloads = expand_queries("enterprise_ai", "ai_platform", templates, pages, regions)
+        rng = random.Random(7)
+        timings = []
+        for label, run in (
+            ("sequential         ", lambda: sequential(payloads, simulated_fetch(rng))),
+            ("fan-out, no exit   ", lambda: fan_out(payloads, simulated_fetch(rng), 30, concurrency=4, target=999)),
+            ("fan-out, exit at 8 ", lambda: fan_out(payloads, simulated_fetch(rng), 30, concurrency=4, target=8)),
+        ):
+            start = time.perf_counter()
+            found = await run()
+            timings.append(f"{label.strip()} {time.perf_counter() - start:5.2f} s ({len(found)} found)")
+        print(f"📊 {len(payloads):2d} queries   " + "   ".join(timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
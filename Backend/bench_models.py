@@ -0,0 +1,106 @@
+"""
+Benchmark: typed models + codec vs nested dicts + json for research bundles and brief results
+
+Builds research with the real (simulated-data) agents and a full 17-section response,
+then compares encode/decode time and retained memory of both representations.
+
+Run with:
+    python bench_models.py
+"""
+
+import asyncio
+import json
+import time
+import tracemalloc
+
+import codec
+from agentic_brief_enhanced import AudienceResearchAgent, CompetitorResearchAgent, TrendsResearchAgent
+from brief_formatter import BriefFormatter
+from models import BriefMetadata, BriefResult, ResearchBundle
+
+
+async def build_research() -> dict:
+    competitor, trends, audience = await asyncio.gather(
+        CompetitorResearchAgent().research_competitors("enterprise_ai", "ai_platform"),
+        TrendsResearchAgent().analyze_trends("enterprise_ai", "CIOs and CIO-1 of large enterprises"),
+        AudienceResearchAgent().enrich_audience("CIOs and CIO-1 of large enterprises", "enterprise_ai")
+    )
+    return {"competitor_analysis": competitor, "market_trends": trends, "audience_insights": audience}
+
+
+def build_response(research: dict) -> BriefResult:
+    sections = BriefFormatter().parse_brief_content("", research)
+    return BriefResult(
+        success=True,
+        timestamp="2025-07-16T10:30:00",
+        sections=tuple(sections),
+        metadata=BriefMetadata(research_time=1.5, agents_used=("competitor", "trends", "audience", "brief_generator"),
+                               total_sections=len(sections)),
+        brief_id="0" * 32
+    )
+
+
+def time_it(func, repeat: int = 5, number: int = 2000) -> float:
+    """Best per-call time in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def retained_kib(factory, count: int = 1000) -> float:
+    """Memory held by `count` decoded objects"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del items
+    return size / 1024
+
+
+def main():
+    research = asyncio.run(build_research())
+    bundle = ResearchBundle.from_dict(research)
+    result = build_response(research)
+    result_dict = json.loads(codec.encode(result))
+
+    print(f"⚙️  Codec backend: {codec.backend()}")
+
+    # Current path: nested dicts through json (brief cache) and Flask's jsonify defaults
+    dict_body = json.dumps(result_dict, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    model_body = codec.encode(result)
+    assert json.loads(model_body) == result_dict
+
+    rows = [
+        ("brief result encode  | jsonify-style json", lambda: json.dumps(result_dict, sort_keys=True).encode('utf-8')),
+        ("brief result encode  | compact json     ", lambda: json.dumps(result_dict, ensure_ascii=False, separators=(',', ':')).encode('utf-8')),
+        ("brief result encode  | models + codec   ", lambda: codec.encode(result)),
+        ("brief result decode  | json.loads       ", lambda: json.loads(dict_body)),
+        ("brief result decode  | codec -> model   ", lambda: codec.decode(model_body, BriefResult)),
+    ]
+
+    research_body = codec.encode(bundle)
+    rows += [
+        ("research encode      | compact json     ", lambda: json.dumps(research, ensure_ascii=False, separators=(',', ':')).encode('utf-8')),
+        ("research encode      | models + codec   ", lambda: codec.encode(bundle)),
+        ("research decode      | json.loads       ", lambda: json.loads(research_body)),
+        ("research decode      | codec -> model   ", lambda: codec.decode(research_body, ResearchBundle)),
+    ]
+
+    for label, func in rows:
+        print(f"📊 {label} {time_it(func):8.2f} µs")
+
+    print(f"\n📦 Body size: dict/json {len(dict_body)} B, models/codec {len(model_body)} B")
+    print(f"🧠 1000 decoded results: dicts {retained_kib(lambda: json.loads(dict_body)):8.1f} KiB, "
+          f"models {retained_kib(lambda: codec.decode(model_body, BriefResult)):8.1f} KiB")
+    print(f"🧠 1000 decoded research bundles: dicts {retained_kib(lambda: json.loads(research_body)):8.1f} KiB, "
+          f"models {retained_kib(lambda: codec.decode(research_body, ResearchBundle)):8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: audience segment matching as the segment database grows
+
+Builds synthetic segment sets of increasing size (each segment with a handful of words and
+phrases drawn from a shared vocabulary, so common words have long postings) and times matching
+short and long audience descriptions against each. Match time should track the text, not the
+number of segments.
+
+Run with:
+    python bench_segment_index.py [largest segment count, default 50000]
+"""
+
+import random
+import string
+import sys
+import time
+
+from bench_brief_store import timed
+from segment_index import SegmentIndex
+
+
+def synthetic_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+
+def build_segments(count: int, vocabulary: list, rng: random.Random) -> dict:
+    segments = {}
+    for i in range(count):
+        keywords = {rng.choice(vocabulary): round(rng.uniform(0.3, 1.0), 2) for _ in range(4)}
+        keywords[f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}"] = 1.0
+        segments[f"segment_{i}"] = {"keywords": keywords, "profile": {"age_range": "25-50"}}
+    return segments
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(7)
+    vocabulary = [synthetic_word(rng) for _ in range(20000)]
+    short_text = " ".join(rng.choice(vocabulary) for _ in range(8))
+    long_text = " ".join(rng.choice(vocabulary) for _ in range(80))
+
+    for count in [size for size in (1000, 5000, 10000, 50000, 100000) if size <= largest]:
+        segments = build_segments(count, vocabulary, rng)
+        start = time.perf_counter()
+        index = SegmentIndex(segments, {"primary_segment": "General Professional"})
+        build = time.perf_counter() - start
+
+        short_median, short_p99 = timed(lambda: index.match(short_text), repeat=500)
+        long_median, long_p99 = timed(lambda: index.match(long_text), repeat=500)
+        print(f"📊 {count:6d} segments (built in {build:5.2f} s)   "
+              f"8 words: median {short_median:6.3f} ms p99 {short_p99:6.3f} ms   "
+              f"80 words: median {long_median:6.3f} ms p99 {long_p99:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
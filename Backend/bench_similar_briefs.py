@@ -0,0 +1,73 @@
+"""
+Benchmark: near-duplicate input lookups at scale
+
+Fills a temporary store with briefs generated from varied stakeholder inputs, then times
+building the similarity index from the store and looking up reworded inputs.
+
+Run with:
+    python bench_similar_briefs.py [number of briefs, default 20000]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from agentic_brief_enhanced import build_inputs
+from bench_brief_store import AUDIENCES, COMPANIES, INDUSTRIES, TOPICS, timed
+from bench_models import build_research, build_response
+from brief_store import BriefStore
+from similar_briefs import SimilarBriefIndex
+
+REWORDED = {
+    "target_audience": "CIO/CIO-1 at $1-5B enterprises in financial, healthcare and manufacturing",
+    "key_message": "A unified platform scaling applied AI across the enterprise - people, processes, data and systems",
+}
+
+
+def varied_inputs(rng: random.Random) -> dict:
+    topic = rng.choice(TOPICS)
+    return build_inputs({
+        "company_name": rng.choice(COMPANIES),
+        "industry": rng.choice(INDUSTRIES),
+        "target_audience": f"{rng.choice(AUDIENCES)} of companies with ${rng.randint(1, 9)}B revenue",
+        "key_message": f"Scale {topic} across the enterprise",
+        "business_objective": f"Lead the market for {topic}",
+    })
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    research = asyncio.run(build_research())
+    response = build_response(research)
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BriefStore(os.path.join(tmp, "briefs.db"))
+        for inputs in [build_inputs()] + [varied_inputs(rng) for _ in range(count - 1)]:
+            store.put(response, {"research_data": research, "generation_metadata": {"stakeholder_inputs": inputs}})
+
+        index = SimilarBriefIndex(store)
+        start = time.perf_counter()
+        index.find(build_inputs())
+        print(f"🧮 Indexed {len(index)} distinct inputs in {time.perf_counter() - start:.2f} s")
+
+        reworded = build_inputs(REWORDED)
+        rows = [
+            ("lookup reworded demo inputs", lambda: index.find(reworded, "standard")),
+            ("lookup unseen inputs       ", lambda: index.find(varied_inputs(rng), "standard")),
+            ("cached() with store fetch  ", lambda: index.cached(reworded, "standard")),
+        ]
+        for label, func in rows:
+            median, p99 = timed(func, repeat=200)
+            print(f"📊 {label} median {median:7.2f} ms   p99 {p99:7.2f} ms")
+
+        best = index.find(reworded, "standard", limit=1)
+        print(f"\n♻️ Reworded demo inputs -> {best[0].company} (similarity {best[0].similarity})" if best
+              else "\n♻️ Reworded demo inputs -> no match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: keyword trend analytics over tens of thousands of keywords
+
+Builds a synthetic store (two years of weekly interest per keyword, spread over a few
+industries, with some breakout keywords), then times growth rankings, seasonality and
+emerging-topic detection for one industry and for the whole store. A per-keyword Python loop
+computing the same year-over-year growth is timed for comparison.
+
+Run with:
+    python bench_trends_store.py [number of keywords, default 50000]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bench_brief_store import timed
+from trends_store import WINDOW_WEEKS, YEAR_WEEKS, TrendsStore
+
+INDUSTRIES = ["enterprise_ai", "healthcare", "financial_services", "manufacturing", "retail"]
+WEEKS = 104
+
+
+def build_store(count: int, rng: np.random.Generator) -> TrendsStore:
+    weeks = np.datetime64("2026-10-12") - np.arange(WEEKS - 1, -1, -1) * np.timedelta64(7, "D")
+    t = np.arange(WEEKS)
+    base = rng.uniform(5, 60, size=(count, 1))
+    growth = rng.uniform(0.6, 2.5, size=(count, 1))
+    season = 1 + 0.1 * np.sin(2 * np.pi * (t + rng.integers(0, 52, size=(count, 1))) / 52)
+    interest = base * growth ** ((t - 51) / 52) * season * rng.uniform(0.93, 1.07, size=(count, WEEKS))
+    # One keyword in fifty breaks out of a near-zero base in the last few months
+    breakout = rng.random(count) < 0.02
+    interest[breakout] = np.where(t > 85, 1.5 * np.exp((t - 85) * 0.16), 1.5)
+    industries = [INDUSTRIES[i % len(INDUSTRIES)] for i in range(count)]
+    keywords = [f"keyword {i}" for i in range(count)]
+    return TrendsStore(industries, keywords, weeks, np.minimum(interest, 100).round())
+
+
+def loop_growth(store: TrendsStore) -> dict:
+    """Year-over-year growth keyword by keyword, as a plain Python loop would do it"""
+    result = {}
+    for row, keyword in enumerate(store.keywords):
+        series = store.interest[row].tolist()
+        recent = sum(series[-WINDOW_WEEKS:]) / WINDOW_WEEKS
+        prior = sum(series[-YEAR_WEEKS - WINDOW_WEEKS:-YEAR_WEEKS]) / WINDOW_WEEKS
+        result[keyword] = (recent - prior) / max(prior, 1.0) * 100
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = np.random.default_rng(7)
+    store = build_store(count, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keyword_trends.csv")
+        with open(path, "w") as f:
+            f.write("industry,keyword,week,interest\n")
+            for row, keyword in enumerate(store.keywords):
+                industry = INDUSTRIES[row % len(INDUSTRIES)]
+                for week, value in zip(store.weeks.astype(str), store.interest[row].astype(int).tolist()):
+                    f.write(f"{industry},{keyword},{week},{value}\n")
+        start = time.perf_counter()
+        TrendsStore.load(path)
+        parsed = time.perf_counter() - start
+        start = time.perf_counter()
+        TrendsStore.load(path)
+        print(f"📈 {count} keywords x {WEEKS} weeks ({count * WEEKS} CSV rows): parsed in {parsed:.2f} s, "
+              f"from the .npz cache in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rows = [
+        ("industry trends (1/5)  ", lambda: store.industry_trends("healthcare")),
+        ("industry trends (all)  ", lambda: store.industry_trends("unknown")),
+        ("seasonality (1/5)      ", lambda: store.seasonal_patterns("healthcare")),
+        ("emerging topics (1/5)  ", lambda: store.emerging_topics("healthcare")),
+        ("emerging topics (all)  ", lambda: store.emerging_topics("unknown")),
+    ]
+    for label, func in rows:
+        median, p99 = timed(func, repeat=50)
+        print(f"📊 {label} median {median:8.2f} ms   p99 {p99:8.2f} ms")
+
+    median, _ = timed(lambda: loop_growth(store), repeat=3)
+    print(f"🐢 per-keyword Python loop (growth only, all) median {median:8.2f} ms")
+    print(f"\n🔎 Emerging in healthcare: {store.emerging_topics('healthcare')}")
+
+
+if __name__ == "__main__":
+    main()
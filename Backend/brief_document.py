@@ -0,0 +1,199 @@
+"""
+Parsed brief document shared by the HTML formatter and the PDF generator
+A brief is parsed once into sections -> subsections -> blocks (paragraphs, bullets,
+numbered items) with inline bold/italic runs; both renderers consume the same tree.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+# Keywords that mark a line as a section header
+HEADER_KEYWORDS = [
+    'objective', 'background', 'audience', 'problem', 'challenge',
+    'solution', 'offering', 'why', 'enterprise', 'trend', 'demand',
+    'statement of work', 'sow', 'message', 'campaign', 'theme',
+    'creative strategy', 'digital assets', 'video', 'ai', 'tech',
+    'channels', 'mediums'
+]
+HEADER_MATCHER = KeywordMatcher(HEADER_KEYWORDS)
+
+# Lines that open a subsection ("1. Lead Generation", "A. Persona")
+SUBSECTION_MARKERS = ('1.', '2.', '3.', 'A.', 'B.', 'C.')
+# Once a section has subsections, bullets also start a new one
+SUBSECTION_STARTS = SUBSECTION_MARKERS + ('•', '*')
+
+BULLET_PREFIXES = ('- ', '* ', '• ')
+NUMBERED_RE = re.compile(r'\d+\.')
+INLINE_RE = re.compile(r'\*\*(.+?)\*\*|\*(.+?)\*')
+
+
+@dataclass
+class TextRun:
+    """A piece of inline text with its emphasis"""
+    text: str
+    bold: bool = False
+    italic: bool = False
+
+
+@dataclass
+class Block:
+    """One content line: a paragraph, a bullet or a numbered item"""
+    kind: str
+    runs: List[TextRun]
+    line: str
+
+    @property
+    def text(self) -> str:
+        return ''.join(run.text for run in self.runs)
+
+
+@dataclass
+class Subsection:
+    """A numbered/lettered item inside a section and the lines under it"""
+    heading: Block
+    blocks: List[Block] = field(default_factory=list)
+
+
+@dataclass
+class DocumentSection:
+    """A section of the brief: intro blocks followed by optional subsections
+
+    Lines are split into blocks on first access and cached, so sections no renderer
+    looks at are never parsed further.
+    """
+    title: str
+    lines: List[str] = field(default_factory=list)
+
+    @cached_property
+    def _structure(self) -> Tuple[List[Block], List[Subsection]]:
+        return _build_structure([parse_block(line) for line in self.lines])
+
+    @property
+    def intro(self) -> List[Block]:
+        return self._structure[0]
+
+    @property
+    def subsections(self) -> List[Subsection]:
+        return self._structure[1]
+
+    @property
+    def blocks(self) -> List[Block]:
+        """All blocks in document order"""
+        blocks = list(self.intro)
+        for subsection in self.subsections:
+            blocks.append(subsection.heading)
+            blocks.extend(subsection.blocks)
+        return blocks
+
+    @property
+    def content(self) -> str:
+        """The section's original markdown lines"""
+        return '\n'.join(self.lines)
+
+
+@dataclass
+class BriefDocument:
+    """A brief parsed once, in document order"""
+    sections: List[DocumentSection]
+
+    def content_map(self) -> Dict[str, DocumentSection]:
+        """Header -> section for sections with content (a repeated header keeps its last content)"""
+        content_map = {}
+        for section in self.sections:
+            if section.lines:
+                content_map[section.title] = section
+        return content_map
+
+
+def is_header_line(line: str) -> bool:
+    """Checks if a stripped line is a section header"""
+    if line.startswith('**') and line.endswith('**'):
+        return True
+    if line.startswith('#'):
+        return True
+    if line.isupper() and len(line.split()) <= 6:
+        return True
+    return HEADER_MATCHER.any_in(line)
+
+
+def normalize_header(header: str) -> str:
+    """Header text without markdown markers"""
+    return header.replace('**', '').replace('#', '').strip()
+
+
+def parse_inline(text: str) -> List[TextRun]:
+    """Splits text into runs on paired **bold** / *italic* markers (unpaired markers are dropped)"""
+    runs = []
+    position = 0
+    for match in INLINE_RE.finditer(text):
+        if match.start() > position:
+            runs.append(TextRun(text[position:match.start()]))
+        if match.group(1) is not None:
+            runs.append(TextRun(match.group(1), bold=True))
+        else:
+            runs.append(TextRun(match.group(2), italic=True))
+        position = match.end()
+
+    tail = text[position:].replace('*', '')
+    if tail:
+        runs.append(TextRun(tail))
+    return runs
+
+
+def parse_block(line: str) -> Block:
+    """Classifies one stripped content line"""
+    if line.startswith(BULLET_PREFIXES):
+        return Block('bullet', parse_inline(line[2:]), line)
+    if NUMBERED_RE.match(line):
+        return Block('numbered', parse_inline(line), line)
+    return Block('paragraph', parse_inline(line), line)
+
+
+def parse_blocks(content: str) -> List[Block]:
+    """Blocks for every non-empty line of a markdown snippet"""
+    return [parse_block(line.strip()) for line in content.split('\n') if line.strip()]
+
+
+def _build_structure(blocks: List[Block]) -> Tuple[List[Block], List[Subsection]]:
+    """Splits a section's blocks into intro blocks and subsections"""
+    if not any(block.line.startswith(SUBSECTION_MARKERS) for block in blocks):
+        return blocks, []
+
+    intro, subsections = [], []
+    for block in blocks:
+        if block.line.startswith(SUBSECTION_STARTS):
+            subsections.append(Subsection(block))
+        elif subsections:
+            subsections[-1].blocks.append(block)
+        else:
+            intro.append(block)
+    return intro, subsections
+
+
+def parse_brief_document(brief_content: str) -> BriefDocument:
+    """Parses a markdown brief into sections (text before the first header is dropped)"""
+    sections = []
+    title = None
+    lines = []
+
+    for line in brief_content.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        if is_header_line(line):
+            if title:
+                sections.append(DocumentSection(title, lines))
+            title = normalize_header(line)
+            lines = []
+        else:
+            lines.append(line)
+
+    if title:
+        sections.append(DocumentSection(title, lines))
+
+    return BriefDocument(sections)
@@ -0,0 +1,335 @@
+"""
+Brief formatting shared by the Flask and ASGI servers
+Turns the raw agentic brief into the 17-section structure the frontend renders
+"""
+
+import html
+from datetime import datetime
+
+from brief_document import BriefDocument, DocumentSection, is_header_line, normalize_header, parse_blocks, parse_brief_document
+from brief_schema import section_key, section_markdown
+from models import BriefMetadata, BriefResult, BriefSection
+from section_matcher import get_section_matcher
+
+# Exact order and titles of the brief sections
+REQUIRED_SECTIONS = [
+    {"id": 1, "title": "Business Objective", "icon": "🎯"},
+    {"id": 2, "title": "Marketing Objective", "icon": "📈"},
+    {"id": 3, "title": "Background", "icon": "📋"},
+    {"id": 4, "title": "Target Audience", "icon": "👥"},
+    {"id": 5, "title": "The Problem we are trying to solve", "icon": "❗"},
+    {"id": 6, "title": "What are the challenges?", "icon": "⚠️"},
+    {"id": 7, "title": "Solutions/Offering", "icon": "💡"},
+    {"id": 8, "title": "Why XYZ (Platform)?", "icon": "🚀"},
+    {"id": 9, "title": "Why does Enterprise need this solution?", "icon": "🏢"},
+    {"id": 10, "title": "Present market trend and demand", "icon": "📊"},
+    {"id": 11, "title": "Agency Statement of Work (SOW)", "icon": "📋"},
+    {"id": 12, "title": "Key messages across Levels (L1 to L4)", "icon": "🎯"},
+    {"id": 13, "title": "Campaign Theme, Approach/Outline/Creative Strategy", "icon": "🎨"},
+    {"id": 14, "title": "Digital Assets (Banners, Microsite, Infographics, Email Designs)", "icon": "�️"},
+    {"id": 15, "title": "Digital Campaign Videos", "icon": "🎬"},
+    {"id": 16, "title": "AI / Tech Enabled Ideas", "icon": "🤖"},
+    {"id": 17, "title": "Channels / Campaign Digital Mediums", "icon": "�"}
+]
+
+SECTION_TITLES = [section["title"] for section in REQUIRED_SECTIONS]
+
+
+class BriefFormatter:
+    """Formats the agentic brief into the required structure"""
+    
+    def __init__(self):
+        # Define the exact order and titles required
+        self.required_sections = REQUIRED_SECTIONS
+        
+        # Compiled header/section matcher, shared by every formatter with these titles
+        self.matcher = get_section_matcher(tuple(s["title"] for s in self.required_sections))
+    
+    def parse_brief_content(self, brief_content: str, research_data: dict, structured: dict = None,
+                            document: BriefDocument = None) -> list:
+        """Parses the brief content and returns formatted sections in the required order
+        
+        When the brief was generated in structured mode, its decoded JSON is used directly
+        and the markdown header heuristics are skipped. A document already parsed for the
+        same brief (e.g. by the orchestrator) is reused instead of parsing it again.
+        """
+        
+        if structured is not None:
+            matched = [parse_blocks(section_markdown(structured.get(section_key(s["title"]))))
+                       for s in self.required_sections]
+        else:
+            matched = self._match_document_sections(document or parse_brief_document(brief_content))
+        
+        sections = []
+        
+        # Create sections in the exact required order
+        for index, section_def in enumerate(self.required_sections):
+            section_content = self._extract_section_content(
+                section_def["title"], 
+                matched[index],
+                research_data
+            )
+            
+            # Replace XYZ with actual company name
+            title = section_def["title"]
+            if "XYZ" in title:
+                title = title.replace("XYZ", "EdgeVerve")
+            
+            section = BriefSection(
+                id=section_def["id"],
+                icon=section_def["icon"],
+                title=title,
+                content=section_content
+            )
+            
+            sections.append(section)
+        
+        return sections
+    
+    def _match_document_sections(self, document: BriefDocument) -> list:
+        """Finds each required section's blocks in a parsed markdown brief"""
+        
+        content_map = document.content_map()
+        
+        # Assign headers to sections in a single pass over the content map
+        matched_headers = self.matcher.assign(content_map)
+        
+        return [
+            content_map[matched_headers[index]].blocks if index in matched_headers else []
+            for index in range(len(self.required_sections))
+        ]
+    
+    def _is_header_line(self, line: str) -> bool:
+        """Checks if a line is a section header"""
+        return is_header_line(line)
+    
+    def _normalize_header(self, header: str) -> str:
+        """Normalizes header text for matching"""
+        return normalize_header(header)
+    
+    def _extract_section_content(self, section_title: str, matched_blocks: list, research_data: dict) -> str:
+        """Extracts or generates content for a specific section"""
+        
+        # If no content found, generate based on research data and section type
+        if not matched_blocks:
+            matched_blocks = parse_blocks(self._generate_section_content(section_title, research_data))
+        
+        # Format as HTML
+        return self._render_blocks_html(matched_blocks)
+    
+    def _generate_section_content(self, section_title: str, research_data: dict) -> str:
+        """Generates content for sections based on research data"""
+        
+        title_lower = section_title.lower()
+        
+        if 'business objective' in title_lower:
+            return "Establish EdgeVerve as the leading provider of Applied AI solutions for enterprises, targeting 15% market share increase and $50M ARR growth within 12 months."
+        
+        elif 'marketing objective' in title_lower:
+            return """1. **Platform Brand Awareness:** Increase EdgeVerve brand recognition among enterprise CIOs by 40%
+2. **Lead Generation:** Generate 500+ qualified enterprise leads quarterly
+3. **Thought Leadership:** Position EdgeVerve as the go-to expert in enterprise AI implementation"""
+        
+        elif 'background' in title_lower:
+            return "EdgeVerve operates in the rapidly growing enterprise AI market, serving large corporations ($1B-$5B revenue) seeking to scale AI beyond experimentation. The market demands unified platforms that can democratize AI across organizations while maintaining enterprise-grade security and governance."
+        
+        elif 'target audience' in title_lower:
+            audience_data = research_data.get('audience_insights', {})
+            demographics = audience_data.get('demographic_profile', {})
+            return f"""**Primary Audience:** CIOs and CIO-1 of large enterprises
+**Demographics:** {demographics.get('age_range', '35-55 years')}, {demographics.get('education_level', 'Graduate degree')}, {demographics.get('income_range', '$150K-$300K')}
+**Company Profile:** $1B-$5B revenue companies in financial services, healthcare, and manufacturing
+**Pain Points:** {', '.join(audience_data.get('pain_points', ['AI scaling challenges', 'Data silos', 'Legacy integration'])[:3])}"""
+        
+        elif 'problem we are trying to solve' in title_lower:
+            return "Enterprise organizations struggle to scale AI initiatives beyond proof-of-concept stage due to fragmented systems, data silos, lack of governance frameworks, and insufficient technical expertise to implement enterprise-grade AI solutions."
+        
+        elif 'challenges' in title_lower:
+            return """• **Technical Complexity:** Integrating AI with existing enterprise systems
+• **Data Fragmentation:** Siloed data across departments and systems  
+• **Governance & Compliance:** Ensuring AI solutions meet regulatory requirements
+• **Skills Gap:** Lack of internal AI expertise and resources
+• **ROI Uncertainty:** Difficulty demonstrating clear business value from AI investments"""
+        
+        elif 'solutions/offering' in title_lower:
+            return """**EdgeVerve AI Platform Features:**
+• **PolyAI Technology:** Multi-model flexibility and vendor-agnostic approach
+• **Enterprise Integration:** Seamless connection with existing systems and workflows
+• **Built-in Governance:** Comprehensive AI ethics, compliance, and monitoring frameworks
+• **Cloud-Agnostic Deployment:** Works across AWS, Azure, GCP, and hybrid environments
+• **AI Democratization:** No-code/low-code tools for business users"""
+        
+        elif 'why' in title_lower and 'platform' in title_lower:
+            return """• **Proven Enterprise Focus:** Purpose-built for large organization requirements
+• **Rapid ROI:** 6-month average time to value vs. 18+ months for custom solutions
+• **Scalable Architecture:** Handles enterprise-scale data and user volumes
+• **Security First:** Built-in enterprise-grade security and compliance features
+• **Innovation Speed:** Continuous platform updates and latest AI model integration
+• **Expert Support:** Dedicated enterprise success and technical support teams"""
+        
+        elif 'enterprise need' in title_lower:
+            return "Modern enterprises require AI solutions that can scale across the organization, integrate with existing infrastructure, comply with regulatory requirements, and deliver measurable business outcomes while democratizing AI access across different skill levels and departments."
+        
+        elif 'market trend' in title_lower:
+            trends_data = research_data.get('market_trends', {})
+            industry_trends = trends_data.get('industry_trends', {})
+            return f"""**Market Growth:** {industry_trends.get('growth_rate', '+67% YoY')}
+**Rising Demand:** {', '.join(industry_trends.get('rising_searches', ['Enterprise AI platforms +156%', 'MLOps solutions +134%'])[:3])}
+**Key Trends:** {', '.join(industry_trends.get('hot_topics', ['Generative AI for enterprise', 'AI governance', 'Federated learning'])[:4])}
+**Investment Focus:** Enterprise AI platforms expected to reach $50B market size by 2025"""
+        
+        elif 'statement of work' in title_lower:
+            return """**Phase 1:** Brand positioning and messaging framework (4 weeks)
+**Phase 2:** Multi-channel campaign development and asset creation (6 weeks)  
+**Phase 3:** Campaign launch and optimization (8 weeks)
+**Phase 4:** Performance analysis and scaling (4 weeks)
+**Deliverables:** Brand guidelines, campaign assets, content library, performance dashboard"""
+        
+        elif 'key messages' in title_lower:
+            return """**L1 (Executive):** "Transform your enterprise with unified AI that scales"
+**L2 (Technical Leaders):** "Enterprise-grade AI platform with built-in governance and security"
+**L3 (IT Teams):** "Seamlessly integrate AI across your existing infrastructure"
+**L4 (Business Users):** "Democratize AI with no-code tools that deliver real business value" """
+        
+        elif 'campaign theme' in title_lower:
+            return """**Theme:** "AI That Scales, Secures, and Succeeds"
+**Approach:** Executive-focused thought leadership combined with technical proof points
+**Creative Strategy:** Position EdgeVerve as the bridge between AI innovation and enterprise reality
+**Key Pillars:** Trust, Scale, Innovation, Results
+**Tone:** Professional, confident, results-oriented with human-centered AI messaging"""
+        
+        elif 'digital assets' in title_lower:
+            return """**Banners:** Executive-focused LinkedIn/Google Ads (5 sizes)
+**Microsite:** Interactive AI ROI calculator and platform demo
+**Infographics:** AI implementation roadmap, ROI comparison charts
+**Email Designs:** Executive briefing templates, technical deep-dive series
+**Interactive Tools:** AI readiness assessment, implementation timeline calculator"""
+        
+        elif 'video' in title_lower:
+            return """**Executive Testimonials:** C-level customers sharing transformation stories (2-3 min)
+**Platform Demos:** Technical walkthroughs and use case demonstrations (5-7 min)
+**Thought Leadership:** Industry expert interviews and trend analysis (3-5 min)
+**Case Study Videos:** Real customer implementation journeys (4-6 min)
+**Social Media Clips:** Quick wins and key insights for LinkedIn (30-60 sec)"""
+        
+        elif 'ai / tech enabled' in title_lower:
+            return """**AI-Powered Personalization:** Dynamic content adaptation based on visitor profile and industry
+**Predictive Lead Scoring:** ML-driven qualification and nurturing recommendations
+**Intelligent Chatbots:** Industry-specific AI assistants for technical questions
+**Dynamic ROI Calculators:** Real-time business impact modeling
+**Automated Content Generation:** Personalized case studies and implementation guides"""
+        
+        elif 'channels' in title_lower or 'mediums' in title_lower:
+            audience_data = research_data.get('audience_insights', {})
+            channel_prefs = audience_data.get('channel_preferences', {})
+            return f"""**Primary Channels:** {', '.join(channel_prefs.get('primary_channels', ['LinkedIn', 'Industry Publications', 'Google Ads']))}
+**Secondary Channels:** {', '.join(channel_prefs.get('secondary_channels', ['YouTube', 'Webinars', 'Email']))}
+**Content Distribution:** Thought leadership articles, technical whitepapers, interactive demos
+**Engagement Strategy:** Account-based marketing for top 100 enterprise prospects
+**Measurement:** Pipeline influence, engagement scores, brand lift studies"""
+        
+        else:
+            return f"Content for {section_title} will be developed based on stakeholder requirements and market research insights."
+    
+    def _format_content_as_html(self, content: str) -> str:
+        """Formats markdown content as HTML"""
+        return self._render_blocks_html(parse_blocks(content or ""))
+    
+    def _render_blocks_html(self, blocks: list) -> str:
+        """Renders parsed blocks as HTML lines joined with <br>"""
+        
+        if not blocks:
+            return "Content to be developed based on stakeholder requirements."
+        
+        formatted_lines = []
+        for block in blocks:
+            if block.kind == 'numbered':
+                # Numbered items are emphasized as a whole
+                formatted_lines.append(f"<strong>{html.escape(block.text, quote=False)}</strong>")
+                continue
+            
+            line = self._render_runs_html(block.runs)
+            if block.kind == 'bullet':
+                line = f"• {line}"
+            formatted_lines.append(line)
+        
+        return '<br>'.join(formatted_lines)
+    
+    def _render_runs_html(self, runs: list) -> str:
+        """Inline runs as escaped HTML with <strong>/<em>"""
+        parts = []
+        for run in runs:
+            text = html.escape(run.text, quote=False)
+            if run.bold:
+                text = f"<strong>{text}</strong>"
+            elif run.italic:
+                text = f"<em>{text}</em>"
+            parts.append(text)
+        return ''.join(parts)
+
+def _fallback_section(formatter: BriefFormatter, section_def: dict, research_data: dict) -> DocumentSection:
+    """A required section written from research data"""
+    content = formatter._generate_section_content(section_def["title"], research_data)
+    lines = [line.strip() for line in content.split('\n') if line.strip()]
+    return DocumentSection(normalize_header(section_def["title"].replace("XYZ", "EdgeVerve")), lines)
+
+
+def _document_markdown(document: BriefDocument) -> str:
+    return "\n\n".join(f"**{section.title}**\n" + "\n".join(section.lines) for section in document.sections) + "\n"
+
+
+def build_fallback_brief(research_data: dict, formatter: BriefFormatter = None) -> tuple:
+    """Builds (markdown, document) from research data alone, used when Gemini is unavailable
+    
+    The document (rendered by the PDF) is assembled directly instead of parsed from the
+    markdown: generated content has "**Label:** value" lines the header rule would take
+    for sections.
+    """
+    
+    formatter = formatter or BriefFormatter()
+    document = BriefDocument([_fallback_section(formatter, section_def, research_data)
+                              for section_def in formatter.required_sections])
+    return _document_markdown(document), document
+
+
+def complete_partial_brief(document: BriefDocument, research_data: dict,
+                           formatter: BriefFormatter = None) -> BriefDocument:
+    """Appends research-data sections for the required sections a cut-off brief never reached"""
+    
+    formatter = formatter or BriefFormatter()
+    matched = formatter.matcher.assign(document.content_map())
+    missing = [_fallback_section(formatter, section_def, research_data)
+               for index, section_def in enumerate(formatter.required_sections) if index not in matched]
+    return BriefDocument(list(document.sections) + missing)
+
+
+def build_brief_response(result: dict, formatter: BriefFormatter = None) -> BriefResult:
+    """Builds the /generate-brief response from an orchestrator result"""
+    
+    formatter = formatter or BriefFormatter()
+    generation_metadata = result["generation_metadata"]
+    
+    # A degraded brief has nothing to match: every section comes straight from research data
+    document = BriefDocument([]) if generation_metadata.get("degraded") else result.get("brief_document")
+    formatted_sections = formatter.parse_brief_content(
+        result["brief_content"], 
+        result["research_data"],
+        result.get("brief_structured"),
+        document
+    )
+    
+    return BriefResult(
+        success=True,
+        timestamp=datetime.now().isoformat(),
+        sections=tuple(formatted_sections),
+        metadata=BriefMetadata(
+            research_time=generation_metadata["research_time_seconds"],
+            agents_used=tuple(generation_metadata["agents_used"]),
+            total_sections=len(formatted_sections),
+            output_mode=generation_metadata.get("output_mode", "markdown"),
+            degraded=generation_metadata.get("degraded", False),
+            partial=generation_metadata.get("partial", False),
+            profile=generation_metadata.get("profile", "standard"),
+            decode_failed=generation_metadata.get("decode_failed", False)
+        )
+    )
@@ -0,0 +1,87 @@
+"""
+Structured (JSON) brief output
+Builds the response schema that constrains Gemini to one field per required section
+and decodes the reply straight into section content - no header heuristics needed.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+
+def section_key(title: str) -> str:
+    """Schema field name for a section title ("Why XYZ (Platform)?" -> "why_xyz_platform")"""
+    return re.sub(r'[^a-z0-9]+', '_', title.lower()).strip('_')
+
+
+def build_response_schema(section_titles: List[str]) -> dict:
+    """Gemini response schema: one object per section with a summary and bullet points"""
+    section_schema = {
+        "type": "OBJECT",
+        "properties": {
+            "summary": {"type": "STRING", "description": "2-4 sentence summary of the section"},
+            "bullets": {"type": "ARRAY", "items": {"type": "STRING"}, "description": "Specific, actionable points"}
+        },
+        "required": ["summary", "bullets"]
+    }
+
+    properties = {}
+    for title in section_titles:
+        properties[section_key(title)] = dict(section_schema, description=title)
+
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": list(properties)
+    }
+
+
+def decode_structured_brief(text: str, section_titles: List[str]) -> Optional[Dict[str, dict]]:
+    """Decodes a JSON reply into {section_key: {"summary", "bullets"}}, or None if unusable"""
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError) as e:
+        print(f"⚠️ Structured brief is not valid JSON: {e}")
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    sections = {}
+    for title in section_titles:
+        key = section_key(title)
+        entry = data.get(key)
+        if not isinstance(entry, dict):
+            continue
+        summary = str(entry.get("summary") or "").strip()
+        bullets = [str(b).strip() for b in entry.get("bullets") or [] if str(b).strip()]
+        if summary or bullets:
+            sections[key] = {"summary": summary, "bullets": bullets}
+    return sections
+
+
+def is_json_reply(text: str) -> bool:
+    """True if a reply is JSON (possibly in a code fence) rather than markdown"""
+    stripped = (text or "").lstrip()
+    if stripped.startswith("```"):
+        stripped = stripped[3:].lstrip("json").lstrip()
+    return stripped.startswith(("{", "["))
+
+
+def section_markdown(entry: Optional[dict]) -> str:
+    """Renders one decoded section as the markdown the formatter and PDF already understand"""
+    if not entry:
+        return ""
+    lines = [entry["summary"]] if entry.get("summary") else []
+    lines.extend(f"- {bullet}" for bullet in entry.get("bullets", []))
+    return '\n'.join(lines)
+
+
+def structured_to_markdown(structured: Dict[str, dict], section_titles: List[str]) -> str:
+    """Full markdown brief (bold section titles) for the PDF and console output"""
+    blocks = []
+    for title in section_titles:
+        content = section_markdown(structured.get(section_key(title)))
+        if content:
+            blocks.append(f"**{title.replace('XYZ', 'EdgeVerve')}**\n{content}")
+    return '\n\n'.join(blocks)
@@ -0,0 +1,351 @@
+"""
+Persistent store of generated briefs (SQLite)
+Keeps the serialized response with its ETag, the raw brief, the inputs hash, timings and token
+usage, so re-opening a brief is an indexed read instead of a new generation. Research bundles
+are content-addressed: stored once per distinct bundle and reference-counted by the briefs
+that use them. An FTS5 index over sections, inputs and research is updated with every save.
+The database file is shared by every worker process.
+"""
+
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from codec import encode, encode_canonical
+from http_cache import content_etag
+from models import BriefResult, BriefSearchHit, BriefSummary, ResearchBundle
+
+# id orders briefs for indexes kept outside SQLite and keys briefs_fts; unlike a bare rowid it
+# is never reused after a delete and survives VACUUM
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS briefs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    brief_id TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    company TEXT,
+    industry TEXT,
+    profile TEXT,
+    inputs_hash TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    response BLOB NOT NULL,
+    etag TEXT NOT NULL,
+    brief_content TEXT,
+    research_hash TEXT,
+    research_seconds REAL,
+    generation_seconds REAL,
+    prompt_tokens INTEGER,
+    output_tokens INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_briefs_created ON briefs(created_at, brief_id);
+CREATE INDEX IF NOT EXISTS idx_briefs_company ON briefs(company, created_at, brief_id);
+CREATE INDEX IF NOT EXISTS idx_briefs_industry ON briefs(industry, created_at, brief_id);
+CREATE INDEX IF NOT EXISTS idx_briefs_inputs_hash ON briefs(inputs_hash);
+CREATE INDEX IF NOT EXISTS idx_briefs_research_hash ON briefs(research_hash);
+CREATE TABLE IF NOT EXISTS research_bundles (
+    research_hash TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    refs INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS briefs_fts USING fts5(
+    sections, inputs, research,
+    tokenize = 'porter unicode61'
+);
+"""
+
+# bm25 column weights: sections, inputs, research
+SEARCH_WEIGHTS = (1.0, 2.0, 0.5)
+
+TAG_RE = re.compile(r'<[^>]+>')
+QUERY_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+SUMMARY_COLUMNS = [name for name in BriefSummary.__dataclass_fields__]
+
+MAX_PAGE_SIZE = 100
+
+# A research hash always names the same bytes
+RESEARCH_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def inputs_hash(stakeholder_inputs: dict, profile: Optional[str] = None) -> str:
+    """Stable hash of what a brief was generated from (same inputs + profile = same hash)"""
+    canonical = json.dumps({"inputs": stakeholder_inputs, "profile": profile}, sort_keys=True,
+                           ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def research_key(bundle: ResearchBundle) -> Tuple[str, bytes]:
+    """(content hash, canonical body) of a research bundle; agent timestamps are left out so
+    the same findings researched twice are stored once"""
+    canonical = replace(
+        bundle,
+        competitor_analysis=replace(bundle.competitor_analysis, timestamp=""),
+        market_trends=replace(bundle.market_trends, timestamp=""),
+        audience_insights=replace(bundle.audience_insights, timestamp="")
+    )
+    body = encode_canonical(canonical)
+    return hashlib.sha256(body).hexdigest(), body
+
+
+def _flatten_text(value, skip_keys=("timestamp",)) -> str:
+    """All string/number leaves of nested research or input data, space-separated"""
+    if isinstance(value, dict):
+        return " ".join(_flatten_text(v) for k, v in value.items() if k not in skip_keys)
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten_text(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def _sections_text(response: BriefResult) -> str:
+    """Section titles and content as plain text (the content is HTML)"""
+    return "\n".join(f"{section.title}: {html.unescape(TAG_RE.sub(' ', section.content))}"
+                     for section in response.sections)
+
+
+def _highlight(snippet: str) -> str:
+    """Escapes indexed text for HTML, turning the snippet's match markers into <mark>"""
+    return html.escape(snippet).replace('\x02', '<mark>').replace('\x03', '</mark>')
+
+
+def to_match_query(text: str) -> str:
+    """User search text as an FTS5 query: every word (or "quoted phrase") must appear
+
+    Terms are quoted so punctuation and FTS operators in user input can't break the query.
+    """
+    terms = []
+    for phrase, word in QUERY_TERM_RE.findall(text):
+        term = (phrase or word).replace('"', '').strip()
+        if term:
+            terms.append(f'"{term}"')
+    if not terms:
+        raise ValueError("Empty search query")
+    return " ".join(terms)
+
+
+def encode_cursor(created_at: str, brief_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{brief_id}".encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Raises ValueError for cursors this store did not issue"""
+    try:
+        created_at, brief_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+    except Exception:
+        raise ValueError("Invalid cursor")
+    return created_at, brief_id
+
+
+class BriefStore:
+    """SQLite-backed brief storage; one connection per process, serialized by a lock"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so forked workers get their own connection
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                # Readers in other workers don't block on writers
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _add_research_ref(conn: sqlite3.Connection, research_hash: str, body: bytes, created_at: str):
+        conn.execute(
+            "INSERT INTO research_bundles (research_hash, body, refs, created_at) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT (research_hash) DO UPDATE SET refs = refs + 1",
+            (research_hash, body, created_at)
+        )
+
+    def put(self, response: BriefResult, result: Optional[dict] = None) -> Tuple[str, bytes, str]:
+        """Stores a brief response (and what it was generated from), returning (brief_id, body, etag)"""
+        result = result or {}
+        metadata = result.get("generation_metadata", {})
+        stakeholder_inputs = metadata.get("stakeholder_inputs", {})
+        usage = metadata.get("token_usage") or {}
+        research = result.get("research_bundle")
+        research_hash, research_body = research_key(research) if research is not None else (None, None)
+
+        brief_id = uuid.uuid4().hex
+        body = encode(replace(response, brief_id=brief_id, research_hash=research_hash))
+        etag = content_etag(body)
+
+        row = {
+            "brief_id": brief_id,
+            "created_at": datetime.now().isoformat(),
+            "company": stakeholder_inputs.get("company_name"),
+            "industry": stakeholder_inputs.get("industry"),
+            "profile": response.metadata.profile,
+            "inputs_hash": inputs_hash(stakeholder_inputs, response.metadata.profile),
+            "inputs": json.dumps(stakeholder_inputs, ensure_ascii=False, default=str),
+            "response": body,
+            "etag": etag,
+            "brief_content": result.get("brief_content"),
+            "research_hash": research_hash,
+            "research_seconds": metadata.get("research_time_seconds"),
+            "generation_seconds": metadata.get("generation_seconds"),
+            "prompt_tokens": usage.get("prompt_tokens"),
+            "output_tokens": usage.get("output_tokens"),
+        }
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{name}" for name in row)
+
+        search_row = (
+            _sections_text(response),
+            _flatten_text(stakeholder_inputs),
+            _flatten_text(result.get("research_data") or {})
+        )
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if research_hash is not None:
+                    # Stored once per distinct bundle; briefs hold a counted reference
+                    self._add_research_ref(conn, research_hash, research_body, row["created_at"])
+                row_id = conn.execute(f"INSERT INTO briefs ({columns}) VALUES ({placeholders})", row).lastrowid
+                # Same transaction and id, so the index never drifts from the table
+                conn.execute("INSERT INTO briefs_fts (rowid, sections, inputs, research) VALUES (?, ?, ?, ?)",
+                             (row_id, *search_row))
+
+        return brief_id, body, etag
+
+    def get(self, brief_id: str) -> Optional[Tuple[bytes, str]]:
+        """Returns (serialized body, etag) for a stored brief, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT response, etag FROM briefs WHERE brief_id = ?", (brief_id,)
+            ).fetchone()
+        return (bytes(row["response"]), row["etag"]) if row is not None else None
+
+    def delete(self, brief_id: str) -> bool:
+        """Removes a brief, and its research bundle once no other brief references it; False if there was none"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                row = conn.execute("SELECT id, research_hash FROM briefs WHERE brief_id = ?",
+                                   (brief_id,)).fetchone()
+                if row is None:
+                    return False
+                conn.execute("DELETE FROM briefs_fts WHERE rowid = ?", (row["id"],))
+                conn.execute("DELETE FROM briefs WHERE id = ?", (row["id"],))
+                if row["research_hash"] is not None:
+                    conn.execute("UPDATE research_bundles SET refs = refs - 1 WHERE research_hash = ?",
+                                 (row["research_hash"],))
+                    conn.execute("DELETE FROM research_bundles WHERE research_hash = ? AND refs <= 0",
+                                 (row["research_hash"],))
+        return True
+
+    def get_research(self, research_hash: str) -> Optional[bytes]:
+        """Serialized research bundle for a content hash, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT body FROM research_bundles WHERE research_hash = ?", (research_hash,)
+            ).fetchone()
+        return bytes(row["body"]) if row is not None else None
+
+    def search(self, text: str, limit: int = 20, company: Optional[str] = None,
+               industry: Optional[str] = None) -> List[BriefSearchHit]:
+        """Briefs matching every search term, best match first (bm25), with a highlighted snippet"""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        match = to_match_query(text)
+        where, params = ["briefs_fts MATCH ?"], [match]
+        # Filters go on the joined table: "rowid IN (subquery)" inside the MATCH query is
+        # re-evaluated per match and is two orders of magnitude slower
+        if company:
+            where.append("b.company = ?")
+            params.append(company)
+        if industry:
+            where.append("b.industry = ?")
+            params.append(industry)
+        params.append(limit)
+
+        # Rank first, then build snippets for the top rows alone - snippets for every match
+        # dominate otherwise
+        weights = ", ".join(map(str, SEARCH_WEIGHTS))
+        ranked_query = f"""
+            SELECT f.rowid, bm25(briefs_fts, {weights}) AS rank
+            FROM briefs_fts f JOIN briefs b ON b.id = f.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY rank
+            LIMIT ?
+        """
+        with self._lock:
+            conn = self._connection()
+            ranked = conn.execute(ranked_query, params).fetchall()
+            if not ranked:
+                return []
+            marks = ", ".join("?" * len(ranked))
+            rowids = [row["rowid"] for row in ranked]
+            details = {row["rowid"]: row for row in conn.execute(f"""
+                SELECT f.rowid, b.brief_id, b.created_at, b.company, b.industry, b.profile,
+                       snippet(briefs_fts, -1, char(2), char(3), '…', 16) AS snippet
+                FROM briefs_fts f JOIN briefs b ON b.id = f.rowid
+                WHERE briefs_fts MATCH ? AND f.rowid IN ({marks})
+            """, [match, *rowids])}
+
+        # bm25 is lower-is-better; report higher-is-better scores
+        hits = []
+        for row in ranked:
+            detail = dict(details[row["rowid"]])
+            detail.pop("rowid")
+            hits.append(BriefSearchHit(**{**detail, "score": round(-row["rank"], 4),
+                                          "snippet": _highlight(detail["snippet"])}))
+        return hits
+
+    def list(self, limit: int = 20, cursor: Optional[str] = None, company: Optional[str] = None,
+             industry: Optional[str] = None) -> Tuple[List[BriefSummary], Optional[str]]:
+        """Newest first, keyset-paginated; returns (summaries, next cursor or None)"""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        where, params = [], []
+        if company:
+            where.append("company = ?")
+            params.append(company)
+        if industry:
+            where.append("industry = ?")
+            params.append(industry)
+        if cursor:
+            where.append("(created_at, brief_id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        query = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM briefs"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        # One extra row tells whether there is a next page
+        query += " ORDER BY created_at DESC, brief_id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self._connection().execute(query, params).fetchall()
+
+        summaries = [BriefSummary(**dict(row)) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = summaries[-1]
+            next_cursor = encode_cursor(last.created_at, last.brief_id)
+        return summaries, next_cursor
+
+    def stored_since(self, after_id: int = 0, batch: int = 1000) -> List[sqlite3.Row]:
+        """Briefs stored after the brief with id after_id, oldest first, for indexes kept outside
+        SQLite (similar_briefs.py); ids are never reused, so nothing stored later is skipped"""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT id, brief_id, created_at, company, industry, profile, inputs_hash, inputs "
+                "FROM briefs WHERE id > ? ORDER BY id LIMIT ?", (after_id, batch)
+            ).fetchall()
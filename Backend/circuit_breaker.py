@@ -0,0 +1,121 @@
+"""
+Circuit breaker for the Gemini generation call
+Tracks failures and slow calls over a sliding window. When too many go wrong the circuit
+opens and briefs are built from research data instead; after a cool-down a single probe
+call is let through (half-open) and its outcome closes or re-opens the circuit.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from config import (BREAKER_FAILURE_RATE, BREAKER_MIN_CALLS, BREAKER_WINDOW, BREAKER_SLOW_CALL_SECONDS,
+                    BREAKER_OPEN_SECONDS)
+from metrics import registry
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+REJECTED = registry.counter("brief_circuit_rejected_total", "Calls skipped because the circuit was open")
+TRANSITIONS = registry.counter("brief_circuit_transitions_total", "Circuit state changes")
+
+
+class Permit:
+    """An admitted call; only the half-open probe's permit can close or re-open the circuit"""
+
+    __slots__ = ("probe",)
+
+    def __init__(self, probe: bool = False):
+        self.probe = probe
+
+
+class CircuitBreaker:
+    """Closed -> open on a high failure/slow-call rate, open -> half-open after a cool-down"""
+
+    def __init__(self, name: str, failure_rate: float = BREAKER_FAILURE_RATE, min_calls: int = BREAKER_MIN_CALLS,
+                 window: int = BREAKER_WINDOW, slow_call_seconds: float = BREAKER_SLOW_CALL_SECONDS,
+                 open_seconds: float = BREAKER_OPEN_SECONDS):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window)  # True = failed or slow
+        self._opened_at = 0.0
+        self._probe: Optional[Permit] = None
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str):
+        if state != self.state:
+            print(f"🔌 Circuit '{self.name}': {self.state} -> {state}")
+            TRANSITIONS.inc(circuit=self.name, to=state)
+            self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._outcomes.clear()
+        self._probe = None
+
+    def allow(self) -> Optional[Permit]:
+        """A permit if the call should go to the upstream, else None; the one permit handed out
+        while half-open is the probe. Pass it back with the call's outcome"""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self._transition(HALF_OPEN)
+            if self.state == CLOSED:
+                return Permit()
+            if self.state == HALF_OPEN and self._probe is None:
+                self._probe = Permit(probe=True)
+                return self._probe
+        REJECTED.inc(circuit=self.name)
+        return None
+
+    def release(self, permit: Permit):
+        """Ends a call that had no outcome (cancelled, or cut short by the request's own deadline);
+        if it was the probe, the next call probes instead"""
+        with self._lock:
+            if permit is self._probe:
+                self._probe = None
+
+    def record_success(self, permit: Permit, elapsed: float):
+        """Records a completed call; one slower than slow_call_seconds counts against the circuit"""
+        self._record(permit, elapsed > self.slow_call_seconds)
+
+    def record_failure(self, permit: Permit):
+        self._record(permit, True)
+
+    def _record(self, permit: Permit, bad: bool):
+        with self._lock:
+            if self.state == HALF_OPEN:
+                # Calls admitted before the circuit opened finish late; only the probe decides
+                if permit is self._probe:
+                    self._transition(OPEN if bad else CLOSED)
+                return
+            if self.state == OPEN:
+                # A call let through before the circuit opened - its outcome is already stale
+                return
+            self._outcomes.append(bad)
+            if (len(self._outcomes) >= self.min_calls
+                    and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate):
+                self._transition(OPEN)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Shared breaker per upstream, so every request in the worker sees the same state"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+registry.gauge("brief_circuit_state", "Circuit state (0 closed, 1 half-open, 2 open)",
+               lambda: [({"circuit": b.name}, STATE_VALUES[b.state]) for b in list(_breakers.values())])
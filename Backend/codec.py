@@ -0,0 +1,62 @@
+"""
+Fast JSON codec for the typed models in models.py
+Uses msgspec when it is installed (encodes dataclasses natively, decodes straight into
+typed models); otherwise falls back to compact json with a dataclass hook.
+"""
+
+import json
+from typing import Any, Optional, Type
+
+# msgspec is optional - the json fallback produces the same bytes layout
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    _encoder = msgspec.json.Encoder()
+    _canonical_encoder = msgspec.json.Encoder(order="sorted")
+    _decoders = {}
+
+
+def _encode_default(obj: Any) -> Any:
+    """json hook: slotted dataclasses become field-ordered dicts"""
+    fields = getattr(obj, '__dataclass_fields__', None)
+    if fields is not None:
+        return {name: getattr(obj, name) for name in fields}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode(obj: Any) -> bytes:
+    """Serializes a model (or plain JSON data) to compact UTF-8 JSON"""
+    if msgspec is not None:
+        return _encoder.encode(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_encode_default).encode('utf-8')
+
+
+def encode_canonical(obj: Any) -> bytes:
+    """Like encode, but with keys and fields sorted so equal content always gives equal bytes
+    (for content hashes)"""
+    if msgspec is not None:
+        return _canonical_encoder.encode(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=True,
+                      default=_encode_default).encode('utf-8')
+
+
+def decode(data: bytes, model: Optional[Type] = None) -> Any:
+    """Parses JSON, building the given model type when one is passed"""
+    if msgspec is not None:
+        if model is None:
+            return msgspec.json.decode(data)
+        decoder = _decoders.get(model)
+        if decoder is None:
+            decoder = _decoders[model] = msgspec.json.Decoder(model)
+        return decoder.decode(data)
+
+    parsed = json.loads(data)
+    return model.from_dict(parsed) if model is not None else parsed
+
+
+def backend() -> str:
+    """Name of the codec implementation in use"""
+    return "msgspec" if msgspec is not None else "json"
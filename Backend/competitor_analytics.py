@@ -0,0 +1,243 @@
+"""
+Pricing and positioning analytics for CompetitorResearchAgent
+Price strings ("$100K+ annually", "$49-79/month", "Pay-per-use") are parsed into an annual USD
+range and pricing-model categories. Each distinct string is parsed once; everything after that -
+percentiles, price tiers, model shares, positioning term frequencies - is computed with NumPy
+over all competitors at once, so a few hundred competitors cost about as much as five.
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from keyword_matcher import KeywordMatcher
+from text_utils import WORD_RE, stem
+
+# Pricing-model categories, most specific first; the first hit is a competitor's primary model
+PRICING_MODELS = [
+    ("free", "Free tier", ["free", "freemium"]),
+    ("per_seat", "Per-user / per-seat", ["per-user", "per user", "per-seat", "per seat", "per-robot", "per robot",
+                                         "per-flow"]),
+    # Substring matches, so no bare "per-use" - it is also the start of "per-user"
+    ("usage_based", "Usage-based", ["pay-per", "pay per", "pay-as-you-go", "usage", "volume", "per-page",
+                                    "per-test", "consumption", "metered"]),
+    ("revenue_share", "Revenue share", ["percentage", "% of"]),
+    ("subscription", "Subscription", ["subscription", "/month", "/mo", "monthly", "annually", "/year", "per year",
+                                      "annual"]),
+    ("license", "License", ["license", "licensing", "perpetual"]),
+    ("bundled", "Bundled / add-on", ["bundled", "add-on", "included"]),
+    ("custom_enterprise", "Custom enterprise", ["custom", "enterprise", "contact", "quote", "partnership"]),
+]
+PUBLISHED_LABEL = "Published price"
+OTHER_LABEL = "Other"
+MODEL_MATCHER = KeywordMatcher(keyword for _, _, keywords in PRICING_MODELS for keyword in keywords)
+
+AMOUNT = r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*([kmb])?\b'
+PRICE_RE = re.compile(r'\$\s*' + AMOUNT + r'(?:\s*(?:-|–|to)\s*\$?\s*' + AMOUNT + r')?\s*(\+)?')
+MONTHLY_RE = re.compile(r'/\s*mo\b|/\s*month|month|monthly')
+UNITS = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+# Annual price bands (lower bounds) competitors are grouped into
+PRICE_TIERS = [("Self-serve", 0.0), ("Mid-market", 1e4), ("Enterprise", 1e5), ("Strategic", 1e6)]
+TIER_EXAMPLES = 5
+MAX_TERMS = 8
+STOPWORDS = frozenset(
+    "a an and the of for to in on with by from as at or our your their its is are be into via "
+    "based platform solution solutions company inc".split()
+)
+# Positioning angles suggested when no competitor's focus or description mentions them
+GAP_ANGLES = [
+    ("Responsible AI and governance", ("governance", "responsible", "compliance", "trust")),
+    ("Agentic automation", ("agentic", "agent")),
+    ("Fast time-to-value", ("fast", "rapid", "quick", "time")),
+    ("Industry-specific models", ("vertical", "specific", "domain")),
+    ("Open standards, no lock-in", ("open", "interoperable", "standard", "portable")),
+    ("HIPAA-first approach", ("hipaa",)),
+    ("Mobile-first design", ("mobile",)),
+]
+
+
+def _numpy():
+    # NumPy adds ~60 ms to import; load it with the first analysis, not with the server
+    import numpy
+    return numpy
+
+
+class Price(NamedTuple):
+    """Annual USD range parsed from a price string; NaN where unknown, high=inf when open-ended"""
+    low: float
+    high: float
+    models: Tuple[str, ...]
+
+
+def _amount(number: str, unit: str) -> float:
+    return float(number.replace(",", "")) * UNITS.get(unit or "", 1.0)
+
+
+@lru_cache(maxsize=4096)
+def parse_price(text: str) -> Price:
+    """'$100K+ annually' -> (100000, inf), '$49-79/month' -> (588, 948), 'Pay-per-use' -> (nan, nan)"""
+    lowered = (text or "").lower()
+    hits = MODEL_MATCHER.hits(lowered)
+    models = tuple(key for key, _, keywords in PRICING_MODELS if any(keyword in hits for keyword in keywords))
+
+    low = high = math.nan
+    match = PRICE_RE.search(lowered)
+    if match:
+        first, first_unit, second, second_unit, plus = match.groups()
+        # "$1-5M": the unit after the second number applies to both
+        low = _amount(first, first_unit or (second_unit if second else None))
+        high = math.inf if plus else _amount(second, second_unit) if second else low
+        if MONTHLY_RE.search(lowered, match.end()):
+            low, high = low * 12, high * 12
+    if "free" in models:
+        low = 0.0
+        if math.isnan(high):
+            high = 0.0
+    return Price(low, high, models)
+
+
+def format_usd(amount: float) -> str:
+    """120000 -> '$120K', 2000000 -> '$2M', 588 -> '$588'"""
+    for unit, size in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if amount >= size:
+            value = amount / size
+            return f"${value:.1f}".rstrip("0").rstrip(".") + unit
+    return f"${amount:.0f}"
+
+
+def _parse_batch(values: Sequence[str]):
+    """(low, high, model matrix) arrays per value; each distinct string is parsed once"""
+    np = _numpy()
+    uniques: Dict[str, int] = {}
+    inverse = np.fromiter((uniques.setdefault(value or "", len(uniques)) for value in values),
+                          dtype=np.intp, count=len(values))
+    parsed = [parse_price(value) for value in uniques]
+    lows = np.array([price.low for price in parsed], dtype=np.float64)
+    highs = np.array([price.high for price in parsed], dtype=np.float64)
+    keys = [key for key, _, _ in PRICING_MODELS]
+    models = np.zeros((len(parsed), len(keys)), dtype=bool)
+    for row, price in enumerate(parsed):
+        models[row, [keys.index(key) for key in price.models]] = True
+    return lows[inverse], highs[inverse], models[inverse]
+
+
+def analyze_pricing(competitors: List[Dict]) -> Dict:
+    """Pricing-model shares, annual price percentiles and tiers, and a positioning recommendation"""
+    np = _numpy()
+    if not competitors:
+        return {"pricing_models": [], "model_shares": {}, "price_range": "Not published", "published_prices": 0,
+                "percentiles": {}, "price_tiers": [],
+                "recommendation": "No competitor pricing found - validate willingness to pay directly"}
+
+    names = np.array([c.get("name", "") for c in competitors], dtype=object)
+    lows, highs, models = _parse_batch([c.get("pricing", "") for c in competitors])
+    count = len(competitors)
+
+    # Primary model: first category that matched, else "published" (a bare price) or "other"
+    has_model = models.any(axis=1)
+    priced = ~np.isnan(lows)
+    labels = [label for _, label, _ in PRICING_MODELS] + [PUBLISHED_LABEL, OTHER_LABEL]
+    primary = np.where(has_model, models.argmax(axis=1),
+                       np.where(priced, len(PRICING_MODELS), len(PRICING_MODELS) + 1))
+    shares = np.bincount(primary, minlength=len(labels)) / count
+    order = np.argsort(-shares, kind="stable")
+    model_shares = {labels[i]: round(float(shares[i]), 2) for i in order if shares[i] > 0}
+
+    result = {
+        "pricing_models": list(model_shares),
+        "model_shares": model_shares,
+        "published_prices": int(priced.sum()),
+    }
+    dominant = next(iter(model_shares))
+    if not priced.any():
+        result.update({
+            "price_range": "Not published (quote-based)",
+            "percentiles": {},
+            "price_tiers": [],
+            "recommendation": f"No competitor publishes prices ({dominant.lower()} dominates) - "
+                              "a transparent entry tier would stand out",
+        })
+        return result
+
+    # One representative annual price per competitor: the floor of open-ended ranges,
+    # the geometric middle of closed ones
+    low, high = lows[priced], highs[priced]
+    closed = np.isfinite(high) & (low > 0)
+    price = np.where(closed, np.sqrt(low * np.where(closed, high, 1.0)), np.where(np.isfinite(high), high, low))
+    p25, p50, p75 = np.percentile(price, [25, 50, 75])
+    top = float(high.max())
+    ceiling = format_usd(float(low.max())) + "+" if math.isinf(top) else format_usd(top)
+
+    # Tiers: fixed annual price bands, members listed from the cheapest
+    bounds = np.array([bound for _, bound in PRICE_TIERS[1:]])
+    band = np.digitize(price, bounds)
+    sort = np.lexsort((price, band))
+    sizes = np.bincount(band, minlength=len(PRICE_TIERS))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    tier_names = names[priced][sort]
+    tiers = []
+    for tier, (label, bound) in enumerate(PRICE_TIERS):
+        if sizes[tier]:
+            upper = f"-{format_usd(PRICE_TIERS[tier + 1][1])}" if tier + 1 < len(PRICE_TIERS) else "+"
+            tiers.append({
+                "tier": label,
+                "range": f"{format_usd(bound)}{upper} per year",
+                "count": int(sizes[tier]),
+                "examples": tier_names[starts[tier]:starts[tier] + min(sizes[tier], TIER_EXAMPLES)].tolist(),
+            })
+
+    result.update({
+        "price_range": f"{format_usd(float(low.min()))} to {ceiling} per year",
+        "percentiles": {"p25": format_usd(float(p25)), "p50": format_usd(float(p50)), "p75": format_usd(float(p75))},
+        "price_tiers": tiers,
+        "recommendation": f"Price near the market median of {format_usd(float(p50))}/year "
+                          f"(middle half {format_usd(float(p25))}-{format_usd(float(p75))}) "
+                          f"on a {dominant.lower()} model",
+    })
+    return result
+
+
+def analyze_positioning(competitors: List[Dict]) -> Dict:
+    """How many competitors use each positioning term, and the angles none of them claim"""
+    np = _numpy()
+    words = [WORD_RE.findall(f"{c.get('focus', '')} {c.get('description', '')}".lower()) for c in competitors]
+    count = max(len(competitors), 1)
+    vocabulary = set()
+    term_share: Dict[str, float] = {}
+    if any(words):
+        # Word ids in one pass; each distinct word is stemmed once and every occurrence is
+        # mapped to its term id in a single array lookup
+        word_ids: Dict[str, int] = {}
+        occurrences = np.fromiter((word_ids.setdefault(word, len(word_ids)) for doc in words for word in doc),
+                                  dtype=np.int64)
+        docs = np.repeat(np.arange(len(words), dtype=np.int64), [len(doc) for doc in words])
+        term_ids: Dict[str, int] = {}
+        to_term = np.full(len(word_ids), -1, dtype=np.int64)
+        for i, word in enumerate(word_ids):
+            term = stem(word)
+            if term not in STOPWORDS and not term.isdigit():
+                to_term[i] = term_ids.setdefault(term, len(term_ids))
+        terms = to_term[occurrences]
+        keep = terms >= 0
+        vocabulary = set(term_ids)
+        if keep.any():
+            # Competitors per term: unique (competitor, term) pairs, then a count per term
+            pairs = np.unique(docs[keep] * len(term_ids) + terms[keep])
+            frequency = np.bincount(pairs % len(term_ids), minlength=len(term_ids))
+            top = np.argsort(-frequency, kind="stable")[:MAX_TERMS]
+            names = list(term_ids)
+            term_share = {names[i]: round(float(frequency[i]) / count, 2) for i in top}
+
+    gaps = [angle for angle, keywords in GAP_ANGLES if not any(keyword in vocabulary for keyword in keywords)][:3]
+    crowded = [term for term, share in term_share.items() if share >= 0.5] or list(term_share)[:2]
+    return {
+        "common_positions": list(dict.fromkeys(c.get("focus", "") for c in competitors if c.get("focus"))),
+        "term_frequencies": term_share,
+        "gap_opportunities": gaps,
+        "differentiation_suggestion": (
+            f"Competitors cluster around {', '.join(crowded)}; lead with {gaps[0]}" if crowded and gaps
+            else "Focus on automation and time-saving for busy professionals"
+        ),
+    }
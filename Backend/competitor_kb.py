@@ -0,0 +1,252 @@
+"""
+Competitor knowledge base for CompetitorResearchAgent (SQLite)
+Seeded from competitors.json and extended with what live Serper searches find. Competitors are
+keyed by (industry, company type) in a clustered table, so a lookup is one index seek whatever
+the number of industries. Industry names resolve through an alias table (synonyms) and a trigram
+index (typos, spelling variants). The database file is memory-mapped and shared by every worker
+process instead of each one holding its own copy of the data.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config import COMPETITOR_DATA_PATH, COMPETITOR_KB_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS competitors (
+    industry TEXT NOT NULL,
+    company_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    focus TEXT NOT NULL DEFAULT '',
+    pricing TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    website TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (industry, company_type, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_competitors_position ON competitors(industry, company_type, position);
+CREATE TABLE IF NOT EXISTS industry_aliases (
+    alias TEXT PRIMARY KEY,
+    industry TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS industry_trigrams USING fts5(alias, tokenize = 'trigram');
+CREATE TABLE IF NOT EXISTS kb_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Industry / company type of the generic list used when nothing closer is known
+DEFAULT_KEY = "*"
+MAX_COMPETITORS = 5
+# difflib ratio a trigram candidate needs to count as the same industry
+FUZZY_CUTOFF = 0.75
+FUZZY_CACHE_SIZE = 4096
+MMAP_SIZE = 64 * 2**20
+
+KEY_RE = re.compile(r'[^a-z0-9]+')
+FIELDS = ("name", "focus", "pricing", "description", "website", "source")
+
+
+def normalize_key(text: str) -> str:
+    """'Enterprise AI' / 'enterprise-ai' -> 'enterprise_ai'"""
+    return KEY_RE.sub("_", (text or "").lower()).strip("_")
+
+
+def _trigram_query(key: str) -> Optional[str]:
+    trigrams = {key[i:i + 3] for i in range(len(key) - 2)}
+    if not trigrams:
+        return None
+    return " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in sorted(trigrams))
+
+
+class CompetitorKnowledgeBase:
+    """Competitors per (industry, company type); one connection per process, serialized by a lock"""
+
+    def __init__(self, path: str = COMPETITOR_KB_PATH, seed_path: Optional[str] = COMPETITOR_DATA_PATH):
+        self.path = path
+        self.seed_path = seed_path
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._fuzzy: Dict[str, Optional[str]] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so forked workers get their own connection
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                # Reads come from the OS page cache every worker shares
+                conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            conn.executescript(SCHEMA)
+            if self.seed_path:
+                self._load_seed(conn, self.seed_path)
+            self._conn, self._pid = conn, os.getpid()
+            self._fuzzy.clear()
+        return self._conn
+
+    @staticmethod
+    def _load_seed(conn: sqlite3.Connection, seed_path: str):
+        """(Re)loads the data file when it changed since it was last loaded; seed rows and aliases no
+        longer in it are removed, learned rows are kept"""
+        with open(seed_path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        row = conn.execute("SELECT value FROM kb_meta WHERE key = 'seed_hash'").fetchone()
+        if row is not None and row["value"] == digest:
+            return
+
+        data = json.loads(raw)
+        now = datetime.now().isoformat()
+        industries = {DEFAULT_KEY: {"aliases": [], "company_types": {DEFAULT_KEY: data.get("default", [])}}}
+        industries.update({normalize_key(key): value for key, value in data.get("industries", {}).items()})
+
+        aliases = {normalize_key(alias) or DEFAULT_KEY: industry
+                   for industry, entry in industries.items() for alias in [industry, *entry.get("aliases", [])]}
+
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO industry_aliases (alias, industry) VALUES (?, ?)",
+                             aliases.items())
+            for industry, entry in industries.items():
+                for company_type, competitors in entry.get("company_types", {}).items():
+                    company_type = normalize_key(company_type) or DEFAULT_KEY
+                    conn.executemany(
+                        "INSERT INTO competitors (industry, company_type, name, position, focus, pricing, "
+                        "description, website, source, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'seed', ?) "
+                        "ON CONFLICT (industry, company_type, name) DO UPDATE SET position = excluded.position, "
+                        "focus = excluded.focus, pricing = excluded.pricing, description = excluded.description, "
+                        "website = excluded.website, source = 'seed', updated_at = excluded.updated_at",
+                        [(industry, company_type, c["name"], position, c.get("focus", ""), c.get("pricing", ""),
+                          c.get("description", ""), c.get("website", ""), now)
+                         for position, c in enumerate(competitors)]
+                    )
+            # Every seed row still in the file was just written with this load's timestamp
+            conn.execute("DELETE FROM competitors WHERE source = 'seed' AND updated_at != ?", (now,))
+            # An industry learned from searches is its own alias and stays while it has competitors
+            stale = [(r["alias"],) for r in conn.execute("SELECT alias FROM industry_aliases")
+                     if r["alias"] not in aliases]
+            conn.executemany("DELETE FROM industry_aliases WHERE alias = ?1 AND NOT EXISTS "
+                             "(SELECT 1 FROM competitors WHERE industry = ?1)", stale)
+            conn.execute("DELETE FROM industry_trigrams")
+            conn.execute("INSERT INTO industry_trigrams (alias) SELECT alias FROM industry_aliases")
+            conn.execute("INSERT OR REPLACE INTO kb_meta (key, value) VALUES ('seed_hash', ?)", (digest,))
+        print(f"📚 Loaded competitor knowledge base from {os.path.basename(seed_path)}")
+
+    def _resolve(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT industry FROM industry_aliases WHERE alias = ?", (key,)).fetchone()
+        if row is not None:
+            return row["industry"]
+        if key in self._fuzzy:
+            return self._fuzzy[key]
+
+        # Trigram candidates first, then the closest spelling among them
+        industry = None
+        query = _trigram_query(key)
+        if query:
+            candidates = [r["alias"] for r in conn.execute(
+                "SELECT alias FROM industry_trigrams WHERE industry_trigrams MATCH ? ORDER BY rank LIMIT 20",
+                (query,)
+            )]
+            close = difflib.get_close_matches(key, candidates, n=1, cutoff=FUZZY_CUTOFF)
+            if close:
+                industry = conn.execute("SELECT industry FROM industry_aliases WHERE alias = ?",
+                                        (close[0],)).fetchone()["industry"]
+        if len(self._fuzzy) >= FUZZY_CACHE_SIZE:
+            self._fuzzy.clear()
+        self._fuzzy[key] = industry
+        return industry
+
+    def resolve_industry(self, industry: str) -> Optional[str]:
+        """Canonical industry key for a name, synonym or near-miss spelling, or None"""
+        key = normalize_key(industry)
+        if not key:
+            return None
+        with self._lock:
+            return self._resolve(self._connection(), key)
+
+    def competitors(self, industry: str, company_type: str, limit: int = MAX_COMPETITORS) -> List[Dict]:
+        """Best-known competitors: exact company type, else any type in the industry, else the default list"""
+        key = normalize_key(industry)
+        with self._lock:
+            conn = self._connection()
+            resolved = self._resolve(conn, key) if key else None
+            rows = []
+            if resolved:
+                rows = conn.execute(
+                    "SELECT * FROM competitors WHERE industry = ? AND company_type = ? ORDER BY position LIMIT ?",
+                    (resolved, normalize_key(company_type) or DEFAULT_KEY, limit)
+                ).fetchall()
+                if not rows:
+                    rows = conn.execute(
+                        "SELECT * FROM competitors WHERE industry = ? ORDER BY position, company_type LIMIT ?",
+                        (resolved, limit)
+                    ).fetchall()
+            if not rows:
+                rows = conn.execute(
+                    "SELECT * FROM competitors WHERE industry = ? AND company_type = ? ORDER BY position LIMIT ?",
+                    (DEFAULT_KEY, DEFAULT_KEY, limit)
+                ).fetchall()
+        return [{field: row[field] for field in FIELDS if row[field]} for row in rows]
+
+    def add_competitors(self, industry: str, company_type: str, competitors: List[Dict],
+                        source: str = "serper_search") -> int:
+        """Merges competitors found by a search (new industries become lookup keys); returns rows written"""
+        key = normalize_key(industry)
+        company_type = normalize_key(company_type) or DEFAULT_KEY
+        competitors = [c for c in competitors if c.get("name")]
+        if not key or not competitors:
+            return 0
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            conn = self._connection()
+            resolved = self._resolve(conn, key) or key
+            with conn:
+                if conn.execute("INSERT OR IGNORE INTO industry_aliases (alias, industry) VALUES (?, ?)",
+                                (resolved, resolved)).rowcount:
+                    conn.execute("INSERT INTO industry_trigrams (alias) VALUES (?)", (resolved,))
+                    self._fuzzy.clear()
+                # Curated fields win; a search only fills in what is missing and refreshes the rest
+                conn.executemany(
+                    "INSERT INTO competitors (industry, company_type, name, position, focus, pricing, "
+                    "description, website, source, updated_at) "
+                    "VALUES (?1, ?2, ?3, (SELECT COALESCE(MAX(position), -1) + 1 FROM competitors "
+                    "WHERE industry = ?1 AND company_type = ?2), ?4, ?5, ?6, ?7, ?8, ?9) "
+                    "ON CONFLICT (industry, company_type, name) DO UPDATE SET "
+                    "focus = CASE WHEN focus = '' THEN excluded.focus ELSE focus END, "
+                    "pricing = CASE WHEN pricing = '' THEN excluded.pricing ELSE pricing END, "
+                    "description = CASE WHEN excluded.description != '' THEN excluded.description "
+                    "ELSE description END, "
+                    "website = CASE WHEN excluded.website != '' THEN excluded.website ELSE website END, "
+                    "updated_at = excluded.updated_at",
+                    [(resolved, company_type, c["name"], c.get("focus", ""), c.get("pricing", ""),
+                      c.get("description", ""), c.get("website", ""), c.get("source", source), now)
+                     for c in competitors]
+                )
+        return len(competitors)
+
+
+_knowledge_base = None
+_knowledge_base_lock = threading.Lock()
+
+
+def get_knowledge_base() -> CompetitorKnowledgeBase:
+    """Shared knowledge base (COMPETITOR_KB_PATH, seeded from COMPETITOR_DATA_PATH)"""
+    global _knowledge_base
+    with _knowledge_base_lock:
+        if _knowledge_base is None:
+            _knowledge_base = CompetitorKnowledgeBase()
+        return _knowledge_base
@@ -0,0 +1,194 @@
+"""
+Competitor search fan-out over Serper
+One search is expanded into several phrasings x pages x regions. The queries run concurrently
+(at most SEARCH_CONCURRENCY in flight) and their organic results are merged as they arrive,
+deduplicated by domain and by normalized company name. Once SEARCH_TARGET_COMPETITORS distinct
+competitors are known the remaining queries are cancelled, so wall-clock time tracks the
+slowest of a few concurrent batches, not the number of queries.
+"""
+
+import asyncio
+import re
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from config import (SEARCH_CONCURRENCY, SEARCH_PAGES, SEARCH_QUERIES, SEARCH_REGIONS, SEARCH_RESULTS_PER_QUERY,
+                    SEARCH_TARGET_COMPETITORS)
+from metrics import registry
+
+QUERIES = registry.counter("brief_search_queries_total", "Competitor search queries sent to Serper")
+QUERY_ERRORS = registry.counter("brief_search_query_errors_total", "Competitor search queries that failed")
+EARLY_EXITS = registry.counter("brief_search_early_exits_total",
+                               "Competitor searches stopped early because enough competitors were found")
+
+# Publishers, directories and social sites: they rank for "top X companies" but are not competitors
+NON_COMPETITOR_DOMAINS = frozenset(
+    "wikipedia.org forbes.com gartner.com g2.com capterra.com linkedin.com youtube.com medium.com reddit.com "
+    "crunchbase.com techcrunch.com businessinsider.com cnbc.com statista.com quora.com twitter.com x.com "
+    "facebook.com builtin.com trustradius.com softwareadvice.com getapp.com zdnet.com techtarget.com "
+    "ibisworld.com marketsandmarkets.com mordorintelligence.com".split()
+)
+# Two-label public suffixes, so "acme.co.uk" names "acme" and not "co"
+TWO_LABEL_SUFFIXES = frozenset("co.uk com.au co.in co.jp com.br co.nz com.sg".split())
+LEGAL_SUFFIXES = frozenset("inc llc ltd limited corp corporation co gmbh plc sa ag the".split())
+
+TITLE_SEPARATOR_RE = re.compile(r'\s+[-|–—:·]\s+|:\s+')
+LISTICLE_RE = re.compile(r'^\s*(?:the\s+)?(?:top|best|\d+)\b|\b(?:companies|vendors|alternatives|list)\b', re.I)
+NAME_RE = re.compile(r'[^a-z0-9]+')
+MAX_NAME_LENGTH = 40
+
+
+def expand_queries(industry: str, company_type: str, templates: Sequence[str] = None, pages: int = None,
+                   regions: Sequence[str] = None, results: int = SEARCH_RESULTS_PER_QUERY) -> List[Dict]:
+    """Serper payloads for every template x page x region, first page of every phrasing first"""
+    values = {
+        "industry": industry.replace("_", " "),
+        "company_type": company_type.replace("_", " "),
+        "year": datetime.now().year,
+    }
+    queries = [template.format(**values) for template in (templates or SEARCH_QUERIES)]
+    payloads = []
+    for page in range(1, max(pages or SEARCH_PAGES, 1) + 1):
+        for region in (regions or SEARCH_REGIONS):
+            for query in queries:
+                payload = {"q": query, "num": results, "gl": region}
+                if page > 1:
+                    payload["page"] = page
+                payloads.append(payload)
+    return payloads
+
+
+def site_domain(url: str) -> str:
+    """'https://www.databricks.com/x' -> 'databricks.com'"""
+    host = (urlparse(url).hostname or "").lower()
+    labels = host.split(".")
+    keep = 3 if ".".join(labels[-2:]) in TWO_LABEL_SUFFIXES else 2
+    return ".".join(labels[-keep:])
+
+
+def normalize_name(name: str) -> str:
+    """'Databricks, Inc.' / 'databricks' -> 'databricks'"""
+    words = [word for word in NAME_RE.split(name.lower()) if word]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    while len(words) > 1 and words[0] in LEGAL_SUFFIXES:
+        words.pop(0)
+    return "".join(words)
+
+
+def competitor_from_result(result: Dict) -> Optional[Dict]:
+    """Competitor for one organic result, or None for listicles, directories and publishers.
+    The name is the title part that matches the site's domain ("Databricks: The Data and AI
+    Company" on databricks.com -> "Databricks"), else the domain label itself"""
+    link = result.get("link", "")
+    domain = site_domain(link)
+    title = result.get("title", "")
+    if not domain or domain in NON_COMPETITOR_DOMAINS:
+        return None
+
+    # site_domain keeps the registrable part, so its first label is the company's own name
+    label = domain.split(".")[0]
+    label_key = NAME_RE.sub("", label)
+    name = None
+    for part in TITLE_SEPARATOR_RE.split(title):
+        part = part.strip()
+        key = normalize_name(part)
+        if not key or len(part) > MAX_NAME_LENGTH:
+            continue
+        if key in label_key:
+            name = part
+            break
+        if label_key in key:
+            # "DataRobot AI Platform" -> "DataRobot": the shortest leading words naming the site
+            words = part.split()
+            name = next(" ".join(words[:n]) for n in range(1, len(words) + 1)
+                        if label_key in normalize_name(" ".join(words[:n])))
+            break
+    if name is None:
+        # A title that does not name the site is usually a ranking or comparison page
+        if LISTICLE_RE.search(title):
+            return None
+        name = label.replace("-", " ").title()
+    return {
+        "name": name,
+        "description": result.get("snippet", ""),
+        "website": link,
+        "source": "serper_search",
+    }
+
+
+class CompetitorMerger:
+    """Distinct competitors across result pages, ranked by how many queries found them"""
+
+    def __init__(self):
+        self._by_key: Dict[str, Dict] = {}
+        self._keys: Dict[str, str] = {}
+        self._hits: Dict[str, int] = {}
+        self._rank: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def add(self, results: Dict):
+        for position, result in enumerate(results.get("organic", [])):
+            competitor = competitor_from_result(result)
+            if competitor is None:
+                continue
+            domain = site_domain(competitor["website"])
+            name = normalize_name(competitor["name"])
+            # Same site or same company name on another site (regional domain, product page)
+            key = self._keys.get(domain) or self._keys.get(name) or domain
+            self._keys.setdefault(domain, key)
+            self._keys.setdefault(name, key)
+            if key not in self._by_key:
+                self._by_key[key] = competitor
+                self._hits[key] = 0
+                self._rank[key] = position
+            self._hits[key] += 1
+            self._rank[key] = min(self._rank[key], position)
+
+    def competitors(self, limit: Optional[int] = None) -> List[Dict]:
+        keys = sorted(self._by_key, key=lambda key: (-self._hits[key], self._rank[key]))
+        return [self._by_key[key] for key in keys[:limit]]
+
+
+async def fan_out(payloads: Sequence[Dict], fetch: Callable[[Dict], Awaitable[Dict]], timeout: float,
+                  concurrency: int = SEARCH_CONCURRENCY, target: int = SEARCH_TARGET_COMPETITORS) -> List[Dict]:
+    """Runs the searches with bounded parallelism and merges them as they finish; stops at
+    target distinct competitors or after timeout seconds, returning what was found so far.
+    Raises the last error when every query failed"""
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    merger = CompetitorMerger()
+
+    async def run(payload: Dict) -> Dict:
+        async with semaphore:
+            QUERIES.inc()
+            return await fetch(payload)
+
+    loop = asyncio.get_running_loop()
+    end = loop.time() + timeout
+    pending = {asyncio.ensure_future(run(payload)) for payload in payloads}
+    succeeded, error = 0, None
+    try:
+        while pending and len(merger) < target:
+            remaining = end - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    QUERY_ERRORS.inc()
+                    error = task.exception()
+                    continue
+                succeeded += 1
+                merger.add(task.result())
+        if pending and len(merger) >= target:
+            EARLY_EXITS.inc()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if not succeeded and error is not None:
+        raise error
+    return merger.competitors(target)
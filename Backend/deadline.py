@@ -0,0 +1,51 @@
+"""
+Per-request deadlines
+A request gets one deadline (from the client's X-Request-Timeout header or config) that is
+passed down to research, generation, PDF and formatting; each stage asks for the time left.
+"""
+
+import time
+from typing import Optional
+
+from config import REQUEST_DEADLINE_SECONDS
+
+# Header a client can send to ask for a shorter deadline (seconds)
+DEADLINE_HEADER = "X-Request-Timeout"
+
+
+class Deadline:
+    """Point in time a request must be answered by; Deadline(None) never expires"""
+
+    def __init__(self, seconds: Optional[float]):
+        self.seconds = seconds
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    @classmethod
+    def from_header(cls, value: Optional[str], default: float = REQUEST_DEADLINE_SECONDS) -> "Deadline":
+        """Deadline from the client's header, capped at the configured default"""
+        try:
+            seconds = float(value) if value else default
+        except ValueError:
+            seconds = default
+        return cls(min(seconds, default) if seconds > 0 else default)
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float('inf')
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def budget(self, reserve: float = 0.0, cap: Optional[float] = None, share: float = 1.0) -> Optional[float]:
+        """Seconds a stage may take (None = unbounded)
+
+        Keeps `reserve` for later stages and takes at most `share` of what is left after it.
+        Suitable for asyncio.wait_for and requests' timeout argument.
+        """
+        remaining = (self.remaining() - reserve) * share
+        if cap is not None:
+            remaining = min(remaining, cap)
+        if remaining == float('inf'):
+            return None
+        return max(remaining, 0.0)
@@ -0,0 +1,207 @@
+"""
+Hedged upstream calls for Gemini and Serper
+If a call has not answered within a percentile of recently observed latency, a duplicate
+is fired and whichever answers first wins; the slower attempt is cancelled. Extra load is
+capped to a fraction of calls, and hedge rate / wins / latency saved are exported through
+metrics.py.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional
+
+from config import HEDGE_UPSTREAM, HEDGE_PERCENTILE, HEDGE_MAX_RATIO
+from metrics import registry
+
+CALLS = registry.counter("brief_upstream_calls_total", "Upstream calls made (hedges not counted)")
+ERRORS = registry.counter("brief_upstream_errors_total", "Upstream calls that failed on every attempt")
+HEDGES = registry.counter("brief_upstream_hedges_total", "Duplicate requests fired because the first was slow")
+HEDGE_WINS = registry.counter("brief_upstream_hedge_wins_total", "Hedged calls answered first by the duplicate")
+HEDGE_CANCELLED = registry.counter("brief_upstream_hedge_cancelled_total",
+                                   "Slower attempts of hedged calls cancelled once the other answered")
+LATENCY_SAVED = registry.counter("brief_upstream_hedge_latency_saved_seconds_total",
+                                 "Lower bound on latency saved by winning hedges (primary's elapsed time "
+                                 "minus the hedge's latency)")
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """q-th quantile (0-1) of the window, or None with too few samples"""
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+
+class HedgedCaller:
+    """Runs an upstream coroutine, hedging it once it is slower than the latency percentile"""
+
+    def __init__(self, name: str, enabled: bool = HEDGE_UPSTREAM, percentile: float = HEDGE_PERCENTILE,
+                 max_ratio: float = HEDGE_MAX_RATIO, min_samples: int = 20, min_delay: float = 0.05,
+                 window: int = 200):
+        self.name = name
+        self.enabled = enabled
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latency = LatencyTracker(window)
+        # One [hedged] slot per recent call - caps hedges to max_ratio of calls
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or not calibrated yet"""
+        if not self.enabled:
+            return None
+        threshold = self.latency.percentile(self.percentile, self.min_samples)
+        return None if threshold is None else max(threshold, self.min_delay)
+
+    def _take_hedge_budget(self, slot: list) -> bool:
+        """Marks the calling call's own slot as hedged if the ratio allows another hedge"""
+        with self._lock:
+            hedged = sum(hedged for hedged, in self._recent)
+            if (hedged + 1) / (len(self._recent) + 1) > self.max_ratio:
+                return False
+            slot[0] = True
+            return True
+
+    def hedge_rate(self) -> float:
+        with self._lock:
+            return sum(hedged for hedged, in self._recent) / len(self._recent) if self._recent else 0.0
+
+    async def call(self, factory: Callable[[], Awaitable]):
+        """Awaits factory(); fires a second factory() if the first is slower than the hedge delay"""
+        CALLS.inc(upstream=self.name)
+        # Concurrent calls append their own slots, so the newest slot may belong to another call
+        slot = [False]
+        with self._lock:
+            self._recent.append(slot)
+
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(factory())
+        delay = self.hedge_delay()
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self._take_hedge_budget(slot):
+                    return await self._race(primary, factory, start)
+            result = await primary
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        except Exception:
+            ERRORS.inc(upstream=self.name)
+            raise
+
+        self.latency.observe(time.perf_counter() - start)
+        return result
+
+    async def _race(self, primary: asyncio.Future, factory: Callable[[], Awaitable], start: float):
+        """Runs the primary and a hedge, returning the first successful result; the other attempt
+        is cancelled so it does not hold an upstream request (a billed Gemini stream) open"""
+        HEDGES.inc(upstream=self.name)
+        hedge_start = time.perf_counter()
+        hedge = asyncio.ensure_future(factory())
+        started = {primary: start, hedge: hedge_start}
+
+        pending = {primary, hedge}
+        winner, error = None, None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                finished = time.perf_counter()
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    self.latency.observe(finished - started[task])
+                    if winner is None:
+                        winner = task
+                    else:
+                        # Both answered at once - the second result is not used
+                        _release(task.result())
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            raise
+
+        if winner is None:
+            ERRORS.inc(upstream=self.name)
+            raise error
+
+        if winner is hedge:
+            HEDGE_WINS.inc(upstream=self.name)
+            if primary in pending:
+                # The primary would have taken at least as long as it had already run
+                LATENCY_SAVED.inc((finished - start) - (finished - hedge_start), upstream=self.name)
+        for task in pending:
+            task.cancel()
+            task.add_done_callback(_release_result)
+            HEDGE_CANCELLED.inc(upstream=self.name)
+            # All that is known is that it was slower than the winner: counted up to the
+            # cancellation so the window does not only see winners
+            self.latency.observe(finished - started[task])
+
+        return winner.result()
+
+
+def _release(result):
+    """Closes an unused answer (an HTTP response, a stream) if it can be closed"""
+    close = getattr(result, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def _release_result(task: asyncio.Future):
+    # A cancelled attempt can still complete (a thread already running the request); drop its answer
+    if not task.cancelled() and task.exception() is None:
+        _release(task.result())
+
+
+_callers: Dict[str, HedgedCaller] = {}
+_callers_lock = threading.Lock()
+
+
+def get_hedger(name: str) -> HedgedCaller:
+    """Shared caller (and latency window) per upstream"""
+    with _callers_lock:
+        if name not in _callers:
+            _callers[name] = HedgedCaller(name)
+        return _callers[name]
+
+
+def _collect_latency():
+    samples = []
+    for caller in list(_callers.values()):
+        for q in (0.5, 0.95, 0.99):
+            value = caller.latency.percentile(q)
+            if value is not None:
+                samples.append(({"upstream": caller.name, "quantile": str(q)}, value))
+    return samples
+
+
+registry.gauge("brief_upstream_latency_seconds", "Recent upstream latency percentiles", _collect_latency)
+registry.gauge("brief_upstream_hedge_rate", "Fraction of recent upstream calls that were hedged",
+               lambda: [({"upstream": caller.name}, caller.hedge_rate()) for caller in list(_callers.values())])
@@ -0,0 +1,184 @@
+"""
+HTTP caching helpers shared by the Flask and ASGI servers
+Static payloads are serialized and compressed once, then served with strong ETags,
+Cache-Control and 304 answers to If-None-Match.
+"""
+
+import gzip
+import hashlib
+import json
+from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+
+# Brotli is optional - gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Preferred order when the client accepts several encodings equally
+ENCODING_PREFERENCE = ['br', 'gzip', 'identity']
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parses an Accept-Encoding header into {coding: q-value}"""
+    accepted = {}
+    if not header:
+        return accepted
+
+    for part in header.split(','):
+        fields = part.strip().split(';')
+        coding = fields[0].strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in fields[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header: Optional[str], available) -> str:
+    """Picks the best content-coding the client accepts out of the available ones"""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*')
+
+    best, best_q = 'identity', 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available or coding == 'identity':
+            continue
+        q = accepted.get(coding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def etag_matches(if_none_match: Optional[str], etags) -> bool:
+    """Checks an If-None-Match header against our ETags (weak comparison, per RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    ours = {tag[2:] if tag.startswith('W/') else tag for tag in etags}
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate in ours:
+            return True
+    return False
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses a body with the given content-coding"""
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, quality=5)
+    return body
+
+
+def available_encodings() -> list:
+    """Content-codings this process can produce"""
+    return ['br', 'gzip', 'identity'] if brotli is not None else ['gzip', 'identity']
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag derived from the content hash of a body"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of the compressed representation (strong ETags must differ per encoding)"""
+    if encoding == 'identity' or not etag:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def etag_variants(etag: str) -> list:
+    """All ETags a client may hold for a body, one per encoding"""
+    return [encoded_etag(etag, encoding) for encoding in available_encodings()]
+
+
+def encode_response(body: bytes, accept_encoding: Optional[str], min_size: int, etag: Optional[str] = None) -> Tuple[bytes, dict]:
+    """Compresses a dynamic body when it is large enough and the client accepts it
+
+    Returns the (possibly compressed) body and the headers describing it.
+    """
+    headers = {'Vary': 'Accept-Encoding'}
+    encoding = 'identity'
+    if len(body) >= min_size:
+        encoding = negotiate_encoding(accept_encoding, available_encodings())
+
+    if encoding != 'identity':
+        body = compress(body, encoding)
+        headers['Content-Encoding'] = encoding
+    if etag:
+        headers['ETag'] = encoded_etag(etag, encoding)
+    return body, headers
+
+
+def conditional_response(body: bytes, etag: str, if_none_match: Optional[str], accept_encoding: Optional[str], min_size: int) -> Tuple[int, bytes, dict]:
+    """Returns (status, body, headers) for a dynamic body with a known ETag
+
+    Answers 304 when the client already holds any representation of the body,
+    otherwise compresses it per Accept-Encoding.
+    """
+    if etag_matches(if_none_match, etag_variants(etag)):
+        encoding = 'identity'
+        if len(body) >= min_size:
+            encoding = negotiate_encoding(accept_encoding, available_encodings())
+        return 304, b'', {'ETag': encoded_etag(etag, encoding), 'Vary': 'Accept-Encoding'}
+
+    body, headers = encode_response(body, accept_encoding, min_size, etag)
+    return 200, body, headers
+
+
+class StaticPayload:
+    """A JSON payload serialized and compressed once, served with strong ETags"""
+
+    def __init__(self, payload: dict, max_age: int = 300):
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.last_modified = formatdate(usegmt=True)
+        self.cache_control = f"public, max-age={max_age}"
+
+        # Best-effort compression up front - every request afterwards is a dict lookup
+        self.encoded = {'identity': self.body, 'gzip': gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.encoded['br'] = brotli.compress(self.body, quality=11)
+
+        # Strong ETags must differ per representation
+        self.etags = {
+            encoding: f'"{self.digest}"' if encoding == 'identity' else f'"{self.digest}-{encoding}"'
+            for encoding in self.encoded
+        }
+
+    def headers(self, encoding: str) -> dict:
+        """Caching headers for the given representation"""
+        headers = {
+            'ETag': self.etags[encoding],
+            'Cache-Control': self.cache_control,
+            'Last-Modified': self.last_modified,
+            'Vary': 'Accept-Encoding'
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return headers
+
+    def respond(self, if_none_match: Optional[str], accept_encoding: Optional[str]) -> Tuple[int, bytes, dict]:
+        """Returns (status, body, headers) for a request, answering 304 when the client is current"""
+        encoding = negotiate_encoding(accept_encoding, self.encoded)
+
+        if etag_matches(if_none_match, self.etags.values()):
+            headers = self.headers(encoding)
+            headers.pop('Content-Encoding', None)
+            return 304, b'', headers
+
+        return 200, self.encoded[encoding], self.headers(encoding)
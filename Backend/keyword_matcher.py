@@ -0,0 +1,54 @@
+"""
+Multi-keyword matcher shared by the formatter, PDF generator and research agents
+Compiles a keyword list into one regex so a text is scanned once for all keywords,
+keeping substring semantics ("keyword in text") for every entry.
+"""
+
+import re
+from typing import Iterable, List, Optional, Set
+
+
+def _alternation(keywords: Iterable[str]) -> str:
+    """Regex alternation with longer keywords first so prefixes never shadow them"""
+    return '|'.join(re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True))
+
+
+class KeywordMatcher:
+    """Finds every keyword contained in a text in a single pass (case-insensitive)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({keyword.lower() for keyword in keywords if keyword})
+        alternation = _alternation(self.keywords)
+
+        self._any_re = re.compile(alternation) if self.keywords else None
+        # Alternatives are tried longest first, so a match is the longest keyword starting there;
+        # it also implies every keyword it contains
+        self._implied = {keyword: [other for other in self.keywords if other in keyword] for keyword in self.keywords}
+
+    def any_in(self, text: str) -> bool:
+        """True when at least one keyword occurs in the text"""
+        return self._any_re is not None and self._any_re.search(text.lower()) is not None
+
+    def hits(self, text: str) -> Set[str]:
+        """All keywords that occur in the text"""
+        found = set()
+        if self._any_re is None:
+            return found
+
+        # Resume one character after each match start so overlapping keywords
+        # ("ai" inside "campaign") are found, while re still skips ahead between hits
+        text = text.lower()
+        search = self._any_re.search
+        match = search(text)
+        while match:
+            found.update(self._implied[match.group()])
+            match = search(text, match.start() + 1)
+        return found
+
+    def first_group(self, text: str, groups: List[Iterable[str]]) -> Optional[int]:
+        """Index of the first keyword group with a hit in the text, or None"""
+        found = self.hits(text)
+        for index, group in enumerate(groups):
+            if any(keyword.lower() in found for keyword in group):
+                return index
+        return None
@@ -0,0 +1,97 @@
+"""
+Minimal in-process metrics registry
+Counters and gauges with labels, rendered in the Prometheus text format for /metrics.
+"""
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in key) + "}"
+
+
+class Counter:
+    """Monotonic counter, one value per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[LabelKey, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+class Gauge:
+    """Value computed at scrape time by a callback returning {labels: value}"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, collect: Callable[[], List[Tuple[Dict[str, str], float]]]):
+        self.name = name
+        self.help = help_text
+        self._collect = collect
+
+    def samples(self) -> List[Tuple[LabelKey, float]]:
+        return [(_label_key(labels), value) for labels, value in self._collect()]
+
+
+class Registry:
+    """Named metrics for this worker process"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, help_text)
+            return self._metrics[name]
+
+    def gauge(self, name: str, help_text: str, collect: Callable) -> Gauge:
+        with self._lock:
+            self._metrics[name] = Gauge(name, help_text, collect)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, value in metric.samples():
+                lines.append(f"{metric.name}{_format_labels(key)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every module in the worker
+registry = Registry()
+
+# Content type for the /metrics endpoint
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
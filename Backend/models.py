@@ -0,0 +1,278 @@
+"""
+Typed models for research bundles and brief results
+Slotted, frozen dataclasses replace the nested string-keyed dicts that travel between
+the agents, the formatter, the caches and storage. Encode/decode them with codec.py.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Competitor:
+    """One competitor found by search or taken from the simulated database"""
+    name: str
+    focus: str = ""
+    pricing: str = ""
+    description: str = ""
+    website: str = ""
+    source: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Competitor":
+        return cls(
+            name=data.get("name", ""),
+            focus=data.get("focus", ""),
+            pricing=data.get("pricing", ""),
+            description=data.get("description", ""),
+            website=data.get("website", ""),
+            source=data.get("source", "")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompetitorAnalysis:
+    """Output of CompetitorResearchAgent.research_competitors"""
+    top_competitors: Tuple[Competitor, ...]
+    market_positioning: Dict[str, Any]
+    pricing_insights: Dict[str, Any]
+    messaging_patterns: Dict[str, Any]
+    timestamp: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompetitorAnalysis":
+        return cls(
+            top_competitors=tuple(Competitor.from_dict(c) for c in data.get("top_competitors", [])),
+            market_positioning=data.get("market_positioning", {}),
+            pricing_insights=data.get("pricing_insights", {}),
+            messaging_patterns=data.get("messaging_patterns", {}),
+            timestamp=data.get("timestamp", "")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TrendsData:
+    """Output of TrendsResearchAgent.analyze_trends"""
+    industry_trends: Dict[str, Any]
+    audience_trends: Dict[str, Any]
+    seasonal_patterns: Dict[str, Any]
+    emerging_topics: Tuple[str, ...]
+    timestamp: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrendsData":
+        return cls(
+            industry_trends=data.get("industry_trends", {}),
+            audience_trends=data.get("audience_trends", {}),
+            seasonal_patterns=data.get("seasonal_patterns", {}),
+            emerging_topics=tuple(data.get("emerging_topics", [])),
+            timestamp=data.get("timestamp", "")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AudienceInsights:
+    """Output of AudienceResearchAgent.enrich_audience"""
+    demographic_profile: Dict[str, Any]
+    behavioral_insights: Dict[str, Any]
+    channel_preferences: Dict[str, Any]
+    content_consumption: Dict[str, Any]
+    pain_points: Tuple[str, ...]
+    buying_journey: Dict[str, Any]
+    timestamp: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AudienceInsights":
+        return cls(
+            demographic_profile=data.get("demographic_profile", {}),
+            behavioral_insights=data.get("behavioral_insights", {}),
+            channel_preferences=data.get("channel_preferences", {}),
+            content_consumption=data.get("content_consumption", {}),
+            pain_points=tuple(data.get("pain_points", [])),
+            buying_journey=data.get("buying_journey", {}),
+            timestamp=data.get("timestamp", "")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ResearchBundle:
+    """The three research results a brief is generated from"""
+    competitor_analysis: CompetitorAnalysis
+    market_trends: TrendsData
+    audience_insights: AudienceInsights
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResearchBundle":
+        return cls(
+            competitor_analysis=CompetitorAnalysis.from_dict(data.get("competitor_analysis", {})),
+            market_trends=TrendsData.from_dict(data.get("market_trends", {})),
+            audience_insights=AudienceInsights.from_dict(data.get("audience_insights", {}))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BriefSection:
+    """One formatted section as returned to the frontend"""
+    id: int
+    icon: str
+    title: str
+    content: str
+    type: str = "text"
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefSection":
+        return cls(
+            id=data["id"],
+            icon=data["icon"],
+            title=data["title"],
+            content=data["content"],
+            type=data.get("type", "text")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BriefMetadata:
+    """Generation details returned with a brief"""
+    research_time: float
+    agents_used: Tuple[str, ...]
+    total_sections: int
+    output_mode: str = "markdown"
+    degraded: bool = False
+    partial: bool = False
+    profile: str = "standard"
+    decode_failed: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefMetadata":
+        return cls(
+            research_time=data.get("research_time", 0.0),
+            agents_used=tuple(data.get("agents_used", [])),
+            total_sections=data.get("total_sections", 0),
+            output_mode=data.get("output_mode", "markdown"),
+            degraded=data.get("degraded", False),
+            partial=data.get("partial", False),
+            profile=data.get("profile", "standard"),
+            decode_failed=data.get("decode_failed", False)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BriefResult:
+    """The /generate-brief response body"""
+    success: bool
+    timestamp: str
+    sections: Tuple[BriefSection, ...]
+    metadata: BriefMetadata
+    brief_id: Optional[str] = None
+    # Content hash of the research bundle, fetched separately from GET /research/<hash>
+    research_hash: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefResult":
+        return cls(
+            success=data.get("success", True),
+            timestamp=data.get("timestamp", ""),
+            sections=tuple(BriefSection.from_dict(s) for s in data.get("sections", [])),
+            metadata=BriefMetadata.from_dict(data.get("metadata", {})),
+            brief_id=data.get("brief_id"),
+            research_hash=data.get("research_hash")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BriefSummary:
+    """A stored brief in listings (GET /briefs)"""
+    brief_id: str
+    created_at: str
+    company: Optional[str]
+    industry: Optional[str]
+    profile: Optional[str]
+    inputs_hash: str
+    research_hash: Optional[str] = None
+    research_seconds: Optional[float] = None
+    generation_seconds: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefSummary":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True, slots=True)
+class BriefPage:
+    """One page of GET /briefs; pass next_cursor back as ?cursor= for the next page"""
+    success: bool
+    briefs: Tuple[BriefSummary, ...]
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefPage":
+        return cls(
+            success=data.get("success", True),
+            briefs=tuple(BriefSummary.from_dict(b) for b in data.get("briefs", [])),
+            next_cursor=data.get("next_cursor")
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BriefSearchHit:
+    """A stored brief matching a search, with a highlighted snippet"""
+    brief_id: str
+    created_at: str
+    company: Optional[str]
+    industry: Optional[str]
+    profile: Optional[str]
+    score: float
+    snippet: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefSearchHit":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True, slots=True)
+class BriefSearchResults:
+    """GET /briefs/search response"""
+    success: bool
+    query: str
+    hits: Tuple[BriefSearchHit, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BriefSearchResults":
+        return cls(
+            success=data.get("success", True),
+            query=data.get("query", ""),
+            hits=tuple(BriefSearchHit.from_dict(h) for h in data.get("hits", []))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SimilarBrief:
+    """A stored brief generated from inputs similar to a request's"""
+    brief_id: str
+    created_at: str
+    company: Optional[str]
+    industry: Optional[str]
+    profile: Optional[str]
+    similarity: float
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimilarBrief":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True, slots=True)
+class SimilarBriefs:
+    """POST /briefs/similar response"""
+    success: bool
+    threshold: float
+    hits: Tuple[SimilarBrief, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimilarBriefs":
+        return cls(
+            success=data.get("success", True),
+            threshold=data.get("threshold", 0.0),
+            hits=tuple(SimilarBrief.from_dict(h) for h in data.get("hits", []))
+        )
@@ -7,6 +7,9 @@ from typing import Dict, Any
 import json
 import os
 
+from brief_document import BriefDocument, parse_brief_document
+from keyword_matcher import KeywordMatcher
+
 # Solo ReportLab - más confiable para hackathons
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -17,11 +20,12 @@ try:
     from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
     from reportlab.pdfgen import canvas
     from reportlab.lib import colors
-    print("✅ ReportLab importado correctamente")
 except ImportError as e:
-    print(f"❌ Error importando ReportLab: {e}")
-    print("💡 Instala con: pip install reportlab")
-    exit(1)
+    # Sin efectos secundarios al importar: quien llama decide cómo manejar la falta de ReportLab
+    raise ImportError(f"ReportLab es necesario para generar PDFs (pip install reportlab): {e}") from e
+
+# Palabras clave compiladas una sola vez (un solo escaneo por título)
+HIGHLIGHT_KEYWORDS = KeywordMatcher(['objective', 'key message', 'diferenciador'])
 
 class EdgeVerveBrandColors:
     """Colores EdgeVerve actualizados - Branding oficial"""
@@ -46,9 +50,14 @@ class EdgeVerveBrandColors:
 class SimplePDFGenerator:
     """Generador PDF simplificado para hackathons"""
     
+    # Hoja de estilos compartida: se crea una vez por proceso (solo lectura al renderizar)
+    _shared_styles = None
+    
     def __init__(self):
         self.colors = EdgeVerveBrandColors()
-        self.styles = self._create_styles()
+        if SimplePDFGenerator._shared_styles is None:
+            SimplePDFGenerator._shared_styles = self._create_styles()
+        self.styles = SimplePDFGenerator._shared_styles
     
     def _create_styles(self):
         """Crea estilos profesionales EdgeVerve con branding actualizado"""
@@ -167,7 +176,8 @@ class SimplePDFGenerator:
         
         return styles
     
-    def generate_brief_pdf(self, brief_content: str, stakeholder_data: Dict, research_data: Dict = None, output_path: str = None) -> str:
+    def generate_brief_pdf(self, brief_content: str, stakeholder_data: Dict, research_data: Dict = None, output_path: str = None,
+                           brief_document: BriefDocument = None) -> str:
         """
         Genera PDF del creative brief con branding EdgeVerve
         
@@ -176,6 +186,7 @@ class SimplePDFGenerator:
             stakeholder_data: Datos de stakeholders
             research_data: Datos de research (opcional)
             output_path: Ruta de salida (opcional)
+            brief_document: Brief ya parseado (opcional, se reutiliza en vez de parsear de nuevo)
             
         Returns:
             str: Ruta del PDF generado
@@ -206,7 +217,7 @@ class SimplePDFGenerator:
         story.extend(self._create_header(stakeholder_data))
         
         # 2. Contenido principal del brief
-        story.extend(self._create_main_content(brief_content))
+        story.extend(self._create_main_content(brief_document or parse_brief_document(brief_content)))
         
         # 3. Research insights (si existen)
         if research_data:
@@ -296,16 +307,16 @@ class SimplePDFGenerator:
         
         return story
     
-    def _create_main_content(self, brief_content: str) -> list:
+    def _create_main_content(self, document: BriefDocument) -> list:
         """Procesa y formatea el contenido principal con estilo EdgeVerve"""
         story = []
         
-        # Dividir contenido en secciones
-        sections = self._parse_brief_content(brief_content)
+        # Secciones del documento ya parseado (mismas que ve la API)
+        sections = document.sections
         
-        for i, (section_title, section_content) in enumerate(sections):
+        for i, section in enumerate(sections):
             # Título de sección con línea decorativa
-            section_title_clean = section_title.replace('**', '').strip()
+            section_title_clean = section.title
             
             # Crear título con línea cian
             title_data = [[f"📋 {section_title_clean.upper()}"]]
@@ -326,33 +337,30 @@ class SimplePDFGenerator:
             story.append(Spacer(1, 10))
             
             # Contenido de la sección
-            if section_content.strip():
+            if section.lines:
                 # Detectar si es contenido destacado (objetivos, insights, etc.)
-                is_highlight = any(keyword in section_title.lower() 
-                                for keyword in ['objective', 'key message', 'diferenciador'])
+                is_highlight = HIGHLIGHT_KEYWORDS.any_in(section_title_clean)
                 
                 style_to_use = self.styles['Highlight'] if is_highlight else self.styles['EdgeVerveBodyText']
                 
-                # Procesar subsecciones si existen
-                if self._has_subsections(section_content):
-                    subsections = self._parse_subsections(section_content)
-                    for sub_title, sub_content in subsections:
-                        if sub_title:
-                            story.append(Paragraph(
-                                f"<font color='#00BFFF'><b>▶</b></font> <b>{sub_title}</b>",
-                                self.styles['SubHeader']
-                            ))
-                        if sub_content:
-                            story.append(Paragraph(
-                                self._format_content(sub_content),
-                                self.styles['EdgeVerveBodyText']
-                            ))
-                            story.append(Spacer(1, 8))
-                else:
+                if section.intro:
                     story.append(Paragraph(
-                        self._format_content(section_content),
+                        self._format_blocks(section.intro),
                         style_to_use
                     ))
+                
+                # Procesar subsecciones si existen
+                for subsection in section.subsections:
+                    story.append(Paragraph(
+                        f"<font color='#00BFFF'><b>▶</b></font> <b>{self._format_runs(subsection.heading.runs)}</b>",
+                        self.styles['SubHeader']
+                    ))
+                    if subsection.blocks:
+                        story.append(Paragraph(
+                            self._format_blocks(subsection.blocks),
+                            self.styles['EdgeVerveBodyText']
+                        ))
+                        story.append(Spacer(1, 8))
             
             story.append(Spacer(1, 20))
             
@@ -369,131 +377,33 @@ class SimplePDFGenerator:
         
         return story
     
-    def _parse_brief_content(self, content: str) -> list:
-        """Parsea el contenido del brief en secciones"""
-        sections = []
-        current_section = ""
-        current_content = ""
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Detectar títulos de sección (líneas que terminan con ** o son títulos evidentes)
-            if (line.startswith('**') and line.endswith('**')) or \
-               any(keyword in line.lower() for keyword in ['objective', 'audience', 'background', 'problem', 'solution', 'channel']):
-                
-                # Guardar sección anterior
-                if current_section:
-                    sections.append((current_section, current_content))
-                
-                # Iniciar nueva sección
-                current_section = line.replace('**', '').strip()
-                current_content = ""
-            else:
-                current_content += line + "\n"
-        
-        # Agregar última sección
-        if current_section:
-            sections.append((current_section, current_content))
-        
-        return sections
+    def _format_blocks(self, blocks: list) -> str:
+        """Convierte bloques parseados en markup de ReportLab (una línea por bloque)"""
+        lines = []
+        for block in blocks:
+            line = self._format_runs(block.runs)
+            if block.kind == 'bullet':
+                line = f"&#8226; {line}"
+            lines.append(line)
+        return '<br/>'.join(lines)
     
-    def _has_subsections(self, content: str) -> bool:
-        """Detecta si el contenido tiene subsecciones"""
-        return any(line.strip().startswith(('1.', '2.', '3.', 'A.', 'B.', 'C.')) 
-                  for line in content.split('\n'))
-    
-    def _parse_subsections(self, content: str) -> list:
-        """Parsea subsecciones dentro de una sección"""
-        subsections = []
-        current_sub = ""
-        current_content = ""
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    def _format_runs(self, runs: list) -> str:
+        """Texto inline escapado, con <b>/<i> solo para marcas bien emparejadas"""
+        parts = []
+        for run in runs:
+            # Escape HTML special characters
+            text = run.text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            text = text.replace('•', '&#8226;')
             
-            # Detectar subsección
-            if line.startswith(('1.', '2.', '3.', 'A.', 'B.', 'C.', '•', '*')):
-                if current_sub:
-                    subsections.append((current_sub, current_content))
-                
-                current_sub = line
-                current_content = ""
-            else:
-                current_content += line + "\n"
-        
-        if current_sub:
-            subsections.append((current_sub, current_content))
-        
-        return subsections
-    
-    def _format_content(self, content: str) -> str:
-        """Clean content to avoid HTML parsing errors"""
-        import re
-        
-        # First, clean the content completely
-        formatted = content.strip()
-        
-        # Remove any existing HTML/XML tags to start fresh
-        formatted = re.sub(r'<[^>]*>', '', formatted)
-        
-        # Escape HTML special characters
-        formatted = formatted.replace('&', '&amp;')
-        formatted = formatted.replace('<', '&lt;')
-        formatted = formatted.replace('>', '&gt;')
-        
-        # Handle bullet points and special characters
-        formatted = formatted.replace('•', '&#8226;')
-        formatted = formatted.replace('- ', '&#8226; ')
-        
-        # Remove any problematic unicode characters that might cause issues
-        formatted = formatted.encode('ascii', 'ignore').decode('ascii')
-        
-        # Convert basic markdown-style formatting CAREFULLY
-        # Only handle properly paired markers
-        lines = formatted.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Handle bold text - ensure proper pairing
-            while '**' in line:
-                first_pos = line.find('**')
-                if first_pos != -1:
-                    second_pos = line.find('**', first_pos + 2)
-                    if second_pos != -1:
-                        # Found a pair
-                        before = line[:first_pos]
-                        bold_text = line[first_pos + 2:second_pos]
-                        after = line[second_pos + 2:]
-                        line = before + f'<b>{bold_text}</b>' + after
-                    else:
-                        # No closing **, remove the opening one
-                        line = line.replace('**', '', 1)
-                        
-            # Handle italic text
-            while '*' in line and '**' not in line:
-                first_pos = line.find('*')
-                if first_pos != -1:
-                    second_pos = line.find('*', first_pos + 1)
-                    if second_pos != -1:
-                        before = line[:first_pos]
-                        italic_text = line[first_pos + 1:second_pos]
-                        after = line[second_pos + 1:]
-                        line = before + f'<i>{italic_text}</i>' + after
-                    else:
-                        line = line.replace('*', '', 1)
-                        
-            cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+            # Remove any problematic unicode characters that might cause issues
+            text = text.encode('ascii', 'ignore').decode('ascii')
+            
+            if run.bold:
+                text = f"<b>{text}</b>"
+            elif run.italic:
+                text = f"<i>{text}</i>"
+            parts.append(text)
+        return ''.join(parts)
     
     def _create_research_section(self, research_data: Dict) -> list:
         """Crea sección con insights de research con estilo EdgeVerve"""
@@ -645,7 +555,8 @@ class SimplePDFGenerator:
 # FUNCIÓN SIMPLIFICADA PARA INTEGRACIÓN
 # =============================================================================
 
-def generate_pdf_from_brief(brief_content: str, stakeholder_inputs: Dict, research_data: Dict = None, output_path: str = None) -> str:
+def generate_pdf_from_brief(brief_content: str, stakeholder_inputs: Dict, research_data: Dict = None, output_path: str = None,
+                            brief_document: BriefDocument = None) -> str:
     """
     Función simplificada para generar PDF desde el sistema agentic
     
@@ -654,6 +565,7 @@ def generate_pdf_from_brief(brief_content: str, stakeholder_inputs: Dict, resear
         stakeholder_inputs: Datos de stakeholders
         research_data: Datos de research (opcional)
         output_path: Ruta de salida (opcional)
+        brief_document: Brief ya parseado (opcional)
         
     Returns:
         str: Ruta del archivo PDF generado
@@ -665,7 +577,8 @@ def generate_pdf_from_brief(brief_content: str, stakeholder_inputs: Dict, resear
         brief_content=brief_content,
         stakeholder_data=stakeholder_inputs,
         research_data=research_data,
-        output_path=output_path
+        output_path=output_path,
+        brief_document=brief_document
     )
 
 # =============================================================================
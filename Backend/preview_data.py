@@ -0,0 +1,144 @@
+"""
+Sample brief sections served by the preview endpoints
+Shared by api_server, asgi_server and simple_server so every backend returns the same preview
+"""
+
+PREVIEW_SECTIONS = [
+    {
+        "id": 1,
+        "icon": "🎯",
+        "title": "Business Objective",
+        "content": "<strong>Primary Goal:</strong> Establish EdgeVerve as the leading provider of Applied AI solutions for enterprises<br><strong>Target Market:</strong> Large enterprises ($1B-$5B revenue) in financial, healthcare, and manufacturing sectors<br><strong>Success Metrics:</strong> 15% market share increase, $50M ARR growth, 500+ enterprise customers within 12 months",
+        "type": "text"
+    },
+    {
+        "id": 2,
+        "icon": "📈",
+        "title": "Marketing Objective",
+        "content": "<strong>1. Platform Brand Awareness:</strong> Increase EdgeVerve brand recognition among enterprise CIOs by 40%<br><strong>2. Lead Generation:</strong> Generate 500+ qualified enterprise leads quarterly<br><strong>3. Thought Leadership:</strong> Position EdgeVerve as the go-to expert in enterprise AI implementation and governance",
+        "type": "text"
+    },
+    {
+        "id": 3,
+        "icon": "📋",
+        "title": "Background",
+        "content": "EdgeVerve operates in the rapidly growing enterprise AI market, serving large corporations ($1B-$5B revenue) seeking to scale AI beyond experimentation. The market demands unified platforms that can democratize AI across organizations while maintaining enterprise-grade security and governance.<br><strong>Market Size:</strong> $50B by 2025<br><strong>Growth Rate:</strong> 67% YoY",
+        "type": "text"
+    },
+    {
+        "id": 4,
+        "icon": "👥",
+        "title": "Target Audience",
+        "content": "<strong>Primary Audience:</strong> CIOs and CIO-1 of large enterprises<br><strong>Demographics:</strong> 35-55 years, Graduate degree, $150K-$300K income<br><strong>Company Profile:</strong> $1B-$5B revenue companies in financial services, healthcare, and manufacturing<br><strong>Pain Points:</strong> AI scaling challenges, Data silos, Legacy integration, Governance concerns",
+        "type": "text"
+    },
+    {
+        "id": 5,
+        "icon": "❗",
+        "title": "The Problem we are trying to solve",
+        "content": "Enterprise organizations struggle to scale AI initiatives beyond proof-of-concept stage due to fragmented systems, data silos, lack of governance frameworks, and insufficient technical expertise to implement enterprise-grade AI solutions that deliver measurable business value.",
+        "type": "text"
+    },
+    {
+        "id": 6,
+        "icon": "⚠️",
+        "title": "What are the challenges?",
+        "content": "• <strong>Technical Complexity:</strong> Integrating AI with existing enterprise systems<br>• <strong>Data Fragmentation:</strong> Siloed data across departments and systems<br>• <strong>Governance & Compliance:</strong> Ensuring AI solutions meet regulatory requirements<br>• <strong>Skills Gap:</strong> Lack of internal AI expertise and resources<br>• <strong>ROI Uncertainty:</strong> Difficulty demonstrating clear business value",
+        "type": "text"
+    },
+    {
+        "id": 7,
+        "icon": "💡",
+        "title": "Solutions/Offering",
+        "content": "<strong>EdgeVerve AI Platform Features:</strong><br>• <strong>PolyAI Technology:</strong> Multi-model flexibility and vendor-agnostic approach<br>• <strong>Enterprise Integration:</strong> Seamless connection with existing systems<br>• <strong>Built-in Governance:</strong> Comprehensive AI ethics and compliance frameworks<br>• <strong>Cloud-Agnostic Deployment:</strong> Works across AWS, Azure, GCP<br>• <strong>AI Democratization:</strong> No-code/low-code tools for business users",
+        "type": "text"
+    },
+    {
+        "id": 8,
+        "icon": "🚀",
+        "title": "Why EdgeVerve (Platform)?",
+        "content": "• <strong>Proven Enterprise Focus:</strong> Purpose-built for large organization requirements<br>• <strong>Rapid ROI:</strong> 6-month average time to value vs. 18+ months for custom solutions<br>• <strong>Scalable Architecture:</strong> Handles enterprise-scale data and user volumes<br>• <strong>Security First:</strong> Built-in enterprise-grade security and compliance<br>• <strong>Innovation Speed:</strong> Continuous platform updates and latest AI model integration",
+        "type": "text"
+    },
+    {
+        "id": 9,
+        "icon": "🏢",
+        "title": "Why does Enterprise need this solution?",
+        "content": "Modern enterprises require AI solutions that can scale across the organization, integrate with existing infrastructure, comply with regulatory requirements, and deliver measurable business outcomes while democratizing AI access across different skill levels and departments.",
+        "type": "text"
+    },
+    {
+        "id": 10,
+        "icon": "📊",
+        "title": "Present market trend and demand",
+        "content": "<strong>Market Growth:</strong> +67% YoY<br><strong>Rising Demand:</strong> Enterprise AI platforms +156%, MLOps solutions +134%, AI governance +89%<br><strong>Key Trends:</strong> Generative AI for enterprise, AI governance, Federated learning, Responsible AI<br><strong>Investment Focus:</strong> Enterprise AI platforms expected to reach $50B market size by 2025",
+        "type": "text"
+    },
+    {
+        "id": 11,
+        "icon": "📋",
+        "title": "Agency Statement of Work (SOW)",
+        "content": "<strong>Phase 1:</strong> Brand positioning and messaging framework (4 weeks)<br><strong>Phase 2:</strong> Multi-channel campaign development and asset creation (6 weeks)<br><strong>Phase 3:</strong> Campaign launch and optimization (8 weeks)<br><strong>Phase 4:</strong> Performance analysis and scaling (4 weeks)<br><strong>Deliverables:</strong> Brand guidelines, campaign assets, content library, performance dashboard",
+        "type": "text"
+    },
+    {
+        "id": 12,
+        "icon": "🎯",
+        "title": "Key messages across Levels (L1 to L4)",
+        "content": "<strong>L1 (Executive):</strong> Transform your enterprise with unified AI that scales<br><strong>L2 (Technical Leaders):</strong> Enterprise-grade AI platform with built-in governance and security<br><strong>L3 (IT Teams):</strong> Seamlessly integrate AI across your existing infrastructure<br><strong>L4 (Business Users):</strong> Democratize AI with no-code tools that deliver real business value",
+        "type": "text"
+    },
+    {
+        "id": 13,
+        "icon": "🎨",
+        "title": "Campaign Theme, Approach/Outline/Creative Strategy",
+        "content": "<strong>Theme:</strong> AI That Scales, Secures, and Succeeds<br><strong>Approach:</strong> Executive-focused thought leadership combined with technical proof points<br><strong>Creative Strategy:</strong> Position EdgeVerve as the bridge between AI innovation and enterprise reality<br><strong>Key Pillars:</strong> Trust, Scale, Innovation, Results<br><strong>Tone:</strong> Professional, confident, results-oriented",
+        "type": "text"
+    },
+    {
+        "id": 14,
+        "icon": "🖼️",
+        "title": "Digital Assets (Banners, Microsite, Infographics, Email Designs)",
+        "content": "<strong>Banners:</strong> Executive-focused LinkedIn/Google Ads (5 standard sizes)<br><strong>Microsite:</strong> Interactive AI ROI calculator and platform demo<br><strong>Infographics:</strong> AI implementation roadmap, ROI comparison charts<br><strong>Email Designs:</strong> Executive briefing templates, technical deep-dive series<br><strong>Interactive Tools:</strong> AI readiness assessment, implementation timeline calculator",
+        "type": "text"
+    },
+    {
+        "id": 15,
+        "icon": "🎬",
+        "title": "Digital Campaign Videos",
+        "content": "<strong>Executive Testimonials:</strong> C-level customers sharing transformation stories (2-3 min)<br><strong>Platform Demos:</strong> Technical walkthroughs and use case demonstrations (5-7 min)<br><strong>Thought Leadership:</strong> Industry expert interviews and trend analysis (3-5 min)<br><strong>Case Study Videos:</strong> Real customer implementation journeys (4-6 min)<br><strong>Social Media Clips:</strong> Quick wins and key insights for LinkedIn (30-60 sec)",
+        "type": "text"
+    },
+    {
+        "id": 16,
+        "icon": "🤖",
+        "title": "AI / Tech Enabled Ideas",
+        "content": "<strong>AI-Powered Personalization:</strong> Dynamic content adaptation based on visitor profile and industry<br><strong>Predictive Lead Scoring:</strong> ML-driven qualification and nurturing recommendations<br><strong>Intelligent Chatbots:</strong> Industry-specific AI assistants for technical questions<br><strong>Dynamic ROI Calculators:</strong> Real-time business impact modeling<br><strong>Automated Content Generation:</strong> Personalized case studies and implementation guides",
+        "type": "text"
+    },
+    {
+        "id": 17,
+        "icon": "📱",
+        "title": "Channels / Campaign Digital Mediums",
+        "content": "<strong>Primary Channels:</strong> LinkedIn sponsored content, Industry publications, Google Ads<br><strong>Secondary Channels:</strong> YouTube demos, Webinar series, Email sequences<br><strong>Content Distribution:</strong> Thought leadership articles, technical whitepapers, interactive demos<br><strong>Engagement Strategy:</strong> Account-based marketing for top 100 enterprise prospects<br><strong>Measurement:</strong> Pipeline influence, engagement scores, brand lift studies",
+        "type": "text"
+    }
+]
+
+
+def build_preview_payload() -> dict:
+    """Builds the /brief-preview response payload
+    
+    The payload is static so it can be serialized, compressed and ETagged once;
+    freshness is carried by the Last-Modified / ETag headers instead of a body timestamp.
+    """
+    return {
+        "success": True,
+        "preview": True,
+        "sections": PREVIEW_SECTIONS,
+        "metadata": {
+            "total_sections": len(PREVIEW_SECTIONS),
+            "sample_data": True,
+            "structure": "Required 17-section format maintained"
+        }
+    }
@@ -0,0 +1,55 @@
+"""
+Generation profiles (latency tiers) selectable per request
+Each profile picks the Gemini model, the output length per section, the temperature, whether
+competitors are searched live and whether a PDF is rendered.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from config import DEFAULT_PROFILE
+from metrics import registry
+
+RESEARCH_AGENTS = ("competitor", "trends", "audience")
+
+PROFILE_BRIEFS = registry.counter("brief_profile_briefs_total", "Briefs generated per profile")
+PROFILE_SECONDS = registry.counter("brief_profile_generation_seconds_total",
+                                   "Time spent generating briefs per profile (divide by briefs for the mean)")
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationProfile:
+    """How much time and model effort a brief gets"""
+    name: str
+    model: str
+    section_tokens: int
+    temperature: float
+    # Trends and audience research are offline lookups and always run; without "competitor" the
+    # competitor agent reads its offline catalog instead of searching
+    agents: Tuple[str, ...] = RESEARCH_AGENTS
+    render_pdf: bool = True
+
+    def max_output_tokens(self, sections: int) -> int:
+        return self.section_tokens * sections
+
+    def section_words(self) -> int:
+        """Rough word budget per section for the prompt (~0.75 words per token)"""
+        return int(self.section_tokens * 0.75)
+
+
+PROFILES = {
+    # Ideation drafts in a few seconds: small model, short sections, no live search, no PDF
+    "fast": GenerationProfile("fast", "gemini-2.0-flash-lite", section_tokens=150, temperature=0.9,
+                              agents=("trends", "audience"), render_pdf=False),
+    "standard": GenerationProfile("standard", "gemini-2.0-flash", section_tokens=400, temperature=0.7),
+    # Final deliverables
+    "deep": GenerationProfile("deep", "gemini-2.5-pro", section_tokens=800, temperature=0.4),
+}
+
+
+def get_profile(name: Optional[str] = None) -> GenerationProfile:
+    """Profile by name (DEFAULT_PROFILE when empty); raises ValueError for unknown names"""
+    name = (name or DEFAULT_PROFILE).strip().lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown profile '{name}' (choose from: {', '.join(PROFILES)})")
+    return PROFILES[name]
@@ -0,0 +1,91 @@
+"""
+Compiled section matcher for BriefFormatter
+Built once per set of required sections: header-to-section assignment uses a precomputed
+keyword -> section index, so each header is scanned once instead of once per
+section x pattern x keyword.
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set
+
+from keyword_matcher import KeywordMatcher
+
+# Section title phrase -> keywords a header must contain (at least half of them)
+MATCH_PATTERNS = {
+    'business objective': ['business', 'objective'],
+    'marketing objective': ['marketing', 'objective'],
+    'background': ['background', 'context'],
+    'target audience': ['target', 'audience', 'persona'],
+    'problem we are trying to solve': ['problem', 'solve', 'trying'],
+    'challenges': ['challenge', 'obstacles'],
+    'solutions/offering': ['solution', 'offering', 'product'],
+    'why xyz (platform)': ['why', 'platform', 'edgeverve'],
+    'why does enterprise need': ['enterprise', 'need'],
+    'market trend and demand': ['market', 'trend', 'demand'],
+    'statement of work': ['statement', 'work', 'sow'],
+    'key messages across levels': ['message', 'level', 'l1', 'l2'],
+    'campaign theme': ['campaign', 'theme', 'creative', 'strategy'],
+    'digital assets': ['digital', 'assets', 'banner', 'microsite'],
+    'digital campaign videos': ['video', 'campaign'],
+    'ai / tech enabled ideas': ['ai', 'tech', 'enabled', 'ideas'],
+    'channels / campaign digital mediums': ['channel', 'mediums', 'digital']
+}
+
+
+class SectionMatcher:
+    """Assigns brief headers to the required sections in one linear pass"""
+
+    def __init__(self, section_titles: List[str]):
+        self.section_count = len(section_titles)
+        self.pattern_matcher = KeywordMatcher(keyword for group in MATCH_PATTERNS.values() for keyword in group)
+
+        # Each rule is one (section, pattern) pair with its threshold
+        self._rule_section: List[int] = []
+        self._rule_threshold: List[int] = []
+        self._always: List[int] = []
+        self._keyword_rules: Dict[str, List[int]] = defaultdict(list)
+
+        for section_index, title in enumerate(section_titles):
+            target = title.lower()
+            for pattern_key, pattern_keywords in MATCH_PATTERNS.items():
+                if pattern_key not in target:
+                    continue
+                rule_id = len(self._rule_section)
+                threshold = len(pattern_keywords) // 2
+                self._rule_section.append(section_index)
+                self._rule_threshold.append(threshold)
+                if threshold == 0:
+                    self._always.append(rule_id)
+                for keyword in pattern_keywords:
+                    self._keyword_rules[keyword].append(rule_id)
+
+    def sections_for_header(self, header: str) -> Set[int]:
+        """Indexes of every section a header matches"""
+        counts = defaultdict(int)
+        for keyword in self.pattern_matcher.hits(header):
+            for rule_id in self._keyword_rules[keyword]:
+                counts[rule_id] += 1
+
+        sections = {self._rule_section[rule_id] for rule_id in self._always}
+        for rule_id, count in counts.items():
+            if count >= self._rule_threshold[rule_id]:
+                sections.add(self._rule_section[rule_id])
+        return sections
+
+    def assign(self, headers: Iterable[str]) -> Dict[int, str]:
+        """Maps section index -> first header (in document order) that matches it"""
+        assigned = {}
+        for header in headers:
+            for section_index in self.sections_for_header(header):
+                if section_index not in assigned:
+                    assigned[section_index] = header
+            if len(assigned) == self.section_count:
+                break
+        return assigned
+
+
+@lru_cache(maxsize=8)
+def get_section_matcher(section_titles: tuple) -> SectionMatcher:
+    """Shared matcher per set of section titles (compiled once per process)"""
+    return SectionMatcher(list(section_titles))
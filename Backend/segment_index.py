@@ -0,0 +1,111 @@
+"""
+Audience segment matching for AudienceResearchAgent
+Segments come from audience_segments.json, each with weighted keywords (single words or short
+phrases). An inverted index maps every keyword to the segments that use it, so matching looks up
+the words and phrases of the audience text and only touches the segments they point to - the cost
+follows the length of the text, not the number of segments. Each keyword's weight is scaled by how
+rare it is across segments: "professional" alone says little, "healthcare professional" a lot.
+"""
+
+import json
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import AUDIENCE_SEGMENTS_PATH
+from text_utils import tokenize
+
+# Score the best segment needs before it is preferred over the default profile
+MIN_SCORE = 0.5
+
+
+def phrases(tokens: List[str], max_words: int) -> Iterable[str]:
+    """Every run of 1..max_words consecutive tokens, space-joined"""
+    for n in range(1, max_words + 1):
+        for i in range(len(tokens) - n + 1):
+            yield " ".join(tokens[i:i + n])
+
+
+class SegmentIndex:
+    """Inverted index from keyword (word or phrase) to (segment, weight) postings"""
+
+    def __init__(self, segments: Dict[str, Dict], default: Dict):
+        self.keys: List[str] = list(segments)
+        self.default = default
+        self._profiles = [
+            {"primary_segment": entry.get("label") or key.replace('_', ' ').title(), **entry.get("profile", {})}
+            for key, entry in segments.items()
+        ]
+
+        # Keywords default to the words of the key ("small_business_owners" -> small, business, owner)
+        keywords: List[Dict[str, float]] = []
+        for key, entry in segments.items():
+            raw = entry.get("keywords") or {word: 1.0 for word in key.split('_')}
+            normalized: Dict[str, float] = {}
+            for keyword, weight in raw.items():
+                term = " ".join(tokenize(keyword))
+                if term:
+                    normalized[term] = max(normalized.get(term, 0.0), float(weight))
+            keywords.append(normalized)
+
+        document_frequency: Dict[str, int] = {}
+        for normalized in keywords:
+            for term in normalized:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+
+        # idf scaled to (0, 1]: a keyword only one segment uses keeps its full weight
+        count = len(keywords)
+        scale = math.log(1 + count) if count > 1 else 1.0
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for segment, normalized in enumerate(keywords):
+            for term, weight in normalized.items():
+                idf = math.log(1 + count / document_frequency[term]) / scale if count > 1 else 1.0
+                self.postings.setdefault(term, []).append((segment, weight * idf))
+        self.max_words = max((term.count(" ") + 1 for term in self.postings), default=1)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SegmentIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("segments", {}), data.get("default", {}))
+
+    def scores(self, text: str) -> Dict[int, float]:
+        """Summed keyword weight per segment; each distinct keyword counts once"""
+        scores: Dict[int, float] = {}
+        for term in set(phrases(tokenize(text), self.max_words)):
+            for segment, weight in self.postings.get(term, ()):
+                scores[segment] = scores.get(segment, 0.0) + weight
+        return scores
+
+    def _best(self, text: str, min_score: float) -> Optional[Tuple[int, float]]:
+        scores = self.scores(text)
+        if not scores:
+            return None
+        # Highest score, earlier segments winning ties
+        segment = min(scores, key=lambda s: (-scores[s], s))
+        if scores[segment] < min_score:
+            return None
+        return segment, scores[segment]
+
+    def match(self, text: str, min_score: float = MIN_SCORE) -> Optional[Tuple[str, float]]:
+        """(segment key, score) of the best-scoring segment, or None"""
+        best = self._best(text, min_score)
+        return (self.keys[best[0]], best[1]) if best is not None else None
+
+    def profile(self, text: str) -> Dict:
+        """Demographic profile of the best segment for an audience description, or the default one"""
+        best = self._best(text, MIN_SCORE)
+        return dict(self._profiles[best[0]] if best is not None else self.default)
+
+
+_segment_index = None
+_segment_index_lock = threading.Lock()
+
+
+def get_segment_index() -> SegmentIndex:
+    """Shared index built from AUDIENCE_SEGMENTS_PATH on first use"""
+    global _segment_index
+    with _segment_index_lock:
+        if _segment_index is None:
+            _segment_index = SegmentIndex.from_file(AUDIENCE_SEGMENTS_PATH)
+        return _segment_index
@@ -0,0 +1,254 @@
+"""
+Near-duplicate lookup of stakeholder inputs
+Each configured input field is normalized and embedded as a signed hashed bag of words and
+character trigrams (CPU only, nothing to download), and two inputs are as similar as the mean
+cosine similarity of their fields. Finding briefs generated from differently worded inputs
+("CIO/CIO-1 at $1-5B enterprises" vs "CIOs and CIO-1 of $1B-$5B companies") takes a few
+NumPy matrix-vector products.
+The index is rebuilt from the brief store on first use and catches up with rows saved by
+other workers before every lookup.
+"""
+
+import json
+import re
+import threading
+import zlib
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from brief_store import MAX_PAGE_SIZE, BriefStore
+from config import SIMILARITY_FIELDS, SIMILARITY_THRESHOLD
+from metrics import registry
+from models import SimilarBrief
+
+# Hashed features per field; collisions only matter between features of the same field
+FIELD_DIM = 256
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+# "$1-5B" -> "1b-5b", "$2 billion" -> "2b"
+RANGE_RE = re.compile(r'(\d+)\s*-\s*\$?(\d+)\s*([kmb])\b')
+UNIT_RE = re.compile(r'(\d+)\s*(k|m|b|thousand|million|bn|billion)\b')
+UNITS = {"thousand": "k", "million": "m", "bn": "b", "billion": "b"}
+
+# Wording that should not tell two inputs apart
+STOPWORDS = frozenset("a an and at by for from in of on or the to with".split())
+SYNONYMS = {
+    "companies": "company", "enterprises": "company", "organizations": "company",
+    "organisations": "company", "firms": "company", "businesses": "company",
+}
+EMPTY_FEATURE = "\x00"
+
+CACHE_LOOKUPS = registry.counter("brief_similarity_cache_lookups_total",
+                                 "Generation requests checked for a near-duplicate stored brief")
+CACHE_HITS = registry.counter("brief_similarity_cache_hits_total",
+                              "Generation requests answered with a near-duplicate stored brief")
+
+
+def _numpy():
+    # NumPy adds ~60 ms to import; load it with the first lookup, not with the server
+    import numpy
+    return numpy
+
+
+def normalize_words(value) -> List[str]:
+    """Lowercased words of a field value, with units, plurals and filler words normalized"""
+    if isinstance(value, (list, tuple)):
+        value = " ".join(map(str, value))
+    text = str(value or "").lower().replace("$", "")
+    text = RANGE_RE.sub(r'\1\3 \2\3', text)
+    text = UNIT_RE.sub(lambda m: m.group(1) + UNITS.get(m.group(2), m.group(2)), text)
+
+    words = []
+    for word in WORD_RE.findall(text):
+        if word in STOPWORDS:
+            continue
+        word = SYNONYMS.get(word, word)
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def _features(value) -> List[str]:
+    words = normalize_words(value)
+    if not words:
+        # Two empty fields are identical, not orthogonal
+        return [EMPTY_FEATURE]
+    features = list(words)
+    for word in words:
+        padded = f" {word} "
+        features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return features
+
+
+def embed_field(words: List[str]):
+    """Unit vector of a field's hashed word and character trigram features"""
+    np = _numpy()
+    hashes = np.fromiter((zlib.crc32(f.encode()) for f in _features(words)), dtype=np.uint32)
+    signs = np.where(hashes >> 31, -1.0, 1.0)
+    counts = np.bincount(hashes % FIELD_DIM, weights=signs, minlength=FIELD_DIM)
+    norm = np.linalg.norm(counts)
+    return (counts / norm if norm else counts).astype(np.float32)
+
+
+def _grow(array, size: int, fill=0):
+    """array with room for at least size rows, doubling so appends stay amortized O(1)"""
+    if size <= len(array):
+        return array
+    grown = _numpy().full((2 * size, *array.shape[1:]), fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class FieldValues:
+    """Distinct normalized values of one input field, embedded once each"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.matrix = None
+
+    def id_for(self, value) -> int:
+        words = normalize_words(value)
+        key = " ".join(words)
+        value_id = self.ids.get(key)
+        if value_id is None:
+            value_id = self.ids[key] = len(self.ids)
+            if self.matrix is None:
+                np = _numpy()
+                self.matrix = np.zeros((64, FIELD_DIM), dtype=np.float32)
+            self.matrix = _grow(self.matrix, value_id + 1)
+            self.matrix[value_id] = embed_field(words)
+        return value_id
+
+    def similarities(self, value):
+        """Cosine similarity of value to every distinct stored value"""
+        return self.matrix[:len(self.ids)] @ embed_field(normalize_words(value))
+
+
+class SimilarBriefIndex:
+    """Distinct stored inputs (per inputs hash, newest remaining brief offered) as rows of field value ids
+
+    Briefs share most field values (company, industry, audience), so each distinct value is
+    embedded once; a lookup is one small matrix-vector product per field plus a gather over rows.
+    """
+
+    def __init__(self, store: BriefStore, fields: Sequence[str] = SIMILARITY_FIELDS,
+                 threshold: float = SIMILARITY_THRESHOLD):
+        self.store = store
+        self.fields = tuple(fields)
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._values = [FieldValues() for _ in self.fields]
+        self._value_ids = None  # (rows, fields) ids into self._values
+        self._profiles = None  # profile code per row, -1 once the brief is gone
+        self._profile_codes: Dict[str, int] = {}
+        self._entries: List[SimilarBrief] = []  # brief offered per row
+        self._stored: List[List[SimilarBrief]] = []  # briefs per row still stored, oldest first
+        self._rows: Dict[str, int] = {}  # inputs hash -> row
+        self._brief_rows: Dict[str, int] = {}  # brief id -> row
+        self._last_id = 0  # briefs.id of the newest brief indexed
+
+    def __len__(self):
+        with self._lock:
+            return len(self._rows)
+
+    def _append(self, inputs: Dict, profile_code: int) -> int:
+        np = _numpy()
+        row = len(self._entries)
+        if self._value_ids is None:
+            self._value_ids = np.zeros((64, len(self.fields)), dtype=np.int32)
+            self._profiles = np.full(64, -1, dtype=np.int32)
+        self._value_ids = _grow(self._value_ids, row + 1)
+        self._profiles = _grow(self._profiles, row + 1, fill=-1)
+        self._value_ids[row] = [values.id_for(inputs.get(field)) for field, values in zip(self.fields, self._values)]
+        self._profiles[row] = profile_code
+        return row
+
+    def _sync(self):
+        """Indexes briefs stored since the last lookup (by this or any other worker)"""
+        while True:
+            rows = self.store.stored_since(self._last_id)
+            if not rows:
+                return
+            for row in rows:
+                self._last_id = row["id"]
+                entry = SimilarBrief(row["brief_id"], row["created_at"], row["company"], row["industry"],
+                                     row["profile"], similarity=0.0)
+                code = self._profile_codes.setdefault(row["profile"] or "", len(self._profile_codes))
+                index = self._rows.get(row["inputs_hash"])
+                if index is None:
+                    index = self._rows[row["inputs_hash"]] = self._append(json.loads(row["inputs"]), code)
+                    self._entries.append(entry)
+                    self._stored.append([entry])
+                else:
+                    # Same inputs again - the newer brief stands for them
+                    self._entries[index] = entry
+                    self._stored[index].append(entry)
+                    self._profiles[index] = code
+                self._brief_rows[entry.brief_id] = index
+
+    def discard(self, brief_id: str):
+        """Stops offering a brief that has been deleted; the newest other brief with the same
+        inputs, if any, stands for them again"""
+        with self._lock:
+            index = self._brief_rows.pop(brief_id, None)
+            if index is None:
+                return
+            stored = self._stored[index]
+            stored[:] = [entry for entry in stored if entry.brief_id != brief_id]
+            if stored:
+                self._entries[index] = stored[-1]
+            else:
+                self._profiles[index] = -1
+
+    def find(self, inputs: Dict, profile: Optional[str] = None, limit: int = 5,
+             threshold: Optional[float] = None) -> List[SimilarBrief]:
+        """Stored briefs at least threshold similar to inputs, most similar first"""
+        np = _numpy()
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            self._sync()
+            size = len(self._entries)
+            if not size:
+                return []
+            # Mean over fields of the cosine similarity between the request's value and each row's
+            scores = np.zeros(size, dtype=np.float32)
+            for i, (field, values) in enumerate(zip(self.fields, self._values)):
+                scores += values.similarities(inputs.get(field))[self._value_ids[:size, i]]
+            scores /= len(self.fields)
+            if profile is None:
+                scores[self._profiles[:size] < 0] = -1.0
+            else:
+                scores[self._profiles[:size] != self._profile_codes.get(profile, -2)] = -1.0
+
+            candidates = np.flatnonzero(scores >= threshold - 1e-6)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [replace(self._entries[row], similarity=round(float(scores[row]), 4)) for row in candidates]
+
+    def cached(self, inputs: Dict, profile: str) -> Optional[Tuple[SimilarBrief, bytes, str]]:
+        """Most similar stored brief for the same profile as (match, body, etag), or None"""
+        CACHE_LOOKUPS.inc()
+        while True:
+            for match in self.find(inputs, profile, limit=3):
+                entry = self.store.get(match.brief_id)
+                if entry is None:
+                    # Deleted through another worker; an older brief may stand for its inputs now
+                    self.discard(match.brief_id)
+                    break
+                CACHE_HITS.inc()
+                return (match, *entry)
+            else:
+                return None
+
+
+def _hit_rate() -> float:
+    lookups = CACHE_LOOKUPS.value()
+    return CACHE_HITS.value() / lookups if lookups else 0.0
+
+
+registry.gauge("brief_similarity_cache_hit_rate",
+               "Fraction of generation requests answered with a near-duplicate stored brief",
+               lambda: [({}, _hit_rate())])
@@ -1,17 +1,92 @@
 """
 Simple Flask server for EdgeVerve AI Brief Generator
 Simplified version that works with basic Python installation
+
+Serves HTTP/1.1 with keep-alive from a bounded pool of worker threads, so one slow
+client no longer blocks everyone else. Response payloads are serialized once at startup.
 """
 
+import argparse
 import json
-import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
-import urllib.parse
 import socket
 
+from preview_data import PREVIEW_SECTIONS
+
+TIMESTAMP_SLOT = "__timestamp__"
+
+def prepare_payload(payload: dict) -> tuple:
+    """Serializes a payload once, leaving a slot for the per-request timestamp"""
+    body = json.dumps({**payload, "timestamp": TIMESTAMP_SLOT}, ensure_ascii=False).encode('utf-8')
+    head, tail = body.split(f'"{TIMESTAMP_SLOT}"'.encode('utf-8'), 1)
+    return head, tail
+
+def render_payload(prepared: tuple) -> bytes:
+    """Fills the timestamp slot of a pre-serialized payload"""
+    head, tail = prepared
+    return head + f'"{datetime.now().isoformat()}"'.encode('utf-8') + tail
+
+# Static payloads - serialized once at startup, not on every request
+HEALTH_PAYLOAD = prepare_payload({
+    "status": "healthy",
+    "service": "EdgeVerve AI Brief Generator"
+})
+
+PREVIEW_PAYLOAD = prepare_payload({
+    "success": True,
+    "preview": True,
+    "sections": PREVIEW_SECTIONS,
+    "metadata": {
+        "total_sections": len(PREVIEW_SECTIONS),
+        "sample_data": True,
+        "structure": "Required 17-section format maintained"
+    }
+})
+
+BRIEF_PAYLOAD = prepare_payload({
+    "success": True,
+    "sections": PREVIEW_SECTIONS,
+    "metadata": {
+        "research_time": 15.42,
+        "agents_used": ["competitor", "trends", "audience", "brief_generator"],
+        "total_sections": len(PREVIEW_SECTIONS)
+    }
+})
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that handles connections on a bounded pool of worker threads"""
+    
+    def __init__(self, server_address, handler_class, workers: int = 16):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='brief-worker')
+        super().__init__(server_address, handler_class)
+    
+    def process_request(self, request, client_address):
+        """Hand the connection to the pool instead of handling it inline"""
+        self.executor.submit(self._process_request_worker, request, client_address)
+    
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
 class BriefHandler(BaseHTTPRequestHandler):
     
+    # HTTP/1.1 keeps connections open between requests
+    protocol_version = 'HTTP/1.1'
+    # Close idle keep-alive connections so they do not pin a worker forever
+    timeout = 15
+    
     def do_GET(self):
         """Handle GET requests"""
         if self.path == '/health':
@@ -26,11 +101,13 @@ class BriefHandler(BaseHTTPRequestHandler):
         if self.path == '/generate-brief':
             self.send_brief_response()
         else:
+            self.discard_request_body()
             self.send_error(404, 'Not Found')
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.send_cors_headers()
         self.end_headers()
     
@@ -40,213 +117,34 @@ class BriefHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
     
-    def send_health_response(self):
-        """Send health check response"""
-        response = {
-            "status": "healthy",
-            "service": "EdgeVerve AI Brief Generator",
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.send_response(200)
+    def send_json(self, body: bytes, status: int = 200):
+        """Send a JSON body with an explicit length so the connection can be kept alive"""
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(body)
+    
+    def discard_request_body(self):
+        """Read any request body so the next request on this connection starts cleanly"""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+    
+    def send_health_response(self):
+        """Send health check response"""
+        self.send_json(render_payload(HEALTH_PAYLOAD))
     
     def send_preview_response(self):
         """Send preview response with sample data"""
-        sample_sections = [
-            {
-                "id": 1,
-                "icon": "🎯",
-                "title": "Business Objective",
-                "content": "<strong>Primary Goal:</strong> Establish EdgeVerve as the leading provider of Applied AI solutions for enterprises<br><strong>Target Market:</strong> Large enterprises ($1B-$5B revenue) in financial, healthcare, and manufacturing sectors<br><strong>Success Metrics:</strong> 15% market share increase, $50M ARR growth, 500+ enterprise customers within 12 months",
-                "type": "text"
-            },
-            {
-                "id": 2,
-                "icon": "📈",
-                "title": "Marketing Objective",
-                "content": "<strong>1. Platform Brand Awareness:</strong> Increase EdgeVerve brand recognition among enterprise CIOs by 40%<br><strong>2. Lead Generation:</strong> Generate 500+ qualified enterprise leads quarterly<br><strong>3. Thought Leadership:</strong> Position EdgeVerve as the go-to expert in enterprise AI implementation and governance",
-                "type": "text"
-            },
-            {
-                "id": 3,
-                "icon": "📋",
-                "title": "Background",
-                "content": "EdgeVerve operates in the rapidly growing enterprise AI market, serving large corporations ($1B-$5B revenue) seeking to scale AI beyond experimentation. The market demands unified platforms that can democratize AI across organizations while maintaining enterprise-grade security and governance.<br><strong>Market Size:</strong> $50B by 2025<br><strong>Growth Rate:</strong> 67% YoY",
-                "type": "text"
-            },
-            {
-                "id": 4,
-                "icon": "👥",
-                "title": "Target Audience",
-                "content": "<strong>Primary Audience:</strong> CIOs and CIO-1 of large enterprises<br><strong>Demographics:</strong> 35-55 years, Graduate degree, $150K-$300K income<br><strong>Company Profile:</strong> $1B-$5B revenue companies in financial services, healthcare, and manufacturing<br><strong>Pain Points:</strong> AI scaling challenges, Data silos, Legacy integration, Governance concerns",
-                "type": "text"
-            },
-            {
-                "id": 5,
-                "icon": "❗",
-                "title": "The Problem we are trying to solve",
-                "content": "Enterprise organizations struggle to scale AI initiatives beyond proof-of-concept stage due to fragmented systems, data silos, lack of governance frameworks, and insufficient technical expertise to implement enterprise-grade AI solutions that deliver measurable business value.",
-                "type": "text"
-            },
-            {
-                "id": 6,
-                "icon": "⚠️",
-                "title": "What are the challenges?",
-                "content": "• <strong>Technical Complexity:</strong> Integrating AI with existing enterprise systems<br>• <strong>Data Fragmentation:</strong> Siloed data across departments and systems<br>• <strong>Governance & Compliance:</strong> Ensuring AI solutions meet regulatory requirements<br>• <strong>Skills Gap:</strong> Lack of internal AI expertise and resources<br>• <strong>ROI Uncertainty:</strong> Difficulty demonstrating clear business value",
-                "type": "text"
-            },
-            {
-                "id": 7,
-                "icon": "💡",
-                "title": "Solutions/Offering",
-                "content": "<strong>EdgeVerve AI Platform Features:</strong><br>• <strong>PolyAI Technology:</strong> Multi-model flexibility and vendor-agnostic approach<br>• <strong>Enterprise Integration:</strong> Seamless connection with existing systems<br>• <strong>Built-in Governance:</strong> Comprehensive AI ethics and compliance frameworks<br>• <strong>Cloud-Agnostic Deployment:</strong> Works across AWS, Azure, GCP<br>• <strong>AI Democratization:</strong> No-code/low-code tools for business users",
-                "type": "text"
-            },
-            {
-                "id": 8,
-                "icon": "🚀",
-                "title": "Why EdgeVerve (Platform)?",
-                "content": "• <strong>Proven Enterprise Focus:</strong> Purpose-built for large organization requirements<br>• <strong>Rapid ROI:</strong> 6-month average time to value vs. 18+ months for custom solutions<br>• <strong>Scalable Architecture:</strong> Handles enterprise-scale data and user volumes<br>• <strong>Security First:</strong> Built-in enterprise-grade security and compliance<br>• <strong>Innovation Speed:</strong> Continuous platform updates and latest AI model integration",
-                "type": "text"
-            },
-            {
-                "id": 9,
-                "icon": "🏢",
-                "title": "Why does Enterprise need this solution?",
-                "content": "Modern enterprises require AI solutions that can scale across the organization, integrate with existing infrastructure, comply with regulatory requirements, and deliver measurable business outcomes while democratizing AI access across different skill levels and departments.",
-                "type": "text"
-            },
-            {
-                "id": 10,
-                "icon": "📊",
-                "title": "Present market trend and demand",
-                "content": "<strong>Market Growth:</strong> +67% YoY<br><strong>Rising Demand:</strong> Enterprise AI platforms +156%, MLOps solutions +134%, AI governance +89%<br><strong>Key Trends:</strong> Generative AI for enterprise, AI governance, Federated learning, Responsible AI<br><strong>Investment Focus:</strong> Enterprise AI platforms expected to reach $50B market size by 2025",
-                "type": "text"
-            },
-            {
-                "id": 11,
-                "icon": "📋",
-                "title": "Agency Statement of Work (SOW)",
-                "content": "<strong>Phase 1:</strong> Brand positioning and messaging framework (4 weeks)<br><strong>Phase 2:</strong> Multi-channel campaign development and asset creation (6 weeks)<br><strong>Phase 3:</strong> Campaign launch and optimization (8 weeks)<br><strong>Phase 4:</strong> Performance analysis and scaling (4 weeks)<br><strong>Deliverables:</strong> Brand guidelines, campaign assets, content library, performance dashboard",
-                "type": "text"
-            },
-            {
-                "id": 12,
-                "icon": "🎯",
-                "title": "Key messages across Levels (L1 to L4)",
-                "content": "<strong>L1 (Executive):</strong> Transform your enterprise with unified AI that scales<br><strong>L2 (Technical Leaders):</strong> Enterprise-grade AI platform with built-in governance and security<br><strong>L3 (IT Teams):</strong> Seamlessly integrate AI across your existing infrastructure<br><strong>L4 (Business Users):</strong> Democratize AI with no-code tools that deliver real business value",
-                "type": "text"
-            },
-            {
-                "id": 13,
-                "icon": "🎨",
-                "title": "Campaign Theme, Approach/Outline/Creative Strategy",
-                "content": "<strong>Theme:</strong> AI That Scales, Secures, and Succeeds<br><strong>Approach:</strong> Executive-focused thought leadership combined with technical proof points<br><strong>Creative Strategy:</strong> Position EdgeVerve as the bridge between AI innovation and enterprise reality<br><strong>Key Pillars:</strong> Trust, Scale, Innovation, Results<br><strong>Tone:</strong> Professional, confident, results-oriented",
-                "type": "text"
-            },
-            {
-                "id": 14,
-                "icon": "🖼️",
-                "title": "Digital Assets (Banners, Microsite, Infographics, Email Designs)",
-                "content": "<strong>Banners:</strong> Executive-focused LinkedIn/Google Ads (5 standard sizes)<br><strong>Microsite:</strong> Interactive AI ROI calculator and platform demo<br><strong>Infographics:</strong> AI implementation roadmap, ROI comparison charts<br><strong>Email Designs:</strong> Executive briefing templates, technical deep-dive series<br><strong>Interactive Tools:</strong> AI readiness assessment, implementation timeline calculator",
-                "type": "text"
-            },
-            {
-                "id": 15,
-                "icon": "🎬",
-                "title": "Digital Campaign Videos",
-                "content": "<strong>Executive Testimonials:</strong> C-level customers sharing transformation stories (2-3 min)<br><strong>Platform Demos:</strong> Technical walkthroughs and use case demonstrations (5-7 min)<br><strong>Thought Leadership:</strong> Industry expert interviews and trend analysis (3-5 min)<br><strong>Case Study Videos:</strong> Real customer implementation journeys (4-6 min)<br><strong>Social Media Clips:</strong> Quick wins and key insights for LinkedIn (30-60 sec)",
-                "type": "text"
-            },
-            {
-                "id": 16,
-                "icon": "🤖",
-                "title": "AI / Tech Enabled Ideas",
-                "content": "<strong>AI-Powered Personalization:</strong> Dynamic content adaptation based on visitor profile and industry<br><strong>Predictive Lead Scoring:</strong> ML-driven qualification and nurturing recommendations<br><strong>Intelligent Chatbots:</strong> Industry-specific AI assistants for technical questions<br><strong>Dynamic ROI Calculators:</strong> Real-time business impact modeling<br><strong>Automated Content Generation:</strong> Personalized case studies and implementation guides",
-                "type": "text"
-            },
-            {
-                "id": 17,
-                "icon": "📱",
-                "title": "Channels / Campaign Digital Mediums",
-                "content": "<strong>Primary Channels:</strong> LinkedIn sponsored content, Industry publications, Google Ads<br><strong>Secondary Channels:</strong> YouTube demos, Webinar series, Email sequences<br><strong>Content Distribution:</strong> Thought leadership articles, technical whitepapers, interactive demos<br><strong>Engagement Strategy:</strong> Account-based marketing for top 100 enterprise prospects<br><strong>Measurement:</strong> Pipeline influence, engagement scores, brand lift studies",
-                "type": "text"
-            }
-        ]
-        
-        response = {
-            "success": True,
-            "preview": True,
-            "timestamp": datetime.now().isoformat(),
-            "sections": sample_sections,
-            "metadata": {
-                "total_sections": len(sample_sections),
-                "sample_data": True,
-                "structure": "Required 17-section format maintained"
-            }
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_cors_headers()
-        self.end_headers()
-        self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+        self.send_json(render_payload(PREVIEW_PAYLOAD))
     
     def send_brief_response(self):
         """Send brief generation response"""
         # For now, return the same data as preview but mark as generated
-        sample_sections = [
-            {
-                "id": 1,
-                "icon": "🎯",
-                "title": "Business Objective",
-                "content": "<strong>Primary Goal:</strong> Establish EdgeVerve as the leading provider of Applied AI solutions for enterprises<br><strong>Target Market:</strong> Large enterprises ($1B-$5B revenue) in financial, healthcare, and manufacturing sectors<br><strong>Success Metrics:</strong> 15% market share increase, $50M ARR growth, 500+ enterprise customers within 12 months",
-                "type": "text"
-            },
-            {
-                "id": 2,
-                "icon": "📈",
-                "title": "Marketing Objective",
-                "content": "<strong>1. Platform Brand Awareness:</strong> Increase EdgeVerve brand recognition among enterprise CIOs by 40%<br><strong>2. Lead Generation:</strong> Generate 500+ qualified enterprise leads quarterly<br><strong>3. Thought Leadership:</strong> Position EdgeVerve as the go-to expert in enterprise AI implementation and governance",
-                "type": "text"
-            },
-            {
-                "id": 3,
-                "icon": "📋",
-                "title": "Background",
-                "content": "EdgeVerve operates in the rapidly growing enterprise AI market, serving large corporations ($1B-$5B revenue) seeking to scale AI beyond experimentation. The market demands unified platforms that can democratize AI across organizations while maintaining enterprise-grade security and governance.<br><strong>Market Size:</strong> $50B by 2025<br><strong>Growth Rate:</strong> 67% YoY",
-                "type": "text"
-            },
-            # Add all 17 sections here...
-            {
-                "id": 17,
-                "icon": "📱",
-                "title": "Channels / Campaign Digital Mediums",
-                "content": "<strong>Primary Channels:</strong> LinkedIn sponsored content, Industry publications, Google Ads<br><strong>Secondary Channels:</strong> YouTube demos, Webinar series, Email sequences<br><strong>Content Distribution:</strong> Thought leadership articles, technical whitepapers, interactive demos<br><strong>Engagement Strategy:</strong> Account-based marketing for top 100 enterprise prospects<br><strong>Measurement:</strong> Pipeline influence, engagement scores, brand lift studies",
-                "type": "text"
-            }
-        ]
-        
-        response = {
-            "success": True,
-            "timestamp": datetime.now().isoformat(),
-            "sections": sample_sections,
-            "metadata": {
-                "research_time": 15.42,
-                "agents_used": ["competitor", "trends", "audience", "brief_generator"],
-                "total_sections": len(sample_sections)
-            }
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_cors_headers()
-        self.end_headers()
-        self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+        self.discard_request_body()
+        self.send_json(render_payload(BRIEF_PAYLOAD))
 
 def find_free_port():
     """Find a free port to run the server"""
@@ -256,23 +154,33 @@ def find_free_port():
         port = s.getsockname()[1]
     return port
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="EdgeVerve AI Brief Generator - Simple Server")
+    parser.add_argument('--host', default=os.environ.get('BRIEF_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('BRIEF_PORT', '5000')))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('SIMPLE_SERVER_WORKERS', '16')),
+                        help='Number of worker threads handling connections')
+    return parser.parse_args()
+
 def main():
-    port = 5000
+    args = parse_args()
+    port = args.port
     
-    # Try to use port 5000, if busy find another
+    # Try to use the requested port, if busy find another
     try:
-        server = HTTPServer(('localhost', port), BriefHandler)
+        server = PooledHTTPServer((args.host, port), BriefHandler, workers=args.workers)
     except OSError:
         port = find_free_port()
-        server = HTTPServer(('localhost', port), BriefHandler)
+        server = PooledHTTPServer((args.host, port), BriefHandler, workers=args.workers)
     
     print("🚀 EdgeVerve AI Brief Generator - Simple Server")
     print("=" * 50)
-    print(f"📍 Server running on: http://localhost:{port}")
+    print(f"📍 Server running on: http://{args.host}:{port}")
+    print(f"⚙️  Worker threads: {args.workers} (HTTP/1.1 keep-alive)")
     print("📍 Available endpoints:")
-    print(f"   GET  http://localhost:{port}/health - Health check")
-    print(f"   GET  http://localhost:{port}/brief-preview - Preview sample data")
-    print(f"   POST http://localhost:{port}/generate-brief - Generate brief")
+    print(f"   GET  http://{args.host}:{port}/health - Health check")
+    print(f"   GET  http://{args.host}:{port}/brief-preview - Preview sample data")
+    print(f"   POST http://{args.host}:{port}/generate-brief - Generate brief")
     print("=" * 50)
     print("✅ Server is ready! Press Ctrl+C to stop.")
     
@@ -280,7 +188,8 @@ def main():
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
-        server.shutdown()
+    finally:
+        server.server_close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+"""
+Behaviour tests for the parsed brief document: inline bold/italic runs, block kinds,
+subsections, and HTML escaping when the runs are rendered
+
+Run with:
+    python -m pytest test_brief_document.py
+"""
+
+import pytest
+
+from brief_document import TextRun, parse_blocks, parse_brief_document, parse_inline
+from brief_formatter import BriefFormatter
+
+
+def test_parse_inline_bold_and_italic():
+    assert parse_inline("**Bold** and *italic* text") == [
+        TextRun("Bold", bold=True), TextRun(" and "), TextRun("italic", italic=True), TextRun(" text")]
+    assert parse_inline("plain") == [TextRun("plain")]
+    assert parse_inline("") == []
+
+
+def test_parse_inline_drops_unpaired_markers():
+    assert parse_inline("**unclosed") == [TextRun("unclosed")]
+    assert parse_inline("a ** b") == [TextRun("a  b")]
+
+
+def test_parse_inline_keeps_markup_as_text():
+    # Runs hold raw text; escaping is the renderer's job
+    assert parse_inline("<b>&</b> **<i>**") == [TextRun("<b>&</b> "), TextRun("<i>", bold=True)]
+
+
+def test_rendered_html_escapes_runs():
+    html = BriefFormatter()._format_content_as_html(
+        "**A & B** <script>x</script>\n- *AT&T* item\n1. **Step** <one>")
+    assert html == ("<strong>A &amp; B</strong> &lt;script&gt;x&lt;/script&gt;<br>"
+                    "• <em>AT&amp;T</em> item<br>"
+                    "<strong>1. Step &lt;one&gt;</strong>")
+
+
+def test_rendered_pdf_markup_escapes_runs():
+    pytest.importorskip("reportlab")
+    from pdf_brief_generator import SimplePDFGenerator
+
+    markup = SimplePDFGenerator()._format_runs(parse_inline("**R&D** <tag> *x*"))
+    assert markup == "<b>R&amp;D</b> &lt;tag&gt; <i>x</i>"
+
+
+def test_block_kinds():
+    blocks = parse_blocks("Intro line\n- bullet **one**\n* bullet two\n2. numbered\n\n")
+    assert [block.kind for block in blocks] == ["paragraph", "bullet", "bullet", "numbered"]
+    assert blocks[1].text == "bullet one"
+    assert blocks[1].runs[1] == TextRun("one", bold=True)
+
+
+def test_document_sections_and_subsections():
+    document = parse_brief_document(
+        "Preamble is dropped\n"
+        "## Target Audience\n"
+        "Chief information officers\n"
+        "1. Primary\n"
+        "- Budget owners\n"
+        "2. Secondary\n"
+        "**Background**\n"
+        "Context here\n")
+
+    content_map = document.content_map()
+    assert list(content_map) == ["Target Audience", "Background"]
+    audience = content_map["Target Audience"]
+    assert [block.text for block in audience.intro] == ["Chief information officers"]
+    assert [(sub.heading.text, [block.text for block in sub.blocks]) for sub in audience.subsections] == [
+        ("1. Primary", ["Budget owners"]), ("2. Secondary", [])]
+    assert content_map["Background"].content == "Context here"
@@ -0,0 +1,121 @@
+"""
+Behaviour tests for the SQLite brief store: save/fetch/delete, full-text search, shared
+research bundles, paging and stable ids
+
+Run with:
+    python -m pytest test_brief_store.py
+"""
+
+import pytest
+
+from brief_store import BriefStore
+from codec import decode
+from models import (AudienceInsights, BriefMetadata, BriefResult, BriefSection, CompetitorAnalysis, ResearchBundle,
+                    TrendsData)
+
+
+def make_response(content: str, profile: str = "standard") -> BriefResult:
+    return BriefResult(
+        success=True,
+        timestamp="2026-10-19T10:00:00",
+        sections=(BriefSection(id=1, icon="🎯", title="Key Message", content=content),),
+        metadata=BriefMetadata(research_time=0.1, agents_used=("brief_generator",), total_sections=1,
+                               profile=profile),
+    )
+
+
+def make_research(competitor: str, timestamp: str = "2026-10-19T10:00:00") -> ResearchBundle:
+    return ResearchBundle(
+        competitor_analysis=CompetitorAnalysis((), {"leader": competitor}, {}, {}, timestamp=timestamp),
+        market_trends=TrendsData({}, {}, {}, ("agentic automation",), timestamp=timestamp),
+        audience_insights=AudienceInsights({}, {}, {}, {}, ("legacy systems",), {}, timestamp=timestamp),
+    )
+
+
+def make_result(company: str, industry: str = "enterprise_ai", research: ResearchBundle = None) -> dict:
+    return {
+        "brief_content": "",
+        "research_data": {},
+        "research_bundle": research,
+        "generation_metadata": {"stakeholder_inputs": {"company_name": company, "industry": industry}},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BriefStore(str(tmp_path / "briefs.db"))
+
+
+def test_put_get_delete(store):
+    brief_id, body, etag = store.put(make_response("Scale federated learning"), make_result("Acme"))
+
+    assert store.get(brief_id) == (body, etag)
+    assert decode(body, BriefResult).brief_id == brief_id
+
+    assert store.delete(brief_id) is True
+    assert store.get(brief_id) is None
+    assert store.delete(brief_id) is False
+
+
+def test_search_ranks_and_filters(store):
+    first, _, _ = store.put(make_response("Federated learning for hospitals"), make_result("Acme", "healthcare"))
+    second, _, _ = store.put(make_response("AI governance for banks"), make_result("Globex", "financial_services"))
+
+    hits = store.search("federated learning")
+    assert [hit.brief_id for hit in hits] == [first]
+    assert "<mark>" in hits[0].snippet
+
+    # Inputs are indexed too, and filters apply to the joined brief row
+    assert [hit.brief_id for hit in store.search("Globex")] == [second]
+    assert store.search("governance", industry="healthcare") == []
+
+    store.delete(first)
+    assert store.search("federated") == []
+
+
+def test_search_rejects_empty_query(store):
+    with pytest.raises(ValueError):
+        store.search('  "" ')
+
+
+def test_research_bundles_are_shared_and_reference_counted(store):
+    # Same findings researched at different times hash the same
+    first, body, _ = store.put(make_response("One"), make_result("Acme", research=make_research("Databricks")))
+    second, _, _ = store.put(make_response("Two"),
+                             make_result("Acme", research=make_research("Databricks", "2026-10-19T11:00:00")))
+    other, _, _ = store.put(make_response("Three"), make_result("Acme", research=make_research("DataRobot")))
+
+    shared_hash = decode(body, BriefResult).research_hash
+    assert shared_hash is not None
+    assert decode(store.get(second)[0], BriefResult).research_hash == shared_hash
+    assert decode(store.get(other)[0], BriefResult).research_hash != shared_hash
+
+    store.delete(first)
+    assert decode(store.get_research(shared_hash), ResearchBundle).competitor_analysis.market_positioning == \
+        {"leader": "Databricks"}
+    store.delete(second)
+    assert store.get_research(shared_hash) is None
+
+
+def test_list_pages_through_every_brief_once(store):
+    ids = [store.put(make_response(f"Brief {i}"), make_result(f"Company {i}"))[0] for i in range(5)]
+
+    page, cursor = store.list(limit=2)
+    seen = [summary.brief_id for summary in page]
+    while cursor:
+        page, cursor = store.list(limit=2, cursor=cursor)
+        seen.extend(summary.brief_id for summary in page)
+    assert sorted(seen) == sorted(ids)
+    assert len(seen) == len(set(seen))
+
+
+def test_ids_are_not_reused_after_deleting_the_newest_brief(store):
+    first, _, _ = store.put(make_response("Alpha"), make_result("Acme"))
+    first_id = store.stored_since()[0]["id"]
+    store.delete(first)
+    second, _, _ = store.put(make_response("Beta"), make_result("Acme"))
+
+    rows = store.stored_since(first_id)
+    assert [row["brief_id"] for row in rows] == [second]
+    assert [hit.brief_id for hit in store.search("beta")] == [second]
+
@@ -0,0 +1,179 @@
+"""
+Behaviour tests for the Gemini circuit breaker and the generation call it guards
+
+Run with:
+    python -m pytest test_circuit_breaker.py
+"""
+
+import asyncio
+
+import pytest
+
+from agentic_brief_enhanced import AgenticBriefOrchestrator
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_breaker
+from deadline import Deadline
+from profiles import get_profile
+
+
+def tripped(open_seconds: float = 0.0) -> CircuitBreaker:
+    """Breaker that has just opened after min_calls failures"""
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=2, window=4, slow_call_seconds=1.0,
+                             open_seconds=open_seconds)
+    for _ in range(2):
+        breaker.record_failure(breaker.allow())
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_opens_on_failure_rate_and_rejects_while_open():
+    breaker = tripped(open_seconds=60)
+    assert breaker.allow() is None
+
+
+def test_slow_calls_count_against_the_circuit():
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=2, window=4, slow_call_seconds=1.0)
+    breaker.record_success(breaker.allow(), 0.1)
+    breaker.record_success(breaker.allow(), 5.0)
+    assert breaker.state == OPEN
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = tripped()
+    probe = breaker.allow()
+    assert probe is not None and breaker.state == HALF_OPEN
+    assert breaker.allow() is None
+
+    breaker.record_success(probe, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow() is not None
+
+
+def test_failed_probe_reopens():
+    breaker = tripped()
+    breaker.record_failure(breaker.allow())
+    assert breaker.state == OPEN
+
+
+def test_released_probe_lets_the_next_call_probe():
+    breaker = tripped()
+    breaker.release(breaker.allow())
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is not None
+
+
+def test_only_the_probe_decides_the_half_open_state():
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=2, window=4, slow_call_seconds=1.0,
+                             open_seconds=0.0)
+    # Admitted while closed, still running when the circuit opens
+    older = breaker.allow()
+    for _ in range(2):
+        breaker.record_failure(breaker.allow())
+    probe = breaker.allow()
+    assert probe is not None and breaker.state == HALF_OPEN
+
+    # The older call finishing cannot close or re-open the circuit, or free the probe's slot
+    breaker.record_success(older, 0.1)
+    assert breaker.state == HALF_OPEN
+    breaker.record_failure(older)
+    assert breaker.state == HALF_OPEN
+    breaker.release(older)
+    assert breaker.allow() is None
+
+    breaker.record_success(probe, 0.1)
+    assert breaker.state == CLOSED
+
+
+def orchestrator(generate) -> AgenticBriefOrchestrator:
+    """Orchestrator with the Gemini call replaced (no SDK or network needed)"""
+    instance = object.__new__(AgenticBriefOrchestrator)
+    instance.structured_output = False
+    instance._generate_final_brief = generate
+    return instance
+
+
+@pytest.fixture
+def half_open_breaker():
+    profile = get_profile()
+    breaker = get_breaker(profile.model)
+    open_seconds, breaker.open_seconds = breaker.open_seconds, 0.0
+    breaker.state, breaker._probe = OPEN, None
+    yield profile, breaker
+    breaker.open_seconds = open_seconds
+    breaker.state, breaker._probe = CLOSED, None
+    breaker._outcomes.clear()
+
+
+def test_cancelled_probe_is_released(half_open_breaker):
+    profile, breaker = half_open_breaker
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+
+    async def run():
+        task = asyncio.ensure_future(orchestrator(hang)._generate_guarded({}, {}, Deadline(None), profile, {}))
+        await asyncio.sleep(0.01)
+        assert breaker.state == HALF_OPEN and breaker.allow() is None
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.allow() is not None
+
+
+def test_deadline_timeout_is_not_a_failure(half_open_breaker):
+    profile, breaker = half_open_breaker
+
+    async def time_out(*args):
+        raise asyncio.TimeoutError
+
+    result = asyncio.run(orchestrator(time_out)._generate_guarded({}, {}, Deadline(None), profile, {}))
+    assert result is None
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is not None
+
+
+def test_error_from_probe_reopens(half_open_breaker):
+    profile, breaker = half_open_breaker
+
+    async def fail(*args):
+        raise ConnectionError("Gemini down")
+
+    assert asyncio.run(orchestrator(fail)._generate_guarded({}, {}, Deadline(None), profile, {})) is None
+    assert breaker.state == OPEN
+
+
+def test_older_call_finishing_does_not_free_the_probe(half_open_breaker):
+    profile, breaker = half_open_breaker
+    breaker.state = CLOSED
+
+    async def run():
+        answer = asyncio.Event()
+
+        async def slow(*args):
+            await answer.wait()
+            return "older brief", False
+
+        async def hang(*args):
+            await asyncio.sleep(10)
+
+        # Admitted while closed; the circuit then opens and a probe starts
+        older = asyncio.ensure_future(orchestrator(slow)._generate_guarded({}, {}, Deadline(None), profile, {}))
+        await asyncio.sleep(0)
+        breaker.state = OPEN
+        probe = asyncio.ensure_future(orchestrator(hang)._generate_guarded({}, {}, Deadline(None), profile, {}))
+        await asyncio.sleep(0.01)
+        assert breaker.state == HALF_OPEN
+
+        answer.set()
+        assert await older == ("older brief", False)
+        # Still half-open with the probe in flight: no second probe is let through
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() is None
+
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(run())
+    assert breaker.allow() is not None
@@ -0,0 +1,87 @@
+"""
+Behaviour tests for competitor pricing and positioning analytics: price string parsing,
+price tiers and percentiles, and positioning term shares
+
+Run with:
+    python -m pytest test_competitor_analytics.py
+"""
+
+import math
+
+import pytest
+
+from competitor_analytics import analyze_positioning, analyze_pricing, format_usd, parse_price
+
+
+@pytest.mark.parametrize("text, low, high, models", [
+    ("$100K+ annually", 100000, math.inf, ("subscription",)),
+    ("$49-79/month", 588, 948, ("subscription",)),
+    ("Free to $149/month", 0, 1788, ("free", "subscription")),
+    ("$1-5M", 1e6, 5e6, ()),
+    ("$25,000/year", 25000, 25000, ("subscription",)),
+])
+def test_parse_price_annualizes_ranges(text, low, high, models):
+    assert parse_price(text) == (low, high, models)
+
+
+@pytest.mark.parametrize("text, models", [
+    ("Per-user subscription", ("per_seat", "subscription")),
+    ("Pay-per-use", ("usage_based",)),
+    ("Custom enterprise pricing", ("custom_enterprise",)),
+    ("", ()),
+])
+def test_parse_price_without_amount(text, models):
+    price = parse_price(text)
+    assert math.isnan(price.low) and math.isnan(price.high)
+    assert price.models == models
+
+
+def test_format_usd():
+    assert format_usd(588) == "$588"
+    assert format_usd(120000) == "$120K"
+    assert format_usd(16100) == "$16.1K"
+    assert format_usd(2e6) == "$2M"
+
+
+def test_analyze_pricing_tiers_and_shares():
+    competitors = [
+        {"name": "A", "pricing": "$49/month"},
+        {"name": "B", "pricing": "$100K+ annually"},
+        {"name": "C", "pricing": "$20K-50K/year"},
+        {"name": "D", "pricing": "Contact sales"},
+        {"name": "E", "pricing": "Free"},
+    ]
+    result = analyze_pricing(competitors)
+
+    assert result["model_shares"] == {"Subscription": 0.6, "Free tier": 0.2, "Custom enterprise": 0.2}
+    assert result["published_prices"] == 4
+    assert result["price_range"] == "$0 to $100K+ per year"
+    assert [(tier["tier"], tier["count"], tier["examples"]) for tier in result["price_tiers"]] == [
+        ("Self-serve", 2, ["E", "A"]),
+        ("Mid-market", 1, ["C"]),
+        ("Enterprise", 1, ["B"]),
+    ]
+    assert result["recommendation"].endswith("on a subscription model")
+
+
+def test_analyze_pricing_without_published_prices():
+    result = analyze_pricing([{"name": "X", "pricing": "Custom quote"}])
+    assert result["published_prices"] == 0
+    assert result["price_tiers"] == []
+    assert "custom enterprise dominates" in result["recommendation"]
+
+    assert analyze_pricing([])["price_range"] == "Not published"
+
+
+def test_analyze_positioning_shares_and_gaps():
+    result = analyze_positioning([
+        {"focus": "Enterprise AI governance", "description": "Agentic automation"},
+        {"focus": "Enterprise analytics"},
+    ])
+
+    assert result["term_frequencies"]["enterprise"] == 1.0
+    assert result["term_frequencies"]["analytic"] == 0.5
+    # Governance and agentic angles are taken, so they are not suggested as gaps
+    assert "Responsible AI and governance" not in result["gap_opportunities"]
+    assert "Agentic automation" not in result["gap_opportunities"]
+    assert result["common_positions"] == ["Enterprise AI governance", "Enterprise analytics"]
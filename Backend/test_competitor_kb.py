@@ -0,0 +1,135 @@
+"""
+Behaviour tests for the competitor knowledge base: industry aliases, fuzzy industry matching,
+seed reloads and merging competitors found by searches
+
+Run with:
+    python -m pytest test_competitor_kb.py
+"""
+
+import json
+
+import pytest
+
+from competitor_kb import CompetitorKnowledgeBase, normalize_key
+
+SEED = {
+    "default": [{"name": "IBM Watson", "focus": "AI consulting"}],
+    "industries": {
+        "Enterprise AI": {
+            "aliases": ["applied ai", "GenAI"],
+            "company_types": {
+                "AI Platform": [{"name": "Databricks", "pricing": "Custom enterprise"},
+                                {"name": "DataRobot", "focus": "Automated machine learning"}],
+                "consulting": [{"name": "Accenture"}],
+            },
+        },
+        "healthcare": {
+            "aliases": ["health care", "medtech"],
+            "company_types": {"provider": [{"name": "Epic"}, {"name": "Cerner"}]},
+        },
+    },
+}
+
+
+def names(competitors):
+    return [competitor["name"] for competitor in competitors]
+
+
+def write_seed(path, data):
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def seed_path(tmp_path):
+    path = tmp_path / "competitors.json"
+    write_seed(path, SEED)
+    return path
+
+
+@pytest.fixture
+def kb(tmp_path, seed_path):
+    return CompetitorKnowledgeBase(str(tmp_path / "kb.db"), str(seed_path))
+
+
+def test_normalize_key():
+    assert normalize_key("Enterprise AI") == normalize_key("enterprise-ai") == "enterprise_ai"
+    assert normalize_key(None) == ""
+
+
+def test_aliases_resolve_to_the_industry(kb):
+    assert kb.resolve_industry("Enterprise AI") == "enterprise_ai"
+    assert kb.resolve_industry("GenAI") == "enterprise_ai"
+    assert kb.resolve_industry("Health-Care") == "healthcare"
+    assert kb.resolve_industry("") is None
+
+
+def test_near_miss_spellings_resolve_through_trigrams(kb):
+    assert kb.resolve_industry("enterprize ai") == "enterprise_ai"
+    assert kb.resolve_industry("helthcare") == "healthcare"
+    assert kb.resolve_industry("agriculture") is None
+    # Cached answers stay the same
+    assert kb.resolve_industry("helthcare") == "healthcare"
+    assert kb.resolve_industry("agriculture") is None
+
+
+def test_competitors_fall_back_from_company_type_to_industry_to_default(kb):
+    assert names(kb.competitors("genai", "ai platform")) == ["Databricks", "DataRobot"]
+    assert names(kb.competitors("genai", "hardware")) == ["Databricks", "Accenture", "DataRobot"]
+    assert names(kb.competitors("agriculture", "co-op")) == ["IBM Watson"]
+    assert kb.competitors("medtech", "provider", limit=1) == [{"name": "Epic", "source": "seed"}]
+
+
+def test_seed_reload_applies_changes_and_removes_dropped_rows(tmp_path, seed_path, kb):
+    kb.add_competitors("healthcare", "provider", [{"name": "Meditech"}])
+    kb.add_competitors("Agritech", "co-op", [{"name": "Deere"}])
+    assert kb.resolve_industry("medtech") == "healthcare"
+
+    changed = json.loads(json.dumps(SEED))
+    enterprise_ai = changed["industries"]["Enterprise AI"]
+    enterprise_ai["aliases"] = ["applied ai"]
+    enterprise_ai["company_types"]["AI Platform"] = [{"name": "DataRobot", "focus": "AutoML"}]
+    del changed["industries"]["healthcare"]
+    write_seed(seed_path, changed)
+
+    reloaded = CompetitorKnowledgeBase(kb.path, str(seed_path))
+    assert reloaded.competitors("applied ai", "ai platform") == [
+        {"name": "DataRobot", "focus": "AutoML", "source": "seed"}]
+    assert reloaded.resolve_industry("GenAI") is None
+    assert reloaded.resolve_industry("medtech") is None
+
+    # Learned rows stay, and so does the industry they were learned for
+    assert names(reloaded.competitors("healthcare", "provider")) == ["Meditech"]
+    assert names(reloaded.competitors("agritech", "co-op")) == ["Deere"]
+
+
+def test_unchanged_seed_is_not_reloaded(seed_path, kb, capsys):
+    kb.competitors("genai", "ai platform")
+    assert "Loaded competitor knowledge base" in capsys.readouterr().out
+
+    CompetitorKnowledgeBase(kb.path, str(seed_path)).competitors("genai", "ai platform")
+    assert capsys.readouterr().out == ""
+
+
+def test_add_competitors_merges_with_curated_rows(kb):
+    written = kb.add_competitors("GenAI", "AI Platform", [
+        {"name": "Databricks", "pricing": "Pay-per-use", "focus": "Lakehouse", "website": "databricks.com"},
+        {"name": "H2O.ai", "description": "Open source ML"},
+        {"focus": "no name"},
+    ])
+    assert written == 2
+
+    databricks, datarobot, h2o = kb.competitors("enterprise ai", "ai platform")
+    # Curated fields win, missing ones are filled in
+    assert databricks == {"name": "Databricks", "focus": "Lakehouse", "pricing": "Custom enterprise",
+                          "website": "databricks.com", "source": "seed"}
+    assert datarobot["name"] == "DataRobot"
+    assert h2o == {"name": "H2O.ai", "description": "Open source ML", "source": "serper_search"}
+
+
+def test_added_industries_become_lookup_keys(kb):
+    assert kb.add_competitors("Agritech", "co-op", [{"name": "Deere", "source": "manual"}]) == 1
+    assert kb.add_competitors("agritech", "co-op", []) == 0
+
+    assert kb.resolve_industry("agritech") == "agritech"
+    assert kb.resolve_industry("agritek") == "agritech"
+    assert kb.competitors("Agritech", "co-op") == [{"name": "Deere", "source": "manual"}]
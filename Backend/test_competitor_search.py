@@ -0,0 +1,134 @@
+"""
+Behaviour tests for the competitor search fan-out: result filtering, dedupe across queries,
+early exit once enough competitors are known, timeouts and failed queries
+
+Run with:
+    python -m pytest test_competitor_search.py
+"""
+
+import asyncio
+
+import pytest
+
+from competitor_search import (CompetitorMerger, competitor_from_result, expand_queries, fan_out, normalize_name,
+                               site_domain)
+
+
+def organic(*sites):
+    """Serper response with one organic result per (title, link)"""
+    return {"organic": [{"title": title, "link": link, "snippet": f"About {title}"} for title, link in sites]}
+
+
+def test_site_domain_and_normalize_name():
+    assert site_domain("https://www.databricks.com/product") == "databricks.com"
+    assert site_domain("https://shop.acme.co.uk/") == "acme.co.uk"
+    assert normalize_name("Databricks, Inc.") == normalize_name("databricks") == "databricks"
+    assert normalize_name("The Acme Corp") == "acme"
+
+
+@pytest.mark.parametrize("title, link, name", [
+    ("Databricks: The Data and AI Company", "https://www.databricks.com/", "Databricks"),
+    ("DataRobot AI Platform | Deliver Value", "https://www.datarobot.com/platform", "DataRobot"),
+    ("Enterprise AI that works", "https://h2o-ai.com/", "H2O Ai"),
+])
+def test_competitor_from_result_names_the_site(title, link, name):
+    assert competitor_from_result({"title": title, "link": link})["name"] == name
+
+
+@pytest.mark.parametrize("title, link", [
+    ("Top 10 Enterprise AI Companies", "https://www.forbes.com/list"),
+    ("Best DataRobot Alternatives 2026", "https://www.g2.com/compare"),
+    ("Top 10 Enterprise AI Platforms", "https://www.someblog.com/top-ai"),
+    ("", ""),
+])
+def test_competitor_from_result_skips_listicles_and_directories(title, link):
+    assert competitor_from_result({"title": title, "link": link}) is None
+
+
+def test_merger_dedupes_by_domain_and_name():
+    merger = CompetitorMerger()
+    merger.add(organic(("Databricks: Data and AI", "https://www.databricks.com/"),
+                       ("DataRobot | AI Platform", "https://www.datarobot.com/")))
+    merger.add(organic(("DataRobot Platform", "https://www.datarobot.com/platform"),
+                       ("Databricks Germany", "https://www.databricks.de/"),
+                       ("Top 10 AI Companies", "https://www.forbes.com/ai")))
+    merger.add(organic(("DataRobot", "https://www.datarobot.com/pricing")))
+
+    # The regional Databricks site merges by name, the DataRobot pages by domain
+    assert len(merger) == 2
+    # DataRobot was found by more queries, so it ranks first
+    assert [c["name"] for c in merger.competitors()] == ["DataRobot", "Databricks"]
+    assert merger.competitors(1)[0]["website"] == "https://www.datarobot.com/"
+
+
+def test_expand_queries_puts_first_pages_first():
+    payloads = expand_queries("enterprise_ai", "AI platform", templates=["{industry} {company_type}", "{company_type}"],
+                              pages=2, regions=["us", "uk"], results=10)
+    assert len(payloads) == 8
+    assert payloads[0] == {"q": "enterprise ai AI platform", "num": 10, "gl": "us"}
+    assert all("page" not in payload for payload in payloads[:4])
+    assert all(payload["page"] == 2 for payload in payloads[4:])
+
+
+def company_fetch(latencies, cancelled, errors=()):
+    """fetch that returns company <q> after latencies[q] seconds, recording cancellations"""
+    async def fetch(payload):
+        query = payload["q"]
+        try:
+            await asyncio.sleep(latencies[query])
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        if query in errors:
+            raise RuntimeError(f"{query} failed")
+        return organic((query.title(), f"https://www.{query}.com/"))
+    return fetch
+
+
+def test_fan_out_stops_at_target_and_cancels_the_rest():
+    cancelled = []
+    latencies = {"alpha": 0.0, "beta": 0.01, "gamma": 5, "delta": 5}
+    fetch = company_fetch(latencies, cancelled)
+
+    found = asyncio.run(fan_out([{"q": q} for q in latencies], fetch, timeout=2, concurrency=4, target=2))
+
+    assert [c["name"] for c in found] == ["Alpha", "Beta"]
+    assert sorted(cancelled) == ["delta", "gamma"]
+
+
+def test_fan_out_respects_concurrency():
+    in_flight, peak = 0, 0
+
+    async def fetch(payload):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return organic((payload["q"].title(), f"https://www.{payload['q']}.com/"))
+
+    found = asyncio.run(fan_out([{"q": f"site{i}"} for i in range(6)], fetch, timeout=2, concurrency=2, target=10))
+    assert len(found) == 6
+    assert peak == 2
+
+
+def test_fan_out_returns_partial_results_on_timeout():
+    cancelled = []
+    fetch = company_fetch({"alpha": 0.0, "slow": 5}, cancelled)
+
+    found = asyncio.run(fan_out([{"q": "alpha"}, {"q": "slow"}], fetch, timeout=0.05, concurrency=2, target=5))
+
+    assert [c["name"] for c in found] == ["Alpha"]
+    assert cancelled == ["slow"]
+
+
+def test_fan_out_tolerates_some_failed_queries():
+    fetch = company_fetch({"alpha": 0.0, "broken": 0.0}, [], errors={"broken"})
+    found = asyncio.run(fan_out([{"q": "alpha"}, {"q": "broken"}], fetch, timeout=1, concurrency=2, target=5))
+    assert [c["name"] for c in found] == ["Alpha"]
+
+
+def test_fan_out_raises_when_every_query_fails():
+    fetch = company_fetch({"alpha": 0.0, "beta": 0.0}, [], errors={"alpha", "beta"})
+    with pytest.raises(RuntimeError, match="failed"):
+        asyncio.run(fan_out([{"q": "alpha"}, {"q": "beta"}], fetch, timeout=1, concurrency=2, target=5))
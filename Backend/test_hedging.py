@@ -0,0 +1,180 @@
+"""
+Behaviour tests for hedged upstream calls
+
+Run with:
+    python -m pytest test_hedging.py
+"""
+
+import asyncio
+
+import pytest
+
+from hedging import LATENCY_SAVED, HedgedCaller
+
+
+def calibrated(latency: float = 0.01, **kwargs) -> HedgedCaller:
+    """Caller whose hedge delay is already known, with no cap on hedges"""
+    options = {"enabled": True, "max_ratio": 1.0, "min_samples": 1, "min_delay": 0.0, **kwargs}
+    caller = HedgedCaller("test", **options)
+    caller.latency.observe(latency)
+    return caller
+
+
+class Attempts:
+    """Upstream stand-in: the first attempt hangs, later ones answer after a short sleep"""
+
+    def __init__(self, first_delay: float = 10.0, later_delay: float = 0.0):
+        self.delays = [first_delay, later_delay]
+        self.started = 0
+        self.cancelled = []
+
+    async def __call__(self):
+        attempt = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[min(attempt, 1)])
+        except asyncio.CancelledError:
+            self.cancelled.append(attempt)
+            raise
+        return f"answer {attempt}"
+
+
+def test_fast_calls_are_not_hedged():
+    caller = calibrated(latency=1.0)
+    attempts = Attempts(first_delay=0.0)
+
+    assert asyncio.run(caller.call(attempts)) == "answer 0"
+    assert attempts.started == 1
+
+
+def test_hedge_wins_and_slow_attempt_is_cancelled():
+    caller = calibrated()
+    attempts = Attempts()
+
+    async def run():
+        result = await caller.call(attempts)
+        # Let the cancellation reach the losing coroutine
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "answer 1"
+    assert attempts.started == 2
+    assert attempts.cancelled == [0]
+    # Winner plus the loser's time up to its cancellation, after the calibration sample
+    assert len(caller.latency) == 3
+
+
+def test_second_answer_of_a_tie_is_closed():
+    caller = calibrated()
+    closed = []
+
+    class Response:
+        def __init__(self, attempt: int):
+            self.attempt = attempt
+
+        def close(self):
+            closed.append(self.attempt)
+
+    async def run():
+        answered = asyncio.Event()
+        started = []
+
+        async def attempt():
+            number = len(started)
+            started.append(number)
+            await answered.wait()
+            return Response(number)
+
+        async def answer_both():
+            # Both attempts wake up in the same loop iteration
+            while len(started) < 2:
+                await asyncio.sleep(0.01)
+            answered.set()
+
+        releaser = asyncio.ensure_future(answer_both())
+        result = await caller.call(attempt)
+        await releaser
+        return result
+
+    result = asyncio.run(run())
+    assert len(closed) == 1
+    assert result.attempt not in closed
+
+
+def test_error_on_every_attempt_is_raised():
+    caller = calibrated()
+
+    async def failing():
+        await asyncio.sleep(0.02)
+        raise ConnectionError("upstream down")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(caller.call(failing))
+
+
+def test_cancelling_the_caller_cancels_both_attempts():
+    caller = calibrated()
+    attempts = Attempts(first_delay=10.0, later_delay=10.0)
+
+    async def run():
+        task = asyncio.ensure_future(caller.call(attempts))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert sorted(attempts.cancelled) == [0, 1]
+
+
+def test_hedge_budget_is_charged_to_the_hedged_call():
+    caller = calibrated(latency=0.05)
+    slow = Attempts()
+
+    async def fast():
+        return "fast"
+
+    async def run():
+        hedged = asyncio.ensure_future(caller.call(slow))
+        await asyncio.sleep(0)
+        # Starts after the slow call, so its slot is the newest when the slow call hedges
+        assert await caller.call(fast) == "fast"
+        return await hedged
+
+    assert asyncio.run(run()) == "answer 1"
+    assert [hedged for hedged, in caller._recent] == [True, False]
+    assert caller.hedge_rate() == 0.5
+
+
+def test_hedges_are_capped_to_max_ratio():
+    caller = calibrated(percentile=0.0, max_ratio=0.5)
+
+    async def run():
+        results = []
+        for _ in range(4):
+            results.append(await caller.call(Attempts(first_delay=0.1)))
+        return results
+
+    results = asyncio.run(run())
+    assert results.count("answer 1") == 2
+    assert caller.hedge_rate() == 0.5
+
+
+def test_winning_hedge_records_latency_saved():
+    caller = calibrated(latency=0.05)
+    before = LATENCY_SAVED.value(upstream="test")
+
+    assert asyncio.run(caller.call(Attempts(later_delay=0.02))) == "answer 1"
+
+    # The primary had run for ~0.07 s when the hedge answered after ~0.02 s
+    saved = LATENCY_SAVED.value(upstream="test") - before
+    assert 0.04 <= saved < 0.5
+
+
+def test_primary_win_records_no_latency_saved():
+    caller = calibrated(latency=0.01)
+    before = LATENCY_SAVED.value(upstream="test")
+
+    assert asyncio.run(caller.call(Attempts(first_delay=0.03, later_delay=10.0))) == "answer 0"
+    assert LATENCY_SAVED.value(upstream="test") == before
@@ -0,0 +1,113 @@
+"""
+Behaviour tests for the HTTP caching helpers: Accept-Encoding negotiation, per-encoding
+ETags and 304 answers for static and dynamic bodies
+
+Run with:
+    python -m pytest test_http_cache.py
+"""
+
+import gzip
+
+import pytest
+
+import http_cache
+from http_cache import (StaticPayload, available_encodings, conditional_response, content_etag, encoded_etag,
+                        etag_matches, etag_variants, negotiate_encoding, parse_accept_encoding)
+
+ALL = ['br', 'gzip', 'identity']
+BODY = b'{"sections":[' + b'"Federated learning for CIOs",' * 40 + b'""]}'
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, br;q=0.5, *;q=0, x;q=bad") == {"gzip": 1.0, "br": 0.5, "*": 0.0, "x": 0.0}
+    assert parse_accept_encoding(None) == {}
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br", "br"),                     # equal q: server preference
+    ("gzip;q=1.0, br;q=0.5", "gzip"),      # higher q wins
+    ("br;q=0, gzip;q=0", "identity"),       # everything refused
+    ("identity", "identity"),
+    (None, "identity"),
+    ("*", "br"),                            # wildcard covers every coding
+    ("*;q=0.5, gzip;q=0.8", "gzip"),       # explicit q beats the wildcard
+    ("*, br;q=0", "gzip"),                  # explicit refusal beats the wildcard
+    ("GZIP", "gzip"),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ALL) == expected
+
+
+def test_negotiate_encoding_only_offers_available_codings():
+    assert negotiate_encoding("br", ['gzip', 'identity']) == "identity"
+    assert negotiate_encoding("br, gzip;q=0.1", ['gzip', 'identity']) == "gzip"
+
+
+def test_etags_differ_per_encoding():
+    etag = content_etag(BODY)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert encoded_etag(etag, "identity") == etag
+    assert encoded_etag(etag, "gzip") == etag[:-1] + '-gzip"'
+    assert len(set(etag_variants(etag))) == len(available_encodings())
+    assert etag in etag_variants(etag)
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = content_etag(BODY)
+    gzip_etag = encoded_etag(etag, "gzip")
+    assert etag_matches(f'"other", W/{gzip_etag}', etag_variants(etag))
+    assert etag_matches("*", [etag])
+    assert not etag_matches('"other"', etag_variants(etag))
+    assert not etag_matches(None, [etag])
+
+
+def test_conditional_response_compresses_and_tags_the_encoding():
+    etag = content_etag(BODY)
+    status, body, headers = conditional_response(BODY, etag, None, "gzip", min_size=100)
+
+    assert status == 200
+    assert gzip.decompress(body) == BODY
+    assert headers == {"Vary": "Accept-Encoding", "Content-Encoding": "gzip", "ETag": encoded_etag(etag, "gzip")}
+
+    # Small bodies are sent as they are
+    status, body, headers = conditional_response(BODY, etag, None, "gzip", min_size=len(BODY) + 1)
+    assert (status, body, headers["ETag"]) == (200, BODY, etag)
+    assert "Content-Encoding" not in headers
+
+
+def test_conditional_response_answers_304_for_any_held_representation():
+    etag = content_etag(BODY)
+    gzip_etag = encoded_etag(etag, "gzip")
+
+    # A client that cached the gzip body and now only accepts identity is still current
+    status, body, headers = conditional_response(BODY, etag, gzip_etag, None, min_size=100)
+    assert (status, body) == (304, b"")
+    assert headers == {"ETag": etag, "Vary": "Accept-Encoding"}
+
+    status, _, headers = conditional_response(BODY, etag, etag, "gzip", min_size=100)
+    assert status == 304
+    assert headers["ETag"] == gzip_etag
+
+    status, _, _ = conditional_response(BODY, content_etag(b"changed"), etag, "gzip", min_size=100)
+    assert status == 200
+
+
+def test_static_payload():
+    payload = StaticPayload({"brief": "Federated learning for CIOs" * 20}, max_age=60)
+
+    status, body, headers = payload.respond(None, "gzip")
+    assert status == 200
+    assert gzip.decompress(body) == payload.body
+    assert headers["ETag"] == payload.etags["gzip"] != payload.etags["identity"]
+    assert headers["Cache-Control"] == "public, max-age=60"
+
+    status, body, headers = payload.respond(payload.etags["gzip"], None)
+    assert (status, body) == (304, b"")
+    assert headers["ETag"] == payload.etags["identity"]
+    assert "Content-Encoding" not in headers
+
+
+def test_available_encodings_without_brotli(monkeypatch):
+    monkeypatch.setattr(http_cache, "brotli", None)
+    assert available_encodings() == ['gzip', 'identity']
+    assert negotiate_encoding("br, gzip", available_encodings()) == "gzip"
@@ -0,0 +1,64 @@
+"""
+Import-time budget check for the backend entry points
+
+Each module is imported in a fresh interpreter with `-X importtime`; the test fails if
+a heavy dependency (Gemini SDK, ReportLab, requests) is loaded at import or the
+cumulative import time exceeds the budget (IMPORT_BUDGET_MS, default 400 ms).
+
+Run with:
+    python -m pytest test_import_time.py
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "400"))
+
+# Only needed once a brief is generated
+HEAVY_MODULES = ["google.generativeai", "reportlab", "requests"]
+
+# module -> third-party packages it needs to be importable at all
+ENTRY_POINTS = {
+    "brief_formatter": [],
+    "agentic_brief_enhanced": [],
+    "api_server": ["flask", "flask_cors"],
+    "asgi_server": ["starlette"],
+}
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)\s*$')
+
+
+def import_profile(module: str):
+    """Imports a module in a fresh interpreter, returning (cumulative ms, heavy modules loaded)"""
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match and match.group(2) == module:
+            cumulative_us = int(match.group(1))
+    assert cumulative_us is not None, f"no -X importtime entry for {module}"
+
+    loaded = [name for name in proc.stdout.strip().split(',') if name]
+    return cumulative_us / 1000, loaded
+
+
+@pytest.mark.parametrize("module", list(ENTRY_POINTS))
+def test_import_stays_within_budget(module):
+    for requirement in ENTRY_POINTS[module]:
+        pytest.importorskip(requirement)
+
+    elapsed_ms, loaded = import_profile(module)
+
+    assert not loaded, f"{module} imports heavy dependencies at import time: {loaded}"
+    assert elapsed_ms <= BUDGET_MS, f"{module} took {elapsed_ms:.0f} ms to import (budget {BUDGET_MS:.0f} ms)"
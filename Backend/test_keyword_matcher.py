@@ -0,0 +1,46 @@
+"""
+Behaviour tests for the compiled multi-keyword matcher: every keyword contained in a text is
+found, including keywords that overlap or sit inside other keywords
+
+Run with:
+    python -m pytest test_keyword_matcher.py
+"""
+
+import random
+
+from keyword_matcher import KeywordMatcher
+
+
+def test_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(["ai", "pai", "campaign", "governance", "AI governance"])
+
+    # "campaign" contains "pai" and "ai"; "ai governance" contains both of its words
+    assert matcher.hits("Campaign for AI Governance") == {"ai", "pai", "campaign", "governance", "ai governance"}
+    assert matcher.hits("campaign") == {"ai", "pai", "campaign"}
+    assert KeywordMatcher(["aa", "aaa"]).hits("aaaa") == {"aa", "aaa"}
+
+
+def test_same_result_as_substring_checks():
+    keywords = ["ai", "tech", "enabled", "ideas", "l1", "level", "market", "trend", "demand", "edge", "verve",
+                "edgeverve", "channel", "mediums", "digital", "assets", "asset"]
+    matcher = KeywordMatcher(keywords)
+    rng = random.Random(3)
+    words = keywords + ["AI-enabled", "EdgeVerve", "marketing", "trending", "x", "channels"]
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+        assert matcher.hits(text) == {keyword for keyword in keywords if keyword in text.lower()}, text
+
+
+def test_any_in_and_first_group():
+    matcher = KeywordMatcher(["ai", "governance"])
+    assert matcher.any_in("Responsible AI")
+    assert not matcher.any_in("nothing here")
+    assert matcher.first_group("AI governance", [["cloud"], ["Governance"], ["ai"]]) == 1
+    assert matcher.first_group("cloud", [["ai"]]) is None
+
+
+def test_empty_keyword_list():
+    matcher = KeywordMatcher(["", None])
+    assert matcher.keywords == []
+    assert matcher.hits("anything") == set()
+    assert not matcher.any_in("anything")
@@ -0,0 +1,102 @@
+"""
+Behaviour tests for brief generation around the Gemini call: the research that runs per
+profile and how the reply is turned into sections (Gemini itself is replaced)
+
+Run with:
+    python -m pytest test_orchestrator.py
+"""
+
+import asyncio
+
+import pytest
+
+from agentic_brief_enhanced import (DEMO_INPUTS, AgenticBriefOrchestrator, AudienceResearchAgent,
+                                    CompetitorResearchAgent, TrendsResearchAgent, build_inputs)
+from brief_formatter import build_brief_response
+from profiles import get_profile
+
+
+def orchestrator(generated=None, structured_output: bool = False) -> AgenticBriefOrchestrator:
+    """Orchestrator with offline research agents; generated is what the guarded Gemini call returns"""
+    instance = object.__new__(AgenticBriefOrchestrator)
+    instance.structured_output = structured_output
+    instance.competitor_agent = CompetitorResearchAgent()
+    instance.trends_agent = TrendsResearchAgent()
+    instance.audience_agent = AudienceResearchAgent()
+
+    async def generate(*args):
+        return generated
+
+    instance._generate_guarded = generate
+    return instance
+
+
+def generate(instance: AgenticBriefOrchestrator, profile: str = "standard") -> dict:
+    result = asyncio.run(instance.generate_enhanced_brief(dict(DEMO_INPUTS), profile=get_profile(profile)))
+    return result["generation_metadata"]
+
+
+@pytest.mark.parametrize("profile, competitor", [("fast", "competitor_catalog"), ("standard", "competitor")])
+def test_agents_used_reports_the_research_that_ran(profile, competitor):
+    metadata = generate(orchestrator(), profile)
+    assert metadata["agents_used"] == [competitor, "trends", "audience"]
+    assert metadata["degraded"] is True
+
+
+STRUCTURED_REPLY = '{"business_objective": {"summary": "Lead Applied AI for enterprises", "bullets": ["Grow pipeline"]}}'
+
+
+def test_structured_reply_is_decoded():
+    metadata = generate(orchestrator((STRUCTURED_REPLY, False), structured_output=True))
+    assert metadata["output_mode"] == "structured"
+    assert metadata["decode_failed"] is False
+
+
+def test_undecodable_json_falls_back_to_research_data():
+    instance = orchestrator(('{"business_objective": {"summary": "Lead Applied', False), structured_output=True)
+    result = asyncio.run(instance.generate_enhanced_brief(dict(DEMO_INPUTS), profile=get_profile()))
+    metadata = result["generation_metadata"]
+
+    assert metadata["decode_failed"] is True
+    assert metadata["degraded"] is True
+    assert metadata["output_mode"] == "template"
+    assert "brief_generator" not in metadata["agents_used"]
+    assert '"summary"' not in result["brief_content"]
+    assert build_brief_response(result).metadata.decode_failed is True
+
+
+def test_markdown_reply_in_structured_mode_is_parsed_as_markdown():
+    reply = "**Business Objective**\nLead Applied AI for enterprises\n"
+    metadata = generate(orchestrator((reply, False), structured_output=True))
+    assert metadata["decode_failed"] is True
+    assert metadata["degraded"] is False
+    assert metadata["output_mode"] == "markdown"
+
+
+def test_build_inputs_applies_overrides():
+    inputs = build_inputs({"industry": "Healthcare", "differentiators": ["HIPAA-ready"]})
+    assert inputs["industry"] == "Healthcare"
+    assert inputs["differentiators"] == ["HIPAA-ready"]
+    assert inputs["company_name"] == DEMO_INPUTS["company_name"]
+    assert build_inputs() == DEMO_INPUTS
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"industry": 5}, "'industry' must be a string"),
+    ({"industry": ["Healthcare"]}, "'industry' must be a string"),
+    ({"differentiators": "HIPAA-ready"}, "'differentiators' must be a list of strings"),
+    ({"differentiators": ["HIPAA-ready", 3]}, "'differentiators' must be a list of strings"),
+    ({"industri": "Healthcare"}, "Unknown input fields: industri"),
+    (["industry"], "'inputs' must be an object"),
+])
+def test_build_inputs_rejects_bad_values(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        build_inputs(overrides)
+
+
+def test_bad_input_value_is_a_400():
+    import api_server
+
+    response = api_server.app.test_client().post("/generate-brief", json={"inputs": {"industry": 5}})
+    assert response.status_code == 400
+    assert "'industry' must be a string" in response.get_json()["error"]
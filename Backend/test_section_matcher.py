@@ -0,0 +1,66 @@
+"""
+Behaviour tests for the compiled section matcher: header-to-section assignment must match
+BriefFormatter as it was before the matcher (kept in bench_formatter.py)
+
+Run with:
+    python -m pytest test_section_matcher.py
+"""
+
+import random
+
+import pytest
+
+from bench_formatter import (SECTION_TITLES, BaselineBriefFormatter, baseline_contents, build_brief,
+                             compiled_contents, template_brief)
+from brief_formatter import BriefFormatter
+from section_matcher import SectionMatcher, get_section_matcher
+
+
+@pytest.fixture(scope="module")
+def formatters():
+    return BriefFormatter(), BaselineBriefFormatter()
+
+
+def test_matches_the_legacy_formatter_on_generated_briefs(formatters):
+    new, baseline = formatters
+    rng = random.Random(7)
+    for _ in range(150):
+        brief = build_brief(rng, rng.randint(1, 40), rng.randint(0, 4), numbered=rng.random() < 0.3)
+        assert compiled_contents(new, brief) == baseline_contents(baseline, brief), brief
+
+
+def test_matches_the_legacy_formatter_on_template_briefs(formatters):
+    new, baseline = formatters
+    rng = random.Random(11)
+    for _ in range(20):
+        brief = template_brief(rng, 2)
+        assert compiled_contents(new, brief) == baseline_contents(baseline, brief), brief
+
+
+def test_header_detection_matches_the_legacy_formatter(formatters):
+    new, baseline = formatters
+    for line in ["**Background**", "## Target Audience", "BUSINESS OBJECTIVE", "Why Now?", "Timeline:",
+                 "- Increase brand recognition among CIOs by 40%", "1. **Platform Brand Awareness:** reach",
+                 "EdgeVerve delivers unified AI across the enterprise with built-in governance."]:
+        assert new._is_header_line(line) == baseline._is_header_line(line), line
+
+
+def test_sections_for_header():
+    matcher = SectionMatcher(SECTION_TITLES)
+    # Half of a pattern's keywords are enough: "persona" alone names the audience section
+    assert matcher.sections_for_header("Persona Deep Dive") == {SECTION_TITLES.index("Target Audience")}
+    # One header can match several sections
+    assert matcher.sections_for_header("Digital Campaign Videos") == {
+        SECTION_TITLES.index("Digital Campaign Videos"), SECTION_TITLES.index("Channels / Campaign Digital Mediums")}
+    assert matcher.sections_for_header("Appendix") == set()
+
+
+def test_assign_keeps_the_first_matching_header():
+    matcher = SectionMatcher(SECTION_TITLES)
+    assigned = matcher.assign(["Persona Deep Dive", "Target Audience", "Background"])
+    assert assigned == {SECTION_TITLES.index("Target Audience"): "Persona Deep Dive",
+                        SECTION_TITLES.index("Background"): "Background"}
+
+
+def test_matchers_are_shared_per_title_set():
+    assert get_section_matcher(tuple(SECTION_TITLES)) is get_section_matcher(tuple(SECTION_TITLES))
@@ -0,0 +1,61 @@
+"""
+Behaviour tests for audience segment matching: plural folding, phrase keywords, rarity
+weighting and the default profile
+
+Run with:
+    python -m pytest test_segment_index.py
+"""
+
+import pytest
+
+from segment_index import SegmentIndex, get_segment_index
+from text_utils import stem, tokenize
+
+
+def test_stem_folds_plurals():
+    assert [stem(word) for word in ("owners", "companies", "businesses", "women", "boss", "bus")] == \
+        ["owner", "company", "business", "woman", "boss", "bus"]
+    assert tokenize("Small Business-Owners") == ["small", "business", "owner"]
+
+
+@pytest.mark.parametrize("audience, segment", [
+    ("healthcare professionals", "healthcare_professionals"),
+    ("small business owners", "small_business_owners"),
+    ("CIO/CIO-1 at $1-5B enterprises", "enterprise_it_leaders"),
+    ("Chief Information Officers and IT directors at large enterprises", "enterprise_it_leaders"),
+])
+def test_shipped_segments_match(audience, segment):
+    assert get_segment_index().match(audience)[0] == segment
+
+
+def test_generic_words_fall_back_to_default_profile():
+    index = get_segment_index()
+    assert index.match("Professionals") is None
+    assert index.match("") is None
+    assert index.profile("Professionals") == index.default
+
+
+def test_rare_phrases_outweigh_common_words():
+    index = SegmentIndex({
+        "nurses": {"keywords": {"nurse": 1.0, "professional": 0.5}},
+        "lawyers": {"keywords": {"lawyer": 1.0, "professional": 0.5}},
+        "clinicians": {"keywords": {"clinical staff": 1.0}, "profile": {"age_range": "30-55"}},
+    }, default={"primary_segment": "General"})
+
+    # "professional" is shared, so it scores below its weight; "nurse" keeps its full weight
+    assert index.scores("professional")[0] < 0.5
+    assert index.scores("nurse")[0] == 1.0
+    assert index.match("professional nurses")[0] == "nurses"
+    assert index.match("professional", min_score=0.0)[0] == "nurses"  # earlier segment wins ties
+    assert index.match("professional") is None
+
+    # Phrases only match as a whole
+    assert index.match("clinical staff")[0] == "clinicians"
+    assert index.match("staff") is None
+    assert index.profile("Clinical staff") == {"primary_segment": "Clinicians", "age_range": "30-55"}
+    assert index.profile("staff") == {"primary_segment": "General"}
+
+
+def test_keywords_default_to_the_segment_key():
+    index = SegmentIndex({"small_business_owners": {}}, default={})
+    assert index.match("business owners")[0] == "small_business_owners"
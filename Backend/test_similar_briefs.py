@@ -0,0 +1,116 @@
+"""
+Behaviour tests for the near-duplicate index over stored briefs
+
+Run with:
+    python -m pytest test_similar_briefs.py
+"""
+
+import pytest
+
+from brief_store import BriefStore
+from similar_briefs import SimilarBriefIndex, normalize_words
+from test_brief_store import make_response
+
+INPUTS = {
+    "company_name": "EdgeVerve",
+    "industry": "enterprise_ai",
+    "target_audience": "CIO/CIO-1 at $1-5B enterprises",
+    "key_message": "Scale AI across the enterprise",
+}
+REWORDED = {**INPUTS, "target_audience": "CIOs and CIO-1 of $1B-$5B companies"}
+UNRELATED = {
+    "company_name": "Globex",
+    "industry": "retail",
+    "target_audience": "Store managers",
+    "key_message": "Cut checkout queues",
+}
+
+
+def put(store: BriefStore, inputs: dict, profile: str = "standard") -> str:
+    return store.put(make_response("Brief", profile), {"generation_metadata": {"stakeholder_inputs": inputs}})[0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BriefStore(str(tmp_path / "briefs.db"))
+
+
+def test_normalize_words_unifies_units_plurals_and_synonyms():
+    assert normalize_words("CIOs at $1-5B enterprises") == normalize_words("CIO of 1b-5b companies")
+
+
+def test_find_matches_reworded_inputs(store):
+    brief_id = put(store, INPUTS)
+    put(store, UNRELATED)
+    index = SimilarBriefIndex(store)
+
+    matches = index.find(REWORDED)
+    assert [match.brief_id for match in matches] == [brief_id]
+    assert matches[0].similarity >= index.threshold
+    assert index.find(REWORDED, profile="fast") == []
+
+
+def test_newer_brief_stands_for_the_same_inputs(store):
+    index = SimilarBriefIndex(store)
+    put(store, INPUTS)
+    assert len(index.find(INPUTS)) == 1
+    newer = put(store, INPUTS)
+
+    assert [match.brief_id for match in index.find(INPUTS)] == [newer]
+    assert len(index) == 1
+
+
+def test_catches_up_after_the_newest_brief_is_deleted(store):
+    index = SimilarBriefIndex(store)
+    first = put(store, INPUTS)
+    assert [match.brief_id for match in index.find(INPUTS)] == [first]
+
+    store.delete(first)
+    index.discard(first)
+    assert index.find(INPUTS) == []
+
+    second = put(store, INPUTS)
+    assert [match.brief_id for match in index.find(INPUTS)] == [second]
+
+
+def test_older_brief_stands_for_the_inputs_once_the_newer_is_deleted(store):
+    index = SimilarBriefIndex(store)
+    older = put(store, INPUTS)
+    newer = put(store, INPUTS)
+    assert [match.brief_id for match in index.find(INPUTS)] == [newer]
+
+    store.delete(newer)
+    index.discard(newer)
+    assert [match.brief_id for match in index.find(INPUTS)] == [older]
+
+    # Discarding twice, or a brief the index never saw, changes nothing
+    index.discard(newer)
+    index.discard("unknown")
+    assert [match.brief_id for match in index.find(INPUTS)] == [older]
+
+    store.delete(older)
+    index.discard(older)
+    assert index.find(INPUTS) == []
+
+
+def test_cached_falls_back_to_an_older_brief_deleted_elsewhere(store):
+    index = SimilarBriefIndex(store)
+    older = put(store, INPUTS)
+    newer = put(store, INPUTS)
+    assert index.cached(INPUTS, "standard")[0].brief_id == newer
+
+    store.delete(newer)
+    match, body, etag = index.cached(INPUTS, "standard")
+    assert match.brief_id == older
+    assert (body, etag) == store.get(older)
+
+
+def test_cached_skips_briefs_deleted_by_another_worker(store):
+    index = SimilarBriefIndex(store)
+    brief_id = put(store, INPUTS)
+    match, body, etag = index.cached(REWORDED, "standard")
+    assert match.brief_id == brief_id
+    assert (body, etag) == store.get(brief_id)
+
+    store.delete(brief_id)
+    assert index.cached(REWORDED, "standard") is None
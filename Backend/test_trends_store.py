@@ -0,0 +1,121 @@
+"""
+Behaviour tests for the keyword trends store: rising/declining/emerging rankings on a small
+synthetic series and the parsed-matrix cache next to the data file
+
+Run with:
+    python -m pytest test_trends_store.py
+"""
+
+import csv
+import datetime
+
+import pytest
+
+from trends_store import TrendsStore
+
+WEEKS = 70
+START = datetime.date(2025, 1, 6)
+
+
+def ramp(start: float, end: float, flat_weeks: int = 0):
+    """Flat at start for flat_weeks, then linear to end"""
+    steps = WEEKS - flat_weeks - 1
+    return [start] * flat_weeks + [start + (end - start) * i / steps for i in range(steps + 1)]
+
+
+SERIES = {
+    ("healthcare", "telehealth"): ramp(50, 80),
+    ("healthcare", "fax machines"): ramp(60, 30),
+    ("healthcare", "ai scribe"): ramp(2, 40, flat_weeks=52),
+    ("healthcare", "ehr"): ramp(20, 20),
+    ("retail", "self checkout"): ramp(20, 30),
+}
+
+
+def rows(series=SERIES):
+    for (industry, keyword), values in series.items():
+        for week, interest in enumerate(values):
+            yield industry, keyword, (START + datetime.timedelta(weeks=week)).isoformat(), interest
+
+
+def write_csv(path, series=SERIES):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["week", "industry", "keyword", "interest"])
+        writer.writerows((week, industry, keyword, interest) for industry, keyword, week, interest in rows(series))
+
+
+@pytest.fixture
+def store():
+    return TrendsStore.from_rows(rows())
+
+
+def test_industry_trends(store):
+    trends = store.industry_trends("Healthcare")
+
+    assert [item.split(" +")[0] for item in trends["rising_searches"]] == ["telehealth"]
+    assert [item.split(" -")[0] for item in trends["declining_searches"]] == ["fax machines"]
+    # The breakout from a near-zero base is hot but reported as emerging, not as a rising search
+    assert trends["hot_topics"] == ["telehealth", "ai scribe"]
+    assert trends["growth_rate"].endswith("% YoY")
+
+
+def test_emerging_topics(store):
+    assert store.emerging_topics("healthcare") == ["ai scribe"]
+    assert store.emerging_topics("retail") == []
+
+
+def test_unknown_industry_uses_every_keyword(store):
+    assert not store.has_industry("aerospace")
+    assert store.has_industry("Retail")
+    assert "self checkout" in store.industry_trends("aerospace")["hot_topics"]
+
+
+def test_seasonal_patterns_need_a_year_of_data(store):
+    patterns = store.seasonal_patterns("healthcare")
+    assert set(patterns) == {"q1", "q2", "q3", "q4", "peak_quarter", "best_launch_timing"}
+
+    short = TrendsStore.from_rows(row for row in rows() if row[2] < "2025-06-01")
+    assert short.seasonal_patterns("healthcare") is None
+
+
+def test_from_rows_orders_weeks_and_fills_gaps():
+    store = TrendsStore.from_rows([
+        ("retail", "a", "2025-01-13", 5),
+        ("retail", "a", "2025-01-06", 3),
+        ("retail", "b", "2025-01-13", 7),
+    ])
+    assert [str(week) for week in store.weeks] == ["2025-01-06", "2025-01-13"]
+    assert store.interest.tolist() == [[3, 5], [0, 7]]
+
+
+def test_load_caches_the_parsed_matrix(tmp_path, monkeypatch):
+    path = str(tmp_path / "trends.csv")
+    write_csv(path)
+
+    first = TrendsStore.load(path)
+    assert (tmp_path / "trends.csv.npz").exists()
+    assert not list(tmp_path.glob("*.tmp.npz"))
+
+    # An unchanged file is served from the cache without parsing
+    parsed = TrendsStore.from_file
+    monkeypatch.setattr(TrendsStore, "from_file", classmethod(lambda cls, p: pytest.fail("cache not used")))
+    cached = TrendsStore.load(path)
+    assert cached.keywords == first.keywords
+    assert cached.interest.tolist() == first.interest.tolist()
+    assert cached.emerging_topics("healthcare") == first.emerging_topics("healthcare")
+    monkeypatch.setattr(TrendsStore, "from_file", parsed)
+
+    # Changing the data file invalidates the cache
+    write_csv(path, {**SERIES, ("retail", "scan and go"): ramp(1, 30, flat_weeks=52)})
+    changed = TrendsStore.load(path)
+    assert "scan and go" in changed.keywords
+    assert changed.emerging_topics("retail") == ["scan and go"]
+
+
+def test_load_rebuilds_an_unreadable_cache(tmp_path):
+    path = str(tmp_path / "trends.csv")
+    write_csv(path)
+    (tmp_path / "trends.csv.npz").write_bytes(b"not a cache")
+
+    assert TrendsStore.load(path).emerging_topics("healthcare") == ["ai scribe"]
@@ -0,0 +1,71 @@
+"""
+Behaviour tests for worker warm-up in the Flask app: started once per process when the app is
+created, again in workers forked from a preloaded app, and reported through /ready
+
+Run with:
+    python -m pytest test_warmup.py
+"""
+
+import os
+
+import pytest
+
+import api_server
+from warmup import Readiness
+
+
+@pytest.fixture
+def started(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api_server, "WARMUP_ON_START", True)
+    monkeypatch.setattr(api_server, "_warmup_pid", None)
+    monkeypatch.setattr(api_server, "start_background_warmup", lambda build, run: calls.append(os.getpid()))
+    return calls
+
+
+def test_warmup_starts_once_per_process(started):
+    api_server.start_worker_warmup()
+    api_server.start_worker_warmup()
+    assert started == [os.getpid()]
+
+
+def test_warmup_is_off_by_default(started, monkeypatch):
+    monkeypatch.setattr(api_server, "WARMUP_ON_START", False)
+    api_server.start_worker_warmup()
+    assert started == []
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_worker_warms_up_with_its_own_demo(started, monkeypatch):
+    api_server.start_worker_warmup()
+    monkeypatch.setattr(api_server, "_demo", object())
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: the at-fork hook has already run
+        ok = started == [os.getppid(), os.getpid()] and api_server._demo is None
+        os.write(write, b"1" if ok else b"0")
+        os._exit(0)
+    os.close(write)
+    result = os.read(read, 1)
+    os.waitpid(pid, 0)
+    os.close(read)
+
+    assert result == b"1"
+    assert started == [os.getpid()]
+    assert api_server._demo is not None
+
+
+def test_ready_is_503_while_warming(monkeypatch):
+    readiness = Readiness()
+    monkeypatch.setattr(api_server, "readiness", readiness)
+    client = api_server.app.test_client()
+
+    assert client.get("/ready").status_code == 200
+    readiness.begin()
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "warming_up"
+    readiness.finish()
+    assert client.get("/ready").status_code == 200
@@ -0,0 +1,28 @@
+"""
+Shared word tokenizer for keyword matching (audience segments, competitor positioning)
+Text is lowercased and split into runs of letters and digits, and plurals are folded so
+"Business Owners" and "business owner" produce the same terms.
+"""
+
+import re
+from typing import List
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+IRREGULAR = {"women": "woman", "men": "man", "people": "person", "children": "child"}
+
+
+def stem(word: str) -> str:
+    """Light plural folding: owners -> owner, companies -> company, businesses -> business"""
+    if word in IRREGULAR:
+        return IRREGULAR[word]
+    if word.endswith("sses"):
+        return word[:-2]
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(word) for word in WORD_RE.findall((text or "").lower())]
@@ -0,0 +1,241 @@
+"""
+Keyword interest time series for TrendsResearchAgent
+Weekly search interest per (industry, keyword), loaded from a long-format CSV or Parquet file
+(industry, keyword, week, interest) into one NumPy matrix: a row per keyword, a column per week.
+Growth, rising/declining rankings, quarterly seasonality and emerging-topic detection are whole-
+array operations over an industry's rows, so tens of thousands of keywords take milliseconds.
+"""
+
+import csv
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from competitor_kb import normalize_key
+from config import TRENDS_DATA_PATH
+
+# Weeks averaged for "now" and for the same period a year earlier
+WINDOW_WEEKS = 13
+YEAR_WEEKS = 52
+# Emerging: interest a year ago in the bottom quartile of the industry, now at least doubled and
+# still climbing over the last window
+EMERGING_BASE_QUANTILE = 0.25
+EMERGING_MIN_RATIO = 2.0
+MAX_ITEMS = 5
+
+
+def _numpy():
+    # NumPy adds ~60 ms to import; load it with the first analysis, not with the server
+    import numpy
+    return numpy
+
+
+class TrendsStore:
+    """Interest matrix (keywords x weeks) with per-industry row groups"""
+
+    def __init__(self, industries: Sequence[str], keywords: Sequence[str], weeks, interest):
+        np = _numpy()
+        self.keywords = list(keywords)
+        self.weeks = np.asarray(weeks, dtype="datetime64[D]")
+        self.interest = np.asarray(interest, dtype=np.float32)
+        # Calendar quarter (0-3) of every week column
+        self.quarters = (self.weeks.astype("datetime64[M]").astype(np.int64) % 12) // 3
+
+        codes: Dict[str, List[int]] = {}
+        for row, industry in enumerate(industries):
+            codes.setdefault(normalize_key(industry), []).append(row)
+        self._rows = {industry: np.asarray(rows, dtype=np.intp) for industry, rows in codes.items()}
+        self._all_rows = np.arange(len(self.keywords), dtype=np.intp)
+
+    @classmethod
+    def from_file(cls, path: str) -> "TrendsStore":
+        """Reads a long-format CSV, or Parquet when the path ends in .parquet (needs pyarrow)"""
+        if path.endswith(".parquet"):
+            import pyarrow.parquet
+            table = pyarrow.parquet.read_table(path, columns=["industry", "keyword", "week", "interest"])
+            columns = table.to_pydict()
+            rows = zip(columns["industry"], columns["keyword"], map(str, columns["week"]), columns["interest"])
+            return cls.from_rows(rows)
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            order = [header.index(column) for column in ("industry", "keyword", "week", "interest")]
+            return cls.from_rows([row[i] for i in order] for row in reader)
+
+    @classmethod
+    def from_rows(cls, rows) -> "TrendsStore":
+        """Builds the matrix from (industry, keyword, week, interest) rows; missing weeks are 0"""
+        np = _numpy()
+        series: Dict[tuple, int] = {}
+        weeks: Dict[str, int] = {}
+        series_ids, week_ids, values = [], [], []
+        for industry, keyword, week, interest in rows:
+            series_ids.append(series.setdefault((industry, keyword), len(series)))
+            week_ids.append(weeks.setdefault(str(week)[:10], len(weeks)))
+            values.append(interest)
+
+        # ISO dates sort as strings; remap first-seen week ids to chronological columns
+        ordered = sorted(weeks)
+        column = np.empty(len(ordered), dtype=np.intp)
+        column[[weeks[week] for week in ordered]] = np.arange(len(ordered))
+
+        interest = np.zeros((len(series), len(ordered)), dtype=np.float32)
+        interest[np.asarray(series_ids, dtype=np.intp), column[np.asarray(week_ids, dtype=np.intp)]] = \
+            np.asarray(values, dtype=np.float32)
+        return cls([industry for industry, _ in series], [keyword for _, keyword in series], ordered, interest)
+
+    @classmethod
+    def load(cls, path: str) -> "TrendsStore":
+        """from_file through a parsed-matrix cache (<path>.npz), rebuilt when the data file changes;
+        parsing millions of rows takes seconds, loading the cache milliseconds"""
+        np = _numpy()
+        stat = os.stat(path)
+        source = f"{stat.st_size}:{stat.st_mtime_ns}"
+        cache_path = path + ".npz"
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if str(cached["source"]) == source:
+                    return cls(cached["industries"].tolist(), cached["keywords"].tolist(), cached["weeks"],
+                               cached["interest"])
+        except (OSError, KeyError, ValueError):
+            pass
+
+        store = cls.from_file(path)
+        industries = [""] * len(store.keywords)
+        for industry, rows in store._rows.items():
+            for row in rows.tolist():
+                industries[row] = industry
+        try:
+            # Written aside and renamed so concurrent workers never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, source=np.array(source), industries=np.array(industries),
+                     keywords=np.array(store.keywords), weeks=store.weeks, interest=store.interest)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        print(f"📈 Loaded keyword trends from {os.path.basename(path)}")
+        return store
+
+    def has_industry(self, industry: str) -> bool:
+        return normalize_key(industry) in self._rows
+
+    def _industry_rows(self, industry: str):
+        """Rows of an industry, or every keyword when the industry is unknown"""
+        return self._rows.get(normalize_key(industry), self._all_rows)
+
+    @staticmethod
+    def _windows(series):
+        """(mean interest over the last window, mean over the same weeks a year earlier) per row"""
+        weeks = series.shape[1]
+        window = min(WINDOW_WEEKS, weeks)
+        recent = series[:, weeks - window:].mean(axis=1)
+        # Same weeks a year back when there is that much history, else the earliest window
+        end = weeks - YEAR_WEEKS if weeks >= YEAR_WEEKS + window else window
+        prior = series[:, end - window:end].mean(axis=1)
+        return recent, prior
+
+    @staticmethod
+    def _growth(recent, prior):
+        """Percent change; interest is on a 0-100 scale, so a zero base counts as 1"""
+        return (recent - prior) / _numpy().maximum(prior, 1.0) * 100
+
+    @staticmethod
+    def _top(values, mask, limit: int, descending: bool = True) -> List[int]:
+        """Positions of the limit largest (or smallest) values where mask holds"""
+        np = _numpy()
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+        keys = -values[candidates] if descending else values[candidates]
+        if candidates.size > limit:
+            part = np.argpartition(keys, limit - 1)[:limit]
+            candidates, keys = candidates[part], keys[part]
+        return candidates[np.argsort(keys, kind="stable")].tolist()
+
+    @staticmethod
+    def _emerging(series, recent, prior):
+        """Mask of keywords that were niche a year ago and are now accelerating, and their ratios"""
+        np = _numpy()
+        window = min(WINDOW_WEEKS, series.shape[1])
+        # Least-squares slope of every keyword over the last window in one matrix product
+        x = np.arange(window, dtype=np.float32)
+        x -= x.mean()
+        slope = (series[:, -window:] - recent[:, None]) @ x / float((x * x).sum() or 1.0)
+
+        ratio = recent / np.maximum(prior, 1.0)
+        base = np.quantile(prior, EMERGING_BASE_QUANTILE)
+        return (prior <= base) & (ratio >= EMERGING_MIN_RATIO) & (slope > 0), ratio
+
+    def industry_trends(self, industry: str, limit: int = MAX_ITEMS) -> Dict:
+        """Year-over-year growth of the industry, rising and declining searches and hot topics"""
+        rows = self._industry_rows(industry)
+        series = self.interest[rows]
+        recent, prior = self._windows(series)
+        growth = self._growth(recent, prior)
+        total_growth = float(self._growth(recent.sum(), prior.sum()))
+        # Breakouts from a near-zero base are reported as emerging topics, not as rising searches
+        emerging, _ = self._emerging(series, recent, prior)
+
+        rising = self._top(growth, (growth > 0) & ~emerging, limit)
+        declining = self._top(growth, growth < 0, limit, descending=False)
+        # Hot: the most searched keywords that are still growing
+        hot = self._top(recent, growth > 0, limit)
+        return {
+            "rising_searches": [f"{self.keywords[rows[i]]} {growth[i]:+.0f}%" for i in rising],
+            "declining_searches": [f"{self.keywords[rows[i]]} {growth[i]:+.0f}%" for i in declining],
+            "hot_topics": [self.keywords[rows[i]] for i in hot],
+            "growth_rate": f"{total_growth:+.0f}% YoY",
+        }
+
+    def quarter_index(self, industry: str) -> Optional[List[float]]:
+        """Average interest per calendar quarter with the long-term trend removed (100 = average
+        quarter); None with less than a year of data"""
+        np = _numpy()
+        total = self.interest[self._industry_rows(industry)].sum(axis=0, dtype=np.float64)
+        if total.size < YEAR_WEEKS:
+            return None
+        # Divide out an exponential trend so growth does not read as a late-year season
+        t = np.arange(total.size, dtype=np.float64)
+        slope, intercept = np.polyfit(t, np.log1p(total), 1)
+        detrended = (total + 1) / np.exp(intercept + slope * t)
+
+        counts = np.bincount(self.quarters, minlength=4)
+        means = np.bincount(self.quarters, weights=detrended, minlength=4) / np.maximum(counts, 1)
+        return [float(value) for value in means / means.mean() * 100]
+
+    def seasonal_patterns(self, industry: str) -> Optional[Dict]:
+        """Quarter-by-quarter interest index, peak quarter and launch timing ahead of the peak"""
+        index = self.quarter_index(industry)
+        if index is None:
+            return None
+        peak = max(range(4), key=index.__getitem__)
+        low = min(range(4), key=index.__getitem__)
+        patterns = {}
+        for quarter, value in enumerate(index):
+            label = "Peak season, i" if quarter == peak else "Low season, i" if quarter == low else "I"
+            patterns[f"q{quarter + 1}"] = f"{label}nterest index {value:.0f} (100 = average quarter)"
+        patterns["peak_quarter"] = f"Q{peak + 1}"
+        # Launch the quarter before demand peaks, or at the peak itself
+        patterns["best_launch_timing"] = f"Q{(peak - 1) % 4 + 1} or Q{peak + 1} for maximum impact"
+        return patterns
+
+    def emerging_topics(self, industry: str, limit: int = MAX_ITEMS) -> List[str]:
+        """Keywords that were niche a year ago and are now accelerating, fastest first"""
+        rows = self._industry_rows(industry)
+        series = self.interest[rows]
+        recent, prior = self._windows(series)
+        emerging, ratio = self._emerging(series, recent, prior)
+        return [self.keywords[rows[i]] for i in self._top(ratio, emerging, limit)]
+
+
+_trends_store = None
+_trends_store_lock = threading.Lock()
+
+
+def get_trends_store() -> TrendsStore:
+    """Shared store loaded from TRENDS_DATA_PATH (or its cache) on first use"""
+    global _trends_store
+    with _trends_store_lock:
+        if _trends_store is None:
+            _trends_store = TrendsStore.load(TRENDS_DATA_PATH)
+        return _trends_store
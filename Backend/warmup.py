@@ -0,0 +1,138 @@
+"""
+Startup warm-up and readiness tracking
+Builds the SDK client, opens pooled connections, renders a throwaway PDF and fills the
+parsing caches before the worker reports ready, so the first real brief is not cold.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from io import BytesIO
+from typing import Callable, Optional, Tuple
+
+SAMPLE_BRIEF = """**Business Objective**
+Warm-up brief used to prime the parsers and ReportLab.
+
+**Marketing Objective**
+1. **Platform Brand Awareness:** Reach target accounts
+- Generate qualified leads
+"""
+
+
+class Readiness:
+    """Warm-up progress reported by the /ready endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.ready = True
+        self.started_at = None
+        self.finished_at = None
+        self.steps = {}
+        self.error = None
+
+    def begin(self):
+        """Marks the worker as warming up (not ready) until finish() is called"""
+        with self._lock:
+            self.ready = False
+            self.started_at = datetime.now().isoformat()
+
+    def record(self, step: str, elapsed_ms: float = None, error: str = None):
+        with self._lock:
+            self.steps[step] = {"ms": round(elapsed_ms, 1)} if error is None else {"error": error}
+
+    def finish(self, error: Optional[str] = None):
+        with self._lock:
+            self.error = error
+            self.ready = error is None
+            self.finished_at = datetime.now().isoformat()
+
+    def status(self) -> Tuple[int, dict]:
+        """Returns (HTTP status, payload) for /ready"""
+        with self._lock:
+            payload = {
+                "status": "ready" if self.ready else ("failed" if self.error else "warming_up"),
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "steps": dict(self.steps),
+                "timestamp": datetime.now().isoformat()
+            }
+            if self.error:
+                payload["error"] = self.error
+            return (200 if self.ready else 503), payload
+
+
+# One per worker process
+readiness = Readiness()
+
+# Network warm-up steps give up after this long (the worker still becomes ready)
+CONNECTION_TIMEOUT = 10
+
+
+def _step(name: str, func: Callable, required: bool = False):
+    """Runs one warm-up step, recording its duration or error"""
+    start = time.perf_counter()
+    try:
+        result = func()
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        print(f"⚠️ Warm-up step '{name}' failed: {error}")
+        readiness.record(name, error=error)
+        if required:
+            raise
+        return None
+    readiness.record(name, (time.perf_counter() - start) * 1000)
+    return result
+
+
+def _warm_caches():
+    from brief_document import parse_brief_document
+    from brief_formatter import BriefFormatter
+
+    # Compiles the section matcher and exercises the parse/render path once
+    BriefFormatter().parse_brief_content(SAMPLE_BRIEF, {}, document=parse_brief_document(SAMPLE_BRIEF))
+
+
+def _warm_pdf():
+    from pdf_brief_generator import SimplePDFGenerator
+
+    # Builds the shared stylesheet and loads ReportLab fonts; the output is discarded
+    SimplePDFGenerator().generate_brief_pdf(SAMPLE_BRIEF, {}, output_path=BytesIO())
+
+
+def _warm_serper(demo):
+    agent = demo.orchestrator.competitor_agent
+    if agent.serper_api_key:
+        # Opens the pooled TLS connection the first search will reuse
+        agent.session.head("https://google.serper.dev", timeout=CONNECTION_TIMEOUT)
+
+
+def run_warmup(build_demo: Callable, run_async: Callable):
+    """Warms one worker; build_demo returns the shared demo, run_async runs a coroutine to completion
+
+    Only building the demo is required - the other steps are best-effort.
+    """
+    readiness.begin()
+    print("🔥 Warming up worker...")
+    try:
+        demo = _step("sdk_client", build_demo, required=True)
+        _step("caches", _warm_caches)
+        _step("pdf_renderer", _warm_pdf)
+        _step("serper_connection", lambda: _warm_serper(demo))
+        _step("gemini_connection", lambda: run_async(asyncio.wait_for(
+            demo.orchestrator.client.count_tokens_async("warm-up"), CONNECTION_TIMEOUT)))
+    except Exception as e:
+        readiness.finish(str(e))
+        print(f"❌ Warm-up failed: {e}")
+        return
+
+    readiness.finish()
+    print("✅ Worker warm - ready for traffic")
+
+
+def start_background_warmup(build_demo: Callable, run_async: Callable) -> threading.Thread:
+    """Runs run_warmup in a daemon thread so the server can answer /health and /ready meanwhile"""
+    readiness.begin()
+    thread = threading.Thread(target=run_warmup, args=(build_demo, run_async), name="brief-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -687,6 +687,33 @@ export class AppComponent implements OnInit {
     this.isLoadingBriefSections = true;
     this.briefSectionsError = null;
 
+    // Reutilizar el último brief generado en lugar de generar uno nuevo
+    const lastBriefId = this.briefService.getLastBriefId();
+    if (lastBriefId) {
+      this.loadStoredBrief(lastBriefId);
+      return;
+    }
+
+    this.generateBriefSections();
+  }
+
+  // Cargar un brief guardado; si ya no existe en el backend, generar uno nuevo
+  private loadStoredBrief(briefId: string): void {
+    this.briefService.getBriefById(briefId).subscribe({
+      next: (sections) => {
+        this.briefSections = sections;
+        this.isLoadingBriefSections = false;
+        console.log('Stored brief loaded from backend:', briefId);
+      },
+      error: (error) => {
+        console.error('Error loading stored brief:', error);
+        this.briefService.forgetLastBriefId();
+        this.generateBriefSections();
+      }
+    });
+  }
+
+  private generateBriefSections(): void {
     this.briefService.getBriefSections().subscribe({
       next: (sections) => {
         this.briefSections = sections;
@@ -742,7 +769,9 @@ export class AppComponent implements OnInit {
 
   // Recargar secciones
   refreshBriefSections(): void {
-    this.loadBriefSections();
+    this.isLoadingBriefSections = true;
+    this.briefSectionsError = null;
+    this.generateBriefSections();
   }
 
   // Buscar secciones
@@ -1,6 +1,6 @@
 import { Injectable } from '@angular/core';
 import { HttpClient, HttpErrorResponse } from '@angular/common/http';
-import { Observable, of, delay, map, catchError, throwError } from 'rxjs';
+import { Observable, of, delay, map, catchError, throwError, tap } from 'rxjs';
 
 export interface BriefSection {
   id: number;
@@ -32,6 +32,7 @@ export interface BriefTemplate {
 
 // Backend response interfaces
 export interface BackendResponse {
+  brief_id?: string;
   metadata: {
     agents_used: string[];
     research_time: number;
@@ -54,6 +55,8 @@ export interface BackendSection {
 export class BriefService {
   private readonly API_BASE_URL = 'http://localhost:5000';
   private readonly GENERATE_BRIEF_ENDPOINT = `${this.API_BASE_URL}/generate-brief`;
+  private readonly BRIEFS_ENDPOINT = `${this.API_BASE_URL}/briefs`;
+  private readonly LAST_BRIEF_ID_KEY = 'lastBriefId';
   
   // Mock data - simula datos que vendrían del servidor
   private mockBriefSections: BriefSection[] = [
@@ -212,11 +215,35 @@ export class BriefService {
   // Obtener todas las secciones del brief desde el backend
   getBriefSections(): Observable<BriefSection[]> {
     return this.http.post<BackendResponse>(this.GENERATE_BRIEF_ENDPOINT , {}).pipe(
+      tap(response => this.rememberBriefId(response)),
       map(response => this.transformBackendResponse(response)),
       catchError(this.handleError.bind(this))
     );
   }
 
+  // Obtener un brief ya generado (el navegador revalida con ETag y recibe 304 si no cambió)
+  getBriefById(briefId: string): Observable<BriefSection[]> {
+    return this.http.get<BackendResponse>(`${this.BRIEFS_ENDPOINT}/${briefId}`).pipe(
+      map(response => this.transformBackendResponse(response)),
+      catchError(this.handleError.bind(this))
+    );
+  }
+
+  // Id del último brief generado, guardado para recargarlo sin volver a generarlo
+  getLastBriefId(): string | null {
+    return localStorage.getItem(this.LAST_BRIEF_ID_KEY);
+  }
+
+  forgetLastBriefId(): void {
+    localStorage.removeItem(this.LAST_BRIEF_ID_KEY);
+  }
+
+  private rememberBriefId(response: BackendResponse): void {
+    if (response.brief_id) {
+      localStorage.setItem(this.LAST_BRIEF_ID_KEY, response.brief_id);
+    }
+  }
+
   // Método de fallback para usar datos mock si el backend no está disponible
   getBriefSectionsMock(): Observable<BriefSection[]> {
     return of(this.mockBriefSections).pipe(
@@ -496,6 +523,7 @@ export class BriefService {
     };
 
     return this.http.post<BackendResponse>(this.GENERATE_BRIEF_ENDPOINT, requestBody).pipe(
+      tap(response => this.rememberBriefId(response)),
       map(response => this.transformBackendResponse(response)),
       catchError(this.handleError.bind(this))
     );